@@ -7,6 +7,31 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     DATABASE_URL: str = "sqlite:///./clothing_system.db"
 
+    # 대시보드 캐시 (TTL 0 이면 캐시 안 함, URL 미설정 시 프로세스 내 LRU, redis:// 설정 시 워커 간 공유)
+    DASHBOARD_CACHE_TTL: int = 30
+    DASHBOARD_CACHE_MAX_ENTRIES: int = 1024
+    DASHBOARD_CACHE_URL: str = ""
+
+    # 카테고리 트리 스냅샷 최대 유지 시간(초), 다른 워커의 카테고리 변경 반영 주기
+    CATEGORY_TREE_TTL: int = 60
+    # 메뉴 트리 스냅샷 최대 유지 시간(초)
+    MENU_TREE_TTL: int = 60
+    # 사용자 자동완성 인덱스 최대 유지 시간(초), 다른 워커의 사용자 변경 반영 주기
+    USER_LOOKUP_TTL: int = 300
+
+    # 인증 주체 캐시 최대 항목 수 (토큰별)
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    # 인증 주체 캐시 유지 시간(초), 다른 워커에서 변경된 토큰 버전 반영 주기 (0 이면 매 요청 확인)
+    PRINCIPAL_CACHE_TTL: int = 30
+
+    # 주문/체척권 번호 워커 ID (0~1023, 워커마다 다르게 설정), 음수면 호스트명 + 프로세스 ID 해시로 정함
+    NUMBER_WORKER_ID: int = -1
+
+    # 비밀번호 해시 (bcrypt 비용, 전용 프로세스 수 0 이면 CPU 수, 처리 중 외 대기 가능 작업 수)
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 0
+    PASSWORD_HASH_QUEUE_SIZE: int = 64
+
     class Config:
         env_file = ".env"
 
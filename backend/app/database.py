@@ -1,6 +1,8 @@
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+import time
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 # PostgreSQL 연결 문자열
 # 개발: 로컬 Docker PostgreSQL
@@ -42,6 +44,31 @@ class Base(DeclarativeBase):
     pass
 
 
+# 잠금 충돌 시 재시도 횟수 및 대기 시간(초)
+LOCK_RETRIES = 5
+LOCK_RETRY_BACKOFF = 0.05
+
+
+def is_lock_conflict(error: OperationalError) -> bool:
+    """
+    재시도 가능한 잠금 충돌 여부
+    - SQLite: 다른 쓰기 트랜잭션이 잠금을 잡고 있는 경우 (database is locked)
+    - PostgreSQL(READ COMMITTED)은 조건부 UPDATE 가 행 잠금을 기다린 뒤 조건을 재평가하므로 해당 없음
+    """
+    return "database is locked" in str(error.orig)
+
+
+def execute_with_retry(db: Session, stmt):
+    """단일 문 실행, 잠금 충돌 시 짧게 대기 후 제한 횟수만큼 재시도"""
+    for attempt in range(LOCK_RETRIES + 1):
+        try:
+            return db.execute(stmt)
+        except OperationalError as e:
+            if attempt == LOCK_RETRIES or not is_lock_conflict(e):
+                raise
+            time.sleep(LOCK_RETRY_BACKOFF * (attempt + 1))
+
+
 def get_db():
     db = SessionLocal()
     try:
@@ -51,6 +78,7 @@ def get_db():
 
 
 def init_db():
+    from app.services.text_search import ensure_search_indexes
     from app.models import (
         user,
         clothing,
@@ -58,6 +86,39 @@ def init_db():
         order,
         tailor,
         point,
-        menu
+        menu,
+        stats,
     )
     Base.metadata.create_all(bind=engine)
+    ensure_columns()
+    ensure_indexes()
+    ensure_search_indexes()
+
+
+def ensure_columns():
+    """
+    기존 테이블에 모델에 추가된 nullable 컬럼 추가
+    - create_all 은 이미 존재하는 테이블을 변경하지 않으므로 누락된 컬럼만 ALTER TABLE 로 추가
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+
+
+def ensure_indexes():
+    """
+    기존 테이블에 모델에 정의된 인덱스 추가
+    - create_all 은 이미 존재하는 테이블의 신규 인덱스를 만들지 않으므로 별도로 확인
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
@@ -16,6 +16,7 @@ from app.models.order import (
 from app.models.tailor import TailorCompany, TailorVoucher, VoucherStatus
 from app.models.point import PointGrant, PointTransaction, PointType, TransactionType
 from app.models.menu import Menu, MenuPermission
+from app.models.stats import DailySalesStat, DailyItemSalesStat
 
 __all__ = [
     "TimestampMixin",
@@ -53,4 +54,6 @@ __all__ = [
     "TransactionType",
     "Menu",
     "MenuPermission",
+    "DailySalesStat",
+    "DailyItemSalesStat",
 ]
@@ -37,15 +37,20 @@ class Menu(Base, TimestampMixin):
     )
     parent: Mapped["Menu | None"] = relationship("Menu", back_populates="children")
     
-    def get_allowed_roles_list(self) -> list[str]:
-        """권한 목록 반환"""
-        if not self.allowed_roles:
+    @staticmethod
+    def parse_allowed_roles(allowed_roles: str | None) -> list[str]:
+        """저장된 권한 JSON 을 목록으로 변환 (없거나 잘못된 값이면 빈 목록)"""
+        if not allowed_roles:
             return []
         import json
         try:
-            return json.loads(self.allowed_roles)
+            return json.loads(allowed_roles)
         except:
             return []
+
+    def get_allowed_roles_list(self) -> list[str]:
+        """권한 목록 반환"""
+        return self.parse_allowed_roles(self.allowed_roles)
     
     def set_allowed_roles_list(self, roles: list[str]):
         """권한 목록 저장"""
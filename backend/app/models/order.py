@@ -4,7 +4,7 @@
 """
 import enum
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text, Boolean, Numeric, Date
+from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text, Boolean, Numeric, Date, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from app.database import Base
 from app.models.base import TimestampMixin
@@ -82,7 +82,7 @@ class Order(Base, TimestampMixin):
     used_voucher_amount: Mapped[int] = mapped_column(Integer, default=0, nullable=False)     # 체척권 사용액
     
     # 주문 일시
-    ordered_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    ordered_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     
     # 취소 정보
     cancelled_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
@@ -99,6 +99,11 @@ class Order(Base, TimestampMixin):
     tailor_vouchers: Mapped[list["TailorVoucher"]] = relationship("TailorVoucher", back_populates="order")
 
 
+# 주문일 기간 조회용 인덱스 (판매소별 / 상태별)
+Index("ix_orders_sales_office_ordered_at", Order.sales_office_id, Order.ordered_at)
+Index("ix_orders_status_ordered_at", Order.status, Order.ordered_at)
+
+
 class OrderItem(Base, TimestampMixin):
     """
     주문 품목 테이블
@@ -4,7 +4,7 @@
 """
 import enum
 from datetime import date
-from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text, Date, UniqueConstraint
+from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text, Date, UniqueConstraint, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from app.database import Base
 from app.models.base import TimestampMixin
@@ -96,6 +96,7 @@ class PointTransaction(Base, TimestampMixin):
     point_grant_id: Mapped[int | None] = mapped_column(ForeignKey("point_grants.id"), nullable=True)
     
     description: Mapped[str | None] = mapped_column(Text, nullable=True)       # 거래 설명
+    reason: Mapped[str | None] = mapped_column(String(30), nullable=True)      # 지급 사유 코드 (annual, promotion, bonus 등)
 
     # 관계 매핑
     user: Mapped["User"] = relationship("User", foreign_keys=[user_id], back_populates="point_transactions")
@@ -105,6 +106,15 @@ class PointTransaction(Base, TimestampMixin):
     point_grant: Mapped["PointGrant | None"] = relationship("PointGrant")
 
 
+# 사용자별 거래 내역 커서 페이지네이션용 복합 인덱스 (user_id, created_at DESC, id DESC)
+Index(
+    "ix_point_transactions_user_created_id",
+    PointTransaction.user_id,
+    PointTransaction.created_at.desc(),
+    PointTransaction.id.desc(),
+)
+
+
 # 순환 참조 해결을 위한 지연 import
 from app.models.user import User
 from app.models.order import Order, OrderItem
@@ -0,0 +1,47 @@
+"""
+통계 모델 정의
+- 판매 통계 일별 집계(롤업) 테이블
+- 주문 상태 변경 시 증분 갱신, 전체 재집계는 backfill_sales_stats.py 사용
+"""
+from datetime import date
+from sqlalchemy import Integer, ForeignKey, Date, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+from app.models.base import TimestampMixin
+
+
+class DailySalesStat(Base, TimestampMixin):
+    """
+    판매소별 일별 판매 집계 테이블
+    - 주문 단위 합계 (매출, 판매건, 포인트 사용액, 취소 건수)
+    - 주문일(ordered_at, UTC) 기준으로 집계
+    """
+    __tablename__ = "daily_sales_stats"
+    __table_args__ = (UniqueConstraint("sales_office_id", "sale_date", name="uq_daily_sales_stat"),)
+
+    sales_office_id: Mapped[int] = mapped_column(ForeignKey("sales_offices.id"), nullable=False)
+    sale_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+
+    order_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)     # 판매건 (취소 제외)
+    total_amount: Mapped[int] = mapped_column(Integer, default=0, nullable=False)    # 매출 (취소 제외)
+    used_point: Mapped[int] = mapped_column(Integer, default=0, nullable=False)      # 포인트 사용액 (취소 제외)
+    refund_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)    # 취소 건수
+
+
+class DailyItemSalesStat(Base, TimestampMixin):
+    """
+    판매소/품목별 일별 판매 집계 테이블
+    - 품목 단위 합계 (판매 수량, 판매 금액), 취소 주문 제외
+    - 카테고리는 조회 시 품목(clothing_items)과 조인하여 현재 분류 기준으로 집계
+    """
+    __tablename__ = "daily_item_sales_stats"
+    __table_args__ = (
+        UniqueConstraint("sales_office_id", "sale_date", "item_id", name="uq_daily_item_sales_stat"),
+    )
+
+    sales_office_id: Mapped[int] = mapped_column(ForeignKey("sales_offices.id"), nullable=False)
+    sale_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    item_id: Mapped[int] = mapped_column(ForeignKey("clothing_items.id"), nullable=False)
+
+    quantity: Mapped[int] = mapped_column(Integer, default=0, nullable=False)        # 판매 수량
+    amount: Mapped[int] = mapped_column(Integer, default=0, nullable=False)          # 판매 금액
@@ -59,6 +59,21 @@ RANK_POINT_MAPPING = {
 }
 
 
+def calculate_service_years(enlistment_date: date | None) -> int:
+    """
+    입대일 기준 복무년수 계산
+    - User.service_years 및 ORM 객체 없이 계산하는 일괄 처리에서 공용으로 사용
+    """
+    if enlistment_date:
+        today = date.today()
+        years = today.year - enlistment_date.year
+        # 올해 입대일이 지나지 않았으면 1년 차감
+        if (today.month, today.day) < (enlistment_date.month, enlistment_date.day):
+            years -= 1
+        return max(0, years)
+    return 0
+
+
 class Rank(Base, TimestampMixin):
     """
     계급 마스터 테이블
@@ -109,6 +124,9 @@ class User(Base, TimestampMixin):
     sales_office_id: Mapped[int | None] = mapped_column(ForeignKey("sales_offices.id"), nullable=True)
     tailor_company_id: Mapped[int | None] = mapped_column(ForeignKey("tailor_companies.id"), nullable=True)
     
+    # 토큰 버전 (권한/소속/활성 여부 변경 시 증가, 이전 버전으로 발급된 토큰은 무효)
+    token_version: Mapped[int | None] = mapped_column(Integer, default=0)
+    
     # 포인트 정보
     current_point: Mapped[int] = mapped_column(Integer, default=0)       # 보유 포인트
     reserved_point: Mapped[int] = mapped_column(Integer, default=0)      # 예약 포인트 (주문 중)
@@ -120,14 +138,7 @@ class User(Base, TimestampMixin):
         - 입대일이 없으면 0 반환
         - 입대일로부터 경과한 전체 년수 계산
         """
-        if self.enlistment_date:
-            today = date.today()
-            years = today.year - self.enlistment_date.year
-            # 올해 입대일이 지나지 않았으면 1년 차감
-            if (today.month, today.day) < (self.enlistment_date.month, self.enlistment_date.day):
-                years -= 1
-            return max(0, years)
-        return 0
+        return calculate_service_years(self.enlistment_date)
 
     # 관계 매핑
     rank: Mapped["Rank | None"] = relationship("Rank", back_populates="users")
@@ -2,21 +2,48 @@ from datetime import timedelta
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.database import get_db
-from app.models.user import User
+from app.models.user import User, UserRole
 from app.schemas.user import Token, UserLogin, UserResponse
-from app.utils.auth import create_access_token, get_current_user, verify_password
+from app.utils.auth import create_access_token, get_current_user, token_claims, verify_password_offloaded
+from app.utils.password_hasher import HasherBusyError, get_hasher
 
 router = APIRouter()
 
 
+def _get_login_user(db: Session, username: str) -> User | None:
+    return db.query(User).filter(User.username == username).first()
+
+
+def _update_password_hash(db: Session, user: User, password_hash: str) -> None:
+    user.password_hash = password_hash
+    db.commit()
+
+
 @router.post("/login", response_model=Token)
-def login(user_login: UserLogin, db: Session = Depends(get_db)) -> Any:
-    user = db.query(User).filter(User.username == user_login.username).first()
-    if not user or not verify_password(user_login.password, user.password_hash):
+async def login(user_login: UserLogin, db: Session = Depends(get_db)) -> Any:
+    """
+    로그인
+    - DB 조회는 스레드풀, 비밀번호 검증(bcrypt)은 해시 전용 프로세스 풀에서 수행하고 결과를 await
+    - 해시 대기열이 가득 차면 503 (Retry-After)
+    - 저장된 해시의 비용이 BCRYPT_ROUNDS 와 다르면 새 비용으로 재해시하여 저장
+    """
+    user = await run_in_threadpool(_get_login_user, db, user_login.username)
+    verified, new_hash = False, None
+    if user:
+        try:
+            verified, new_hash = await verify_password_offloaded(user_login.password, user.password_hash)
+        except HasherBusyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(e),
+                headers={"Retry-After": "1"},
+            )
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="사용자명 또는 비밀번호가 올바르지 않습니다",
@@ -26,11 +53,12 @@ def login(user_login: UserLogin, db: Session = Depends(get_db)) -> Any:
             status_code=status.HTTP_403_FORBIDDEN,
             detail="비활성화된 계정입니다",
         )
+    # 재해시 커밋 후에는 user 속성이 만료되어 접근 시 이벤트 루프에서 재조회 → 커밋 전에 클레임 구성
+    claims = token_claims(user)
+    if new_hash:
+        await run_in_threadpool(_update_password_hash, db, user, new_hash)
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": str(user.id), "username": user.username, "role": user.role.value},
-        expires_delta=access_token_expires,
-    )
+    access_token = create_access_token(data=claims, expires_delta=access_token_expires)
     return {"access_token": access_token, "token_type": "bearer"}
 
 
@@ -39,6 +67,17 @@ def logout() -> dict:
     return {"message": "로그아웃 되었습니다"}
 
 
+@router.get("/hasher-metrics")
+def get_hasher_metrics(current_user=Depends(get_current_user)) -> dict:
+    """비밀번호 해시 실행기 지표 (관리자용)"""
+    if current_user.role != UserRole.ADMIN.value:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다",
+        )
+    return get_hasher().metrics()
+
+
 @router.get("/me", response_model=UserResponse)
 def get_me(current_user=Depends(get_current_user), db: Session = Depends(get_db)) -> Any:
     user = db.query(User).filter(User.id == current_user.user_id).first()
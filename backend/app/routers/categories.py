@@ -10,8 +10,10 @@ from app.models.clothing import CategoryLevel, ClothingType
 from app.schemas.clothing import (
     CategoryCreate, CategoryUpdate, CategoryResponse, CategoryTreeResponse,
 )
+from app.services import export_service
 from app.services.clothing_service import CategoryService
 from app.utils.auth import get_current_user, TokenData
+from app.utils.csv_stream import csv_response
 
 router = APIRouter()
 
@@ -59,6 +61,14 @@ def create_category(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.get("/export")
+def export_categories(
+    current_user: TokenData = Depends(check_admin),
+):
+    """카테고리 CSV 내보내기 (업로드 양식과 같은 열, 스트리밍)"""
+    return csv_response("cloth_category.csv", export_service.CATEGORY_HEADER, export_service.category_rows())
+
+
 @router.get("/{category_id}", response_model=CategoryResponse)
 def get_category(
     category_id: int,
@@ -101,24 +111,20 @@ def delete_category(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/export")
-def export_categories(
-    db: Session = Depends(get_db),
-    current_user: TokenData = Depends(check_admin),
-):
-    service = CategoryService(db)
-    return service.export_to_excel()
-
-
 @router.post("/import")
 def import_categories(
     file: UploadFile = File(...),
+    dry_run: bool = Query(False, description="저장하지 않고 생성될 카테고리만 확인"),
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(check_admin),
 ):
     service = CategoryService(db)
     try:
-        result = service.import_from_excel(file.file)
-        return {"message": f"{result['created']}개 카테고리가 생성되었습니다", "details": result}
+        result = service.import_from_excel(file.file, dry_run=dry_run, filename=file.filename or "")
+        if dry_run:
+            message = f"{result['created']}개 카테고리가 생성될 예정입니다 (기존 {result['skipped']}개)"
+        else:
+            message = f"{result['created']}개 카테고리가 생성되었습니다 (기존 {result['skipped']}개)"
+        return {"message": message, "details": result}
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -10,8 +10,10 @@ from app.schemas.clothing import (
     ClothingDetailResponse, ClothingListResponse,
     SpecCreate, SpecUpdate, SpecResponse,
 )
+from app.services import export_service
 from app.services.clothing_service import ClothingService
 from app.utils.auth import get_current_user, TokenData
+from app.utils.csv_stream import csv_response
 
 router = APIRouter()
 
@@ -61,6 +63,20 @@ def create_clothing(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.get("/export")
+def export_clothings(
+    include_specs: bool = Query(True, description="규격별 행으로 내보내기"),
+    include_inventory: bool = Query(False, description="규격 x 판매소별 재고 포함"),
+    current_user: TokenData = Depends(check_admin),
+):
+    """품목 카탈로그 CSV 내보내기 (스트리밍)"""
+    return csv_response(
+        "clothing_catalog.csv",
+        export_service.catalog_header(include_specs, include_inventory),
+        export_service.catalog_rows(include_specs, include_inventory),
+    )
+
+
 @router.get("/{clothing_id}", response_model=ClothingDetailResponse)
 def get_clothing(
     clothing_id: int,
@@ -11,7 +11,8 @@ from pydantic import BaseModel
 from app.database import get_db
 from app.models.user import UserRole
 from app.models.order import DeliveryLocation
-from app.utils.auth import get_current_user, TokenData
+from app.schemas.user import Principal
+from app.utils.auth import get_current_user
 
 router = APIRouter()
 
@@ -32,7 +33,7 @@ class DeliveryLocationUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
-def check_sales_office_or_admin(current_user: TokenData = Depends(get_current_user)):
+def check_sales_office_or_admin(current_user: Principal = Depends(get_current_user)):
     """판매소 또는 관리자 권한 확인"""
     allowed_roles = [UserRole.ADMIN.value, UserRole.SALES_OFFICE.value]
     if current_user.role not in allowed_roles:
@@ -47,7 +48,7 @@ def check_sales_office_or_admin(current_user: TokenData = Depends(get_current_us
 def get_delivery_locations(
     sales_office_id: Optional[int] = None,
     db: Session = Depends(get_db),
-    current_user: TokenData = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> Any:
     """
     배송지 목록 조회
@@ -59,10 +60,8 @@ def get_delivery_locations(
     
     # 판매소 담당자는 자신의 판매소만 조회
     if current_user.role == UserRole.SALES_OFFICE.value:
-        from app.services.user_service import UserService
-        user = UserService(db).get_by_id(current_user.user_id)
-        if user and user.sales_office_id:
-            query = query.filter(DeliveryLocation.sales_office_id == user.sales_office_id)
+        if current_user.sales_office_id:
+            query = query.filter(DeliveryLocation.sales_office_id == current_user.sales_office_id)
         else:
             return []
     elif sales_office_id:
@@ -87,14 +86,12 @@ def get_delivery_locations(
 def create_delivery_location(
     data: DeliveryLocationCreate,
     db: Session = Depends(get_db),
-    current_user: TokenData = Depends(check_sales_office_or_admin),
+    current_user: Principal = Depends(check_sales_office_or_admin),
 ) -> Any:
     """배송지 등록"""
     # 판매소 담당자는 자신의 판매소에만 등록 가능
     if current_user.role == UserRole.SALES_OFFICE.value:
-        from app.services.user_service import UserService
-        user = UserService(db).get_by_id(current_user.user_id)
-        if not user or user.sales_office_id != data.sales_office_id:
+        if current_user.sales_office_id is None or current_user.sales_office_id != data.sales_office_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="자신의 판매소에만 배송지를 등록할 수 있습니다"
@@ -127,7 +124,7 @@ def update_delivery_location(
     location_id: int,
     data: DeliveryLocationUpdate,
     db: Session = Depends(get_db),
-    current_user: TokenData = Depends(check_sales_office_or_admin),
+    current_user: Principal = Depends(check_sales_office_or_admin),
 ) -> Any:
     """배송지 수정"""
     location = db.query(DeliveryLocation).filter(DeliveryLocation.id == location_id).first()
@@ -136,9 +133,7 @@ def update_delivery_location(
     
     # 판매소 담당자는 자신의 판매소 배송지만 수정 가능
     if current_user.role == UserRole.SALES_OFFICE.value:
-        from app.services.user_service import UserService
-        user = UserService(db).get_by_id(current_user.user_id)
-        if not user or user.sales_office_id != location.sales_office_id:
+        if current_user.sales_office_id is None or current_user.sales_office_id != location.sales_office_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="자신의 판매소 배송지만 수정할 수 있습니다"
@@ -165,7 +160,7 @@ def update_delivery_location(
 def delete_delivery_location(
     location_id: int,
     db: Session = Depends(get_db),
-    current_user: TokenData = Depends(check_sales_office_or_admin),
+    current_user: Principal = Depends(check_sales_office_or_admin),
 ) -> None:
     """배송지 삭제 (Soft Delete)"""
     location = db.query(DeliveryLocation).filter(DeliveryLocation.id == location_id).first()
@@ -174,9 +169,7 @@ def delete_delivery_location(
     
     # 판매소 담당자는 자신의 판매소 배송지만 삭제 가능
     if current_user.role == UserRole.SALES_OFFICE.value:
-        from app.services.user_service import UserService
-        user = UserService(db).get_by_id(current_user.user_id)
-        if not user or user.sales_office_id != location.sales_office_id:
+        if current_user.sales_office_id is None or current_user.sales_office_id != location.sales_office_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="자신의 판매소 배송지만 삭제할 수 있습니다"
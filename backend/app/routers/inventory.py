@@ -9,16 +9,16 @@ from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.user import UserRole
-from app.models.clothing import ClothingItem, ClothingSpec, Category
-from app.models.sales import Inventory, SalesOffice
+from app.models.sales import SalesOffice
 from app.schemas.sales import InventoryAdjust, InventoryReceive, InventoryResponse, InventoryHistoryResponse
 from app.services import inventory_service
-from app.utils.auth import get_current_user, TokenData
+from app.schemas.user import Principal
+from app.utils.auth import get_current_user
 
 router = APIRouter()
 
 
-def get_sales_office_filter(current_user: TokenData, db: Session, sales_office_id: Optional[int] = None) -> Optional[int]:
+def get_sales_office_filter(current_user: Principal, sales_office_id: Optional[int] = None) -> Optional[int]:
     """
     판매소 필터 결정
     - 관리자: 요청 파라미터의 sales_office_id 사용
@@ -29,10 +29,8 @@ def get_sales_office_filter(current_user: TokenData, db: Session, sales_office_i
         return sales_office_id
     elif current_user.role == UserRole.SALES_OFFICE.value:
         # 판매소 담당자는 자신의 판매소만 조회 가능
-        from app.services.user_service import UserService
-        user = UserService(db).get_by_id(current_user.user_id)
-        if user and user.sales_office_id:
-            return user.sales_office_id
+        if current_user.sales_office_id:
+            return current_user.sales_office_id
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="판매소 정보가 없습니다"
@@ -47,15 +45,17 @@ def get_sales_office_filter(current_user: TokenData, db: Session, sales_office_i
 @router.get("/summary")
 def get_inventory_summary(
     sales_office_id: Optional[int] = None,
+    by_office: bool = False,
     db: Session = Depends(get_db),
-    current_user: TokenData = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> Any:
     """
     재고 요약 정보 조회
     - 전체 품목 수, 재고 부족 품목, 품절 품목
+    - by_office=true: 판매소별 요약(offices) 포함 (같은 집계 쿼리)
     """
-    office_id = get_sales_office_filter(current_user, db, sales_office_id)
-    summary = inventory_service.get_inventory_summary(db, sales_office_id=office_id)
+    office_id = get_sales_office_filter(current_user, sales_office_id)
+    summary = inventory_service.get_inventory_summary(db, sales_office_id=office_id, by_office=by_office)
     return summary
 
 
@@ -67,66 +67,54 @@ def get_inventory(
     page: int = 1,
     page_size: int = 20,
     db: Session = Depends(get_db),
-    current_user: TokenData = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> Any:
     """
     재고 목록 조회
     - 판매소별, 품목별 필터링
     - 품목명, 카테고리 정보 포함
     """
-    office_id = get_sales_office_filter(current_user, db, sales_office_id)
+    office_id = get_sales_office_filter(current_user, sales_office_id)
     
-    # 기본 쿼리
-    query = db.query(Inventory)
-    if office_id:
-        query = query.filter(Inventory.sales_office_id == office_id)
-    if item_id:
-        query = query.filter(Inventory.item_id == item_id)
-    
-    # 품목명 검색
-    if keyword:
-        query = query.join(ClothingItem).filter(
-            ClothingItem.name.contains(keyword)
-        )
-    
-    total = query.count()
-    inventory_list = query.offset((page - 1) * page_size).limit(page_size).all()
+    # 재고 + 판매소/품목/카테고리/규격 조인 조회 (행 수와 무관하게 2회)
+    rows, total = inventory_service.get_inventory_rows(
+        db,
+        sales_office_id=office_id,
+        item_id=item_id,
+        keyword=keyword,
+        skip=(page - 1) * page_size,
+        limit=page_size,
+    )
     
-    # 응답 데이터 구성 (품목 정보 포함)
     items = []
-    for inv in inventory_list:
-        item = db.query(ClothingItem).filter(ClothingItem.id == inv.item_id).first()
-        spec = db.query(ClothingSpec).filter(ClothingSpec.id == inv.spec_id).first() if inv.spec_id else None
-        category = db.query(Category).filter(Category.id == item.category_id).first() if item else None
-        sales_office = db.query(SalesOffice).filter(SalesOffice.id == inv.sales_office_id).first()
-        
+    for r in rows:
         items.append({
-            "id": inv.id,
-            "sales_office_id": inv.sales_office_id,
+            "id": r.id,
+            "sales_office_id": r.sales_office_id,
             "sales_office": {
-                "id": sales_office.id if sales_office else None,
-                "name": sales_office.name if sales_office else None,
-            } if sales_office else None,
-            "item_id": inv.item_id,
-            "spec_id": inv.spec_id,
-            "quantity": inv.quantity,
-            "reserved_quantity": inv.reserved_quantity,
-            "available_quantity": inv.available_quantity,
+                "id": r.office_id,
+                "name": r.office_name,
+            } if r.office_id else None,
+            "item_id": r.item_id,
+            "spec_id": r.spec_id,
+            "quantity": r.quantity,
+            "reserved_quantity": r.reserved_quantity,
+            "available_quantity": r.available_quantity,
             "product": {
-                "id": item.id if item else None,
-                "name": item.name if item else None,
+                "id": r.product_id,
+                "name": r.item_name,
                 "category": {
-                    "id": category.id if category else None,
-                    "name": category.name if category else None,
-                } if category else None,
-            } if item else None,
+                    "id": r.category_id,
+                    "name": r.category_name,
+                } if r.category_id else None,
+            } if r.product_id else None,
             "spec": {
-                "id": spec.id if spec else None,
-                "size": spec.size if spec else None,
-                "price": spec.price if spec else None,
-            } if spec else None,
+                "id": r.spec_row_id,
+                "size": r.spec_size,
+                "price": r.spec_price,
+            } if r.spec_row_id else None,
             "minStock": 10,
-            "lastUpdated": inv.updated_at.isoformat() if inv.updated_at else None,
+            "lastUpdated": r.updated_at.isoformat() if r.updated_at else None,
         })
     
     return {
@@ -141,14 +129,14 @@ def get_inventory(
 def receive_inventory(
     receive_data: InventoryReceive,
     db: Session = Depends(get_db),
-    current_user: TokenData = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> Any:
     """
     재고 입고 처리
     - 판매소 담당자만 자신의 판매소에 입고 가능
     """
     # 권한 확인
-    get_sales_office_filter(current_user, db, receive_data.sales_office_id)
+    get_sales_office_filter(current_user, receive_data.sales_office_id)
     
     inventory = inventory_service.receive_inventory(db, staff_id=current_user.user_id, receive_data=receive_data)
     return {
@@ -166,14 +154,14 @@ def receive_inventory(
 def adjust_inventory(
     adjust_data: InventoryAdjust,
     db: Session = Depends(get_db),
-    current_user: TokenData = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> Any:
     """
     재고 조정 처리
     - 입고, 출고, 재고조사 등
     """
     # 권한 확인
-    get_sales_office_filter(current_user, db, adjust_data.sales_office_id)
+    get_sales_office_filter(current_user, adjust_data.sales_office_id)
     
     inventory = inventory_service.adjust_inventory(db, staff_id=current_user.user_id, adjust_data=adjust_data)
     if not inventory:
@@ -195,14 +183,14 @@ def get_inventory_history(
     page: int = 1,
     page_size: int = 20,
     db: Session = Depends(get_db),
-    current_user: TokenData = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> Any:
     """
     재고 이력 조회
     - 판매소별 이력만 조회 가능
     """
     # 판매소 필터 확인
-    office_id = get_sales_office_filter(current_user, db, None)
+    office_id = get_sales_office_filter(current_user, None)
     
     skip = (page - 1) * page_size
     history, total = inventory_service.get_inventory_history(
@@ -240,7 +228,7 @@ def get_available_inventory(
     page: int = 1,
     page_size: int = 20,
     db: Session = Depends(get_db),
-    current_user: TokenData = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> Any:
     """
     판매 가능한 재고 목록 조회 (일반 사용자용)
@@ -251,42 +239,35 @@ def get_available_inventory(
     if not sales_office:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="판매소를 찾을 수 없습니다")
     
-    query = db.query(Inventory).filter(
-        Inventory.sales_office_id == sales_office_id,
-        Inventory.quantity > 0
+    rows, total = inventory_service.get_inventory_rows(
+        db,
+        sales_office_id=sales_office_id,
+        keyword=keyword,
+        in_stock_only=True,
+        skip=(page - 1) * page_size,
+        limit=page_size,
     )
     
-    if keyword:
-        query = query.join(ClothingItem).filter(
-            ClothingItem.name.contains(keyword)
-        )
-    
-    total = query.count()
-    inventory_list = query.offset((page - 1) * page_size).limit(page_size).all()
-    
     items = []
-    for inv in inventory_list:
-        item = db.query(ClothingItem).filter(ClothingItem.id == inv.item_id).first()
-        if not item or not item.is_active:
+    for r in rows:
+        if not r.product_id or not r.item_is_active:
             continue
-        spec = db.query(ClothingSpec).filter(ClothingSpec.id == inv.spec_id).first() if inv.spec_id else None
-        category = db.query(Category).filter(Category.id == item.category_id).first() if item else None
         
         items.append({
-            "inventory_id": inv.id,
-            "item_id": inv.item_id,
-            "spec_id": inv.spec_id,
-            "item_name": item.name,
-            "category_id": category.id if category else None,
-            "category_name": category.name if category else None,
-            "clothing_type": item.clothing_type.value,
-            "description": item.description,
-            "image_url": item.image_url,
-            "thumbnail_url": item.thumbnail_url,
-            "spec_size": spec.size if spec else None,
-            "spec_price": spec.price if spec else None,
-            "available_quantity": inv.available_quantity,
-            "reserved_quantity": inv.reserved_quantity,
+            "inventory_id": r.id,
+            "item_id": r.item_id,
+            "spec_id": r.spec_id,
+            "item_name": r.item_name,
+            "category_id": r.category_id,
+            "category_name": r.category_name,
+            "clothing_type": r.clothing_type.value,
+            "description": r.description,
+            "image_url": r.image_url,
+            "thumbnail_url": r.thumbnail_url,
+            "spec_size": r.spec_size,
+            "spec_price": r.spec_price,
+            "available_quantity": r.available_quantity,
+            "reserved_quantity": r.reserved_quantity,
         })
     
     return {
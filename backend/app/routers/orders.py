@@ -4,9 +4,9 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session, joinedload
 
 from app.database import get_db
-from app.schemas.order import OrderCreate, OrderResponse, OrderCancel, DeliveryUpdate, OrderListResponse
+from app.schemas.order import OrderBatchCreate, OrderCreate, OrderResponse, OrderCancel, DeliveryUpdate, OrderListResponse
 from app.services import order_service
-from app.utils.auth import get_current_user
+from app.utils.auth import get_current_user, get_sales_office_scope
 
 router = APIRouter()
 
@@ -88,10 +88,42 @@ def create_order(
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> Any:
-    order = order_service.create_order(db, user_id=current_user.user_id, order_data=order_data)
+    try:
+        order = order_service.create_order(db, user_id=current_user.user_id, order_data=order_data)
+    except order_service.InsufficientStockError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"message": str(e), "shortages": e.shortages},
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     return _build_order_response(order)
 
 
+@router.post("/batch")
+def create_orders(
+    batch_data: OrderBatchCreate,
+    chunk_size: int = order_service.BATCH_CHUNK_SIZE,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+    sales_office_id: Optional[int] = Depends(get_sales_office_scope),
+) -> Any:
+    """
+    일괄 주문 (관리자, 판매소 담당자)
+    - 주문자별 주문 N건을 한 번에 검증/저장, 요청 순서대로 주문별 결과 반환
+    - chunk_size 단위로 커밋하며 실패한 주문은 사유와 함께 보고 (나머지 주문은 처리)
+    - 판매소 담당자는 자신의 판매소 주문만 등록 가능
+    """
+    if chunk_size < 1:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="chunk_size 는 1 이상이어야 합니다")
+    if sales_office_id and any(order.sales_office_id != sales_office_id for order in batch_data.orders):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="자신의 판매소 주문만 등록할 수 있습니다")
+
+    results = order_service.create_orders(db, batch_data.orders, staff_id=current_user.user_id, chunk_size=chunk_size)
+    created = sum(1 for result in results if result["success"])
+    return {"created": created, "failed": len(results) - created, "results": results}
+
+
 @router.get("/{order_id}", response_model=OrderResponse)
 def get_order(
     order_id: int,
@@ -8,7 +8,7 @@ from app.models.user import UserRole
 from app.models.point import PointType, TransactionType
 from app.schemas.point import (
     PointGrantCreate, PointGrantYearlyCreate, PointGrantResponse,
-    PointTransactionResponse, PointHistoryResponse, MyPointResponse,
+    PointTransactionResponse, PointHistoryResponse, PointHistoryCursorResponse, MyPointResponse,
     PointBulkGrantRequest, PointSingleGrantRequest,
 )
 from app.services.point_service import PointService
@@ -60,6 +60,32 @@ def get_point_history(
     )
 
 
+@router.get("/history/cursor", response_model=PointHistoryCursorResponse)
+def get_point_history_cursor(
+    cursor: Optional[str] = None,
+    page_size: int = Query(20, ge=1, le=100),
+    transaction_type: Optional[TransactionType] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    include_total: bool = False,
+    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user),
+):
+    service = PointService(db)
+    try:
+        return service.get_history_cursor(
+            user_id=current_user.user_id,
+            cursor=cursor,
+            page_size=page_size,
+            transaction_type=transaction_type,
+            start_date=start_date,
+            end_date=end_date,
+            include_total=include_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.post("/grant", response_model=PointGrantResponse, status_code=status.HTTP_201_CREATED)
 def grant_point(
     data: PointGrantCreate,
@@ -96,8 +122,8 @@ def grant_bulk_point(
 ):
     service = PointService(db)
     try:
-        granted, errors = service.grant_bulk(data, current_user.user_id)
-        return {"granted": granted, "errors": errors}
+        granted, errors, rows_per_second = service.grant_bulk(data, current_user.user_id)
+        return {"granted": granted, "errors": errors, "rows_per_second": round(rows_per_second, 1)}
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -164,3 +190,30 @@ def get_user_point_history(
         start_date=start_date,
         end_date=end_date,
     )
+
+
+@router.get("/user/{user_id}/history/cursor", response_model=PointHistoryCursorResponse)
+def get_user_point_history_cursor(
+    user_id: int,
+    cursor: Optional[str] = None,
+    page_size: int = Query(20, ge=1, le=100),
+    transaction_type: Optional[TransactionType] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    include_total: bool = False,
+    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(check_admin_or_sales),
+):
+    service = PointService(db)
+    try:
+        return service.get_history_cursor(
+            user_id=user_id,
+            cursor=cursor,
+            page_size=page_size,
+            transaction_type=transaction_type,
+            start_date=start_date,
+            end_date=end_date,
+            include_total=include_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -2,7 +2,7 @@
 판매소 주문 관리 라우터
 - 판매소별 주문 목록, 상세, 상태 변경
 """
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session, joinedload
@@ -10,25 +10,15 @@ from sqlalchemy.orm import Session, joinedload
 from app.database import get_db
 from app.models.user import UserRole, User
 from app.models.order import Order, OrderItem, OrderStatus, OrderType, Delivery, DeliveryStatus
-from app.schemas.sales import OfflineSaleCreate, RefundCreate, SalesHistoryResponse
-from app.services import sales_service
-from app.utils.auth import get_current_user, TokenData
+from app.models.point import TransactionType
+from app.schemas.sales import OfflineSaleCreate, RefundBatchCreate, RefundCreate, SalesHistoryResponse
+from app.services import dashboard_cache, point_ledger, sales_service, sales_stats_service, text_search
+from app.utils.auth import get_current_user, get_sales_office_scope
+from app.utils.business_number import prefix_filters
 
 router = APIRouter()
 
 
-def _get_sales_office_id(current_user: TokenData, db: Session) -> int:
-    """판매소 담당자의 sales_office_id 반환"""
-    if current_user.role == UserRole.ADMIN.value:
-        return None
-    elif current_user.role == UserRole.SALES_OFFICE.value:
-        user = db.query(User).filter(User.id == current_user.user_id).first()
-        if user and user.sales_office_id:
-            return user.sales_office_id
-        raise HTTPException(status_code=403, detail="판매소 정보가 없습니다")
-    raise HTTPException(status_code=403, detail="접근 권한이 없습니다")
-
-
 def _build_sales_order_response(order: Order) -> dict:
     """판매소용 주문 응답 데이터 구성"""
     user_data = None
@@ -98,15 +88,13 @@ def get_sales_orders(
     page: int = 1,
     page_size: int = 20,
     db: Session = Depends(get_db),
-    current_user: TokenData = Depends(get_current_user),
+    sales_office_id: Optional[int] = Depends(get_sales_office_scope),
 ) -> Any:
     """
     판매소 주문 목록 조회
     - 판매소 담당자: 자신의 판매소 주문만 조회
     - 관리자: 모든 주문 조회 (sales_office_id 파라미터 필요)
     """
-    sales_office_id = _get_sales_office_id(current_user, db)
-    
     query = db.query(Order).options(
         joinedload(Order.user).joinedload(User.rank),
         joinedload(Order.items).joinedload(OrderItem.item),
@@ -124,7 +112,11 @@ def get_sales_orders(
         query = query.filter(Order.order_type == order_type)
     
     if keyword:
-        query = query.filter(Order.order_number.contains(keyword))
+        # 주문번호 접두어(ORD-날짜-...)는 인덱스 범위 검색, 그 외는 트라이그램 부분 일치 검색
+        if keyword.upper().startswith("ORD-"):
+            query = query.filter(*prefix_filters(Order.order_number, keyword))
+        else:
+            query = query.filter(text_search.match_condition(db, Order, keyword))
     
     total = query.count()
     orders = query.order_by(Order.id.desc()).offset((page - 1) * page_size).limit(page_size).all()
@@ -141,11 +133,9 @@ def get_sales_orders(
 def get_sales_order(
     order_id: int,
     db: Session = Depends(get_db),
-    current_user: TokenData = Depends(get_current_user),
+    sales_office_id: Optional[int] = Depends(get_sales_office_scope),
 ) -> Any:
     """판매소 주문 상세 조회"""
-    sales_office_id = _get_sales_office_id(current_user, db)
-    
     query = db.query(Order).options(
         joinedload(Order.user).joinedload(User.rank),
         joinedload(Order.items).joinedload(OrderItem.item),
@@ -168,7 +158,7 @@ def update_order_status(
     order_id: int,
     status_data: dict,
     db: Session = Depends(get_db),
-    current_user: TokenData = Depends(get_current_user),
+    sales_office_id: Optional[int] = Depends(get_sales_office_scope),
 ) -> Any:
     """
     주문 상태 변경
@@ -176,8 +166,6 @@ def update_order_status(
     - processing -> shipped: 배송 시작
     - shipped -> delivered: 배송 완료
     """
-    sales_office_id = _get_sales_office_id(current_user, db)
-    
     query = db.query(Order).filter(Order.id == order_id)
     if sales_office_id:
         query = query.filter(Order.sales_office_id == sales_office_id)
@@ -189,32 +177,39 @@ def update_order_status(
     new_status = status_data.get("status")
     tracking_number = status_data.get("tracking_number")
     
-    if new_status:
-        try:
-            order.status = OrderStatus(new_status)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="잘못된 상태값입니다")
+    # 상태/포인트 변경 전후 기여분으로 판매 통계 롤업 갱신
+    with sales_stats_service.track_order(db, order):
+        if new_status:
+            try:
+                order.status = OrderStatus(new_status)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="잘못된 상태값입니다")
     
-    if tracking_number and order.delivery:
-        order.delivery.tracking_number = tracking_number
-        if new_status == "shipped":
-            from datetime import datetime
-            order.delivery.shipped_at = datetime.utcnow()
-            order.delivery.status = DeliveryStatus.IN_TRANSIT
+        if tracking_number and order.delivery:
+            order.delivery.tracking_number = tracking_number
+            if new_status == "shipped":
+                from datetime import datetime
+                order.delivery.shipped_at = datetime.utcnow()
+                order.delivery.status = DeliveryStatus.IN_TRANSIT
     
-    if new_status == "delivered":
-        from datetime import datetime
-        if order.delivery:
-            order.delivery.delivered_at = datetime.utcnow()
-            order.delivery.status = DeliveryStatus.DELIVERED
-        if order.reserved_point > 0:
-            order.user.current_point -= order.reserved_point
-            order.user.reserved_point -= order.reserved_point
-            order.used_point = order.reserved_point
-            order.reserved_point = 0
+        if new_status == "delivered":
+            from datetime import datetime
+            if order.delivery:
+                order.delivery.delivered_at = datetime.utcnow()
+                order.delivery.status = DeliveryStatus.DELIVERED
+            if order.reserved_point > 0:
+                point_ledger.deduct_reserved(
+                    db, order.user_id, order.reserved_point,
+                    transaction_type=TransactionType.USE,
+                    order_id=order.id,
+                    description="배송 완료 포인트 확정 차감",
+                )
+                order.used_point = order.reserved_point
+                order.reserved_point = 0
     
     db.commit()
     db.refresh(order)
+    dashboard_cache.invalidate_order(order)
     return _build_sales_order_response(order)
 
 
@@ -225,18 +220,39 @@ def create_offline_sale(
     current_user=Depends(get_current_user),
 ) -> Any:
     """오프라인 판매 등록"""
-    order = sales_service.create_offline_sale(db, staff_id=current_user.user_id, sale_data=sale_data)
+    try:
+        order = sales_service.create_offline_sale(db, staff_id=current_user.user_id, sale_data=sale_data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return {"message": "오프라인 판매가 완료되었습니다", "order_id": order.id}
 
 
 @router.post("/refund")
 def process_refund(
-    refund_data: RefundCreate,
+    refund_data: Union[RefundCreate, RefundBatchCreate],
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
+    sales_office_id: Optional[int] = Depends(get_sales_office_scope),
 ) -> Any:
-    """반품 처리"""
-    order = sales_service.process_refund(db, staff_id=current_user.user_id, refund_data=refund_data)
+    """
+    반품 처리 (관리자, 판매소 담당자)
+    - 주문 1건: {order_id, items}, 반품 불가 시 400
+    - 여러 주문: {orders: [{order_id, items}, ...]}, 주문별 결과 목록 반환 (반품 가능한 주문만 처리)
+    - 판매소 담당자는 자신의 판매소 주문만 반품 가능 (다른 판매소 주문은 찾을 수 없음으로 처리)
+    """
+    if isinstance(refund_data, RefundBatchCreate):
+        try:
+            results = sales_service.process_refunds(
+                db, staff_id=current_user.user_id, refunds=refund_data.orders, sales_office_id=sales_office_id,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        refunded = sum(1 for result in results if result["success"])
+        return {"refunded": refunded, "failed": len(results) - refunded, "results": results}
+
+    order = sales_service.process_refund(
+        db, staff_id=current_user.user_id, refund_data=refund_data, sales_office_id=sales_office_id,
+    )
     if not order:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="반품 처리가 불가능합니다")
     return {"message": "반품이 처리되었습니다", "order_id": order.id}
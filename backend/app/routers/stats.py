@@ -1,17 +1,19 @@
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from typing import Any, Optional
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import func, and_
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.models.order import Order, OrderStatus, OrderType, OrderItem, Delivery, DeliveryStatus
+from app.models.order import Order, OrderStatus, OrderType, Delivery, DeliveryStatus
 from app.models.user import User, UserRole
 from app.models.clothing import ClothingItem
 from app.models.sales import Inventory, SalesOffice
 from app.models.tailor import TailorCompany, TailorVoucher, VoucherStatus
-from app.utils.auth import get_current_user, TokenData
+from app.services import dashboard_cache, sales_stats_service
+from app.schemas.user import Principal
+from app.utils.auth import get_current_user
+from app.utils.date_range import date_range_filters
 
 router = APIRouter()
 
@@ -19,20 +21,24 @@ router = APIRouter()
 @router.get("/dashboard")
 def get_dashboard_stats(
     db: Session = Depends(get_db),
-    current_user: TokenData = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> Any:
-    """역할별 대시보드 통계"""
+    """역할별 대시보드 통계 (역할/판매소/사용자별 캐시)"""
     role = current_user.role
     user_id = current_user.user_id
     
     if role == UserRole.ADMIN.value:
-        return get_admin_dashboard(db)
+        return dashboard_cache.get_or_set(dashboard_cache.admin_key(), lambda: get_admin_dashboard(db))
     elif role == UserRole.SALES_OFFICE.value:
-        return get_sales_office_dashboard(db, user_id)
+        sales_office_id = current_user.sales_office_id
+        return dashboard_cache.get_or_set(
+            dashboard_cache.sales_office_key(sales_office_id),
+            lambda: get_sales_office_dashboard(db, sales_office_id),
+        )
     elif role == UserRole.TAILOR_COMPANY.value:
-        return get_tailor_dashboard(db, user_id)
+        return dashboard_cache.get_or_set(dashboard_cache.tailor_key(), lambda: get_tailor_dashboard(db, user_id))
     else:
-        return get_user_dashboard(db, user_id)
+        return dashboard_cache.get_or_set(dashboard_cache.user_key(user_id), lambda: get_user_dashboard(db, user_id))
 
 
 def get_admin_dashboard(db: Session) -> dict:
@@ -50,18 +56,14 @@ def get_admin_dashboard(db: Session) -> dict:
     }
 
 
-def get_sales_office_dashboard(db: Session, user_id: int) -> dict:
+def get_sales_office_dashboard(db: Session, sales_office_id: Optional[int]) -> dict:
     """판매소 대시보드"""
-    user = db.query(User).filter(User.id == user_id).first()
-    sales_office_id = user.sales_office_id if user else None
-    
     today = date.today()
-    today_start = datetime.combine(today, datetime.min.time())
     
     # 금일 판매
     today_sales = db.query(Order).filter(
         Order.sales_office_id == sales_office_id,
-        Order.ordered_at >= today_start,
+        *date_range_filters(Order.ordered_at, today, today),
         Order.status != OrderStatus.CANCELLED,
     ).count() if sales_office_id else 0
     
@@ -142,14 +144,13 @@ def get_sales_stats(
     startDate: Optional[date] = None,
     endDate: Optional[date] = None,
     db: Session = Depends(get_db),
-    current_user: TokenData = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> Any:
-    """판매 통계 종합"""
+    """판매 통계 종합 (일별 집계 롤업 조회)"""
     # 판매소 담당자의 경우 자신의 판매소만 조회
     sales_office_id = None
     if current_user.role == UserRole.SALES_OFFICE.value:
-        user = db.query(User).filter(User.id == current_user.user_id).first()
-        sales_office_id = user.sales_office_id if user else None
+        sales_office_id = current_user.sales_office_id
     
     # 기본 날짜 범위 (최근 30일)
     if not startDate:
@@ -157,133 +158,4 @@ def get_sales_stats(
     if not endDate:
         endDate = date.today()
     
-    # 기본 쿼리 필터
-    base_query = db.query(Order).filter(
-        Order.status != OrderStatus.CANCELLED,
-        func.date(Order.ordered_at) >= startDate,
-        func.date(Order.ordered_at) <= endDate,
-    )
-    
-    if sales_office_id:
-        base_query = base_query.filter(Order.sales_office_id == sales_office_id)
-    
-    # 총 매출 및 판매건
-    total_result = base_query.with_entities(
-        func.sum(Order.total_amount).label("total"),
-        func.count(Order.id).label("count"),
-    ).first()
-    
-    total_sales = total_result.total or 0
-    total_orders = total_result.count or 0
-    
-    # 포인트 사용액
-    total_points = base_query.with_entities(
-        func.sum(Order.used_point).label("points")
-    ).first().points or 0
-    
-    # 반품 건수
-    refund_count = db.query(Order).filter(
-        Order.status == OrderStatus.CANCELLED,
-        func.date(Order.ordered_at) >= startDate,
-        func.date(Order.ordered_at) <= endDate,
-    )
-    if sales_office_id:
-        refund_count = refund_count.filter(Order.sales_office_id == sales_office_id)
-    refund_count = refund_count.count()
-    
-    # 일별 판매 추이
-    daily_query = db.query(
-        func.date(Order.ordered_at).label("sale_date"),
-        func.sum(Order.total_amount).label("amount"),
-        func.count(Order.id).label("count"),
-    ).filter(
-        Order.status != OrderStatus.CANCELLED,
-        func.date(Order.ordered_at) >= startDate,
-        func.date(Order.ordered_at) <= endDate,
-    )
-    
-    if sales_office_id:
-        daily_query = daily_query.filter(Order.sales_office_id == sales_office_id)
-    
-    daily_results = daily_query.group_by(func.date(Order.ordered_at)).order_by(func.date(Order.ordered_at)).all()
-    
-    daily_sales = [
-        {
-            "date": str(r.sale_date),
-            "amount": r.amount or 0,
-            "count": r.count or 0,
-        }
-        for r in daily_results
-    ]
-    
-    # 인기 상품 TOP 10
-    top_query = db.query(
-        ClothingItem.id.label("id"),
-        ClothingItem.name.label("name"),
-        func.sum(OrderItem.quantity).label("quantity"),
-        func.sum(OrderItem.total_price).label("amount"),
-    ).join(OrderItem, OrderItem.item_id == ClothingItem.id).join(Order, Order.id == OrderItem.order_id).filter(
-        Order.status != OrderStatus.CANCELLED,
-        func.date(Order.ordered_at) >= startDate,
-        func.date(Order.ordered_at) <= endDate,
-    )
-    
-    if sales_office_id:
-        top_query = top_query.filter(Order.sales_office_id == sales_office_id)
-    
-    top_results = top_query.group_by(ClothingItem.id, ClothingItem.name).order_by(func.sum(OrderItem.total_price).desc()).limit(10).all()
-    
-    top_products = [
-        {
-            "id": r.id,
-            "name": r.name,
-            "quantity": r.quantity or 0,
-            "amount": r.amount or 0,
-        }
-        for r in top_results
-    ]
-    
-    # 결제 수단별 현황 (포인트만 사용)
-    payment_methods = [
-        {
-            "type": "points",
-            "count": total_orders,
-            "amount": total_points,
-            "percentage": 100.0 if total_sales > 0 else 0,
-        }
-    ]
-    
-    # 카테고리별 판매
-    from app.models.clothing import Category
-    category_query = db.query(
-        Category.name.label("name"),
-        func.sum(OrderItem.total_price).label("amount"),
-    ).join(ClothingItem, ClothingItem.category_id == Category.id).join(OrderItem, OrderItem.item_id == ClothingItem.id).join(Order, Order.id == OrderItem.order_id).filter(
-        Order.status != OrderStatus.CANCELLED,
-        func.date(Order.ordered_at) >= startDate,
-        func.date(Order.ordered_at) <= endDate,
-    )
-    
-    if sales_office_id:
-        category_query = category_query.filter(Order.sales_office_id == sales_office_id)
-    
-    category_results = category_query.group_by(Category.name).all()
-    
-    category_sales = [
-        {
-            "name": r.name,
-            "amount": r.amount or 0,
-        }
-        for r in category_results
-    ]
-    
-    return {
-        "totalSales": total_sales,
-        "totalOrders": total_orders,
-        "totalPoints": total_points,
-        "refundCount": refund_count,
-        "dailySales": daily_sales,
-        "topProducts": top_products,
-        "paymentMethods": payment_methods,
-        "categorySales": category_sales,
-    }
+    return sales_stats_service.get_sales_stats(db, startDate, endDate, sales_office_id)
@@ -7,8 +7,9 @@ from app.database import get_db
 from app.schemas.tailor import VoucherCreate, VoucherRegister, VoucherCancelRequest, VoucherResponse, VoucherListResponse, TailorCompanyCreate, TailorCompanyUpdate, VoucherIssueDirect
 from app.models.tailor import VoucherStatus, TailorCompany, TailorVoucher
 from app.models.user import UserRole
-from app.services import tailor_service
+from app.services import tailor_service, text_search
 from app.utils.auth import get_current_user, TokenData
+from app.utils.business_number import prefix_filters
 
 router = APIRouter()
 
@@ -203,11 +204,15 @@ def get_vouchers(
         )
     
     if keyword:
-        query = query.filter(
-            (TailorVoucher.voucher_number.contains(keyword)) |
-            (TailorVoucher.user.has(name=keyword)) |
-            (TailorVoucher.user.has(service_number=keyword))
-        )
+        # 체척권번호 접두어(TV-날짜-...)는 인덱스 범위 검색, 그 외는 트라이그램 부분 일치 검색
+        if keyword.upper().startswith("TV-"):
+            query = query.filter(*prefix_filters(TailorVoucher.voucher_number, keyword))
+        else:
+            query = query.filter(
+                text_search.match_condition(db, TailorVoucher, keyword) |
+                (TailorVoucher.user.has(name=keyword)) |
+                (TailorVoucher.user.has(service_number=keyword))
+            )
     
     total = query.count()
     skip = (page - 1) * page_size
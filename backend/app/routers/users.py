@@ -1,15 +1,18 @@
-from typing import Optional
+from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.user import UserRole, Rank
 from app.schemas.user import (
-    UserCreate, UserUpdate, UserResponse, UserListResponse,
+    UserCreate, UserUpdate, UserResponse, UserListResponse, UserLookupResponse,
     UserBulkImport, UserPointResponse, PromoteRequest, PromoteResponse,
 )
+from app.services import user_lookup
 from app.services.user_service import UserService
-from app.utils.auth import get_current_user, TokenData
+from app.utils.auth import get_current_user, get_password_hash_offloaded, TokenData
+from app.utils.password_hasher import HasherBusyError
 
 router = APIRouter()
 
@@ -72,6 +75,21 @@ def search_users(
     )
 
 
+@router.get("/lookup", response_model=List[UserLookupResponse])
+def lookup_users(
+    keyword: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(check_staff),
+):
+    """
+    사용자 자동완성 (판매소, 체척업체용)
+    - 활성 사용자 중 군번 또는 이름이 키워드로 시작하는 사용자
+    - 메모리 인덱스에서 조회 (건수 집계/상세 정보 없음)
+    """
+    return user_lookup.search(db, keyword, limit)
+
+
 @router.get("", response_model=UserListResponse)
 def get_users(
     page: int = Query(1, ge=1),
@@ -95,15 +113,20 @@ def get_users(
 
 
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def create_user(
+async def create_user(
     user_data: UserCreate,
     db: Session = Depends(get_db),
     current_user: TokenData = Depends(check_admin),
 ):
+    """사용자 생성 (비밀번호 해시는 해시 전용 프로세스 풀에서 수행, DB 작업은 스레드풀)"""
     service = UserService(db)
     try:
-        user = service.create(user_data)
-        return service._to_response(user)
+        password_hash = await get_password_hash_offloaded(user_data.password)
+    except HasherBusyError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e), headers={"Retry-After": "1"})
+    try:
+        user = await run_in_threadpool(service.create, user_data, password_hash)
+        return await run_in_threadpool(service._to_response, user)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
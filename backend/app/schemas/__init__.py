@@ -1,10 +1,12 @@
 from app.schemas.user import (
     Token,
     TokenData,
+    Principal,
     UserCreate,
     UserUpdate,
     UserResponse,
     UserListResponse,
+    UserLookupResponse,
     UserLogin,
     UserBulkImport,
     UserPointResponse,
@@ -38,6 +40,8 @@ from app.schemas.point import (
 )
 from app.schemas.order import (
     OrderCreate,
+    BatchOrderCreate,
+    OrderBatchCreate,
     OrderResponse,
     OrderItemCreate,
     DeliveryUpdate,
@@ -49,6 +53,7 @@ from app.schemas.order import (
 from app.schemas.sales import (
     OfflineSaleCreate,
     RefundCreate,
+    RefundBatchCreate,
     InventoryAdjust,
     InventoryReceive,
     InventoryResponse,
@@ -64,7 +69,7 @@ from app.schemas.tailor import (
 )
 
 __all__ = [
-    "Token", "TokenData",
+    "Token", "TokenData", "Principal",
     "UserCreate", "UserUpdate", "UserResponse", "UserListResponse", "UserLogin",
     "UserBulkImport", "UserPointResponse", "PromoteRequest", "PromoteResponse", "RankResponse",
     "CategoryCreate", "CategoryUpdate", "CategoryResponse", "CategoryTreeResponse",
@@ -73,9 +78,9 @@ __all__ = [
     "PointGrantCreate", "PointGrantYearlyCreate", "PointGrantResponse",
     "PointTransactionResponse", "PointHistoryResponse", "MyPointResponse",
     "PointUseRequest", "PointReserveRequest",
-    "OrderCreate", "OrderResponse", "OrderItemCreate", "DeliveryUpdate",
+    "OrderCreate", "BatchOrderCreate", "OrderBatchCreate", "OrderResponse", "OrderItemCreate", "DeliveryUpdate",
     "OrderCancel", "OrderListResponse", "OrderItemResponse", "DeliveryResponse",
-    "OfflineSaleCreate", "RefundCreate", "InventoryAdjust", "InventoryReceive",
+    "OfflineSaleCreate", "RefundCreate", "RefundBatchCreate", "InventoryAdjust", "InventoryReceive",
     "InventoryResponse", "InventoryHistoryResponse", "SalesHistoryResponse",
     "VoucherCreate", "VoucherRegister", "VoucherCancelRequest",
     "VoucherResponse", "VoucherListResponse",
@@ -25,6 +25,16 @@ class OrderCreate(BaseModel):
     delivery_note: Optional[str] = None
 
 
+class BatchOrderCreate(OrderCreate):
+    """일괄 주문 1건 (주문자 지정)"""
+    user_id: int
+
+
+class OrderBatchCreate(BaseModel):
+    """여러 사용자 주문 일괄 생성 (피복 지급일 부대 일괄 주문)"""
+    orders: list[BatchOrderCreate]
+
+
 class OrderItemResponse(BaseModel):
     id: int
     item_id: int
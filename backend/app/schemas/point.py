@@ -61,6 +61,14 @@ class PointHistoryResponse(BaseModel):
     page_size: int
 
 
+class PointHistoryCursorResponse(BaseModel):
+    items: List[PointTransactionResponse]
+    next_cursor: Optional[str] = None
+    has_more: bool
+    page_size: int
+    total: Optional[int] = None
+
+
 class MyPointResponse(BaseModel):
     current_point: int
     reserved_point: int
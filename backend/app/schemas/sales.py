@@ -32,6 +32,11 @@ class RefundCreate(BaseModel):
     items: list[RefundItem]
 
 
+class RefundBatchCreate(BaseModel):
+    """여러 주문 일괄 반품 (리콜 등)"""
+    orders: list[RefundCreate]
+
+
 class InventoryAdjust(BaseModel):
     sales_office_id: int
     item_id: int
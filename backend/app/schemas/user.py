@@ -85,6 +85,15 @@ class UserListResponse(BaseModel):
     total_pages: int
 
 
+class UserLookupResponse(BaseModel):
+    """사용자 자동완성 항목"""
+    id: int
+    name: str
+    service_number: str
+    unit: Optional[str] = None
+    rank: Optional[str] = None  # 계급명
+
+
 class UserLogin(BaseModel):
     username: str
     password: str
@@ -99,6 +108,14 @@ class TokenData(BaseModel):
     user_id: Optional[int] = None
     username: Optional[str] = None
     role: Optional[str] = None
+    sales_office_id: Optional[int] = None
+    tailor_company_id: Optional[int] = None
+    token_version: Optional[int] = None
+
+
+class Principal(TokenData):
+    """검증된 토큰 클레임 + 계정 활성 여부 (인증 주체 캐시 값)"""
+    is_active: bool = True
 
 
 class UserBulkImport(BaseModel):
@@ -0,0 +1,96 @@
+"""
+카테고리 트리 스냅샷
+- 전체 카테고리를 1회 조회하여 부모→자식, 하위 카테고리 ID 맵을 메모리에 구성
+- 카테고리 트리 API 와 품목 목록의 카테고리(하위 포함) 필터가 같은 스냅샷을 사용
+- 카테고리 생성/수정/삭제/엑셀 업로드 커밋 후 invalidate() 로 버전 증가 → 다음 조회 시 재구성
+- 다른 워커의 변경은 CATEGORY_TREE_TTL(초) 경과 후 재구성으로 반영 (SnapshotCache)
+"""
+from types import MappingProxyType
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from app.models.clothing import Category, CategoryLevel
+from app.schemas.clothing import CategoryTreeResponse
+from app.utils.snapshot import SnapshotCache
+
+
+class CategoryTreeSnapshot:
+    """
+    카테고리 트리 불변 스냅샷
+    - nodes: 카테고리 ID → 조회 행
+    - children: 상위 카테고리 ID → 하위 카테고리 ID (정렬순서, ID 순)
+    - descendants: 카테고리 ID → 자신과 모든 하위 카테고리 ID (비활성 포함)
+    - tree: 활성 대분류부터 활성 하위만 따라간 트리 응답
+    """
+
+    def __init__(self, rows: list):
+        ordered = sorted(rows, key=lambda r: (r.sort_order or 0, r.id))
+        children = {}
+        for row in ordered:
+            children.setdefault(row.parent_id, []).append(row.id)
+
+        self.nodes = MappingProxyType({row.id: row for row in ordered})
+        self.children = MappingProxyType({parent_id: tuple(ids) for parent_id, ids in children.items()})
+        self.descendants = MappingProxyType({row.id: self._collect(row.id) for row in ordered})
+        self.tree = tuple(
+            self._build_tree(row)
+            for row in ordered
+            if row.level == CategoryLevel.LARGE and row.is_active
+        )
+
+    def _collect(self, category_id: int) -> tuple:
+        ids = [category_id]
+        stack = list(reversed(self.children.get(category_id, ())))
+        while stack:
+            child_id = stack.pop()
+            ids.append(child_id)
+            stack.extend(reversed(self.children.get(child_id, ())))
+        return tuple(ids)
+
+    def _build_tree(self, row) -> CategoryTreeResponse:
+        return CategoryTreeResponse(
+            id=row.id,
+            name=row.name,
+            level=row.level,
+            parent_id=row.parent_id,
+            sort_order=row.sort_order,
+            is_active=row.is_active,
+            created_at=row.created_at,
+            children=[
+                self._build_tree(self.nodes[child_id])
+                for child_id in self.children.get(row.id, ())
+                if self.nodes[child_id].is_active
+            ],
+        )
+
+    def descendant_ids(self, category_id: int) -> List[int]:
+        """지정된 카테고리와 모든 하위 카테고리 ID"""
+        return list(self.descendants.get(category_id, (category_id,)))
+
+
+def _load_rows(db: Session) -> list:
+    return db.query(
+        Category.id,
+        Category.name,
+        Category.level,
+        Category.parent_id,
+        Category.sort_order,
+        Category.is_active,
+        Category.created_at,
+    ).all()
+
+
+_cache: SnapshotCache[CategoryTreeSnapshot] = SnapshotCache(
+    lambda db: CategoryTreeSnapshot(_load_rows(db)), "CATEGORY_TREE_TTL",
+)
+
+
+def get_snapshot(db: Session) -> CategoryTreeSnapshot:
+    """현재 스냅샷 반환, 무효화되었거나 만료되었으면 1회 조회로 재구성"""
+    return _cache.get(db)
+
+
+def invalidate() -> None:
+    """카테고리 변경 커밋 후 호출 (버전 증가)"""
+    _cache.invalidate()
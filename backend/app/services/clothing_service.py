@@ -1,10 +1,12 @@
+import csv
+import io
+import time
 from typing import Optional, List
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from fastapi.responses import StreamingResponse
-from io import BytesIO
+from sqlalchemy import insert, or_
 
 from app.models.clothing import Category, ClothingItem, ClothingSpec, CategoryLevel, ClothingType
+from app.services import category_tree
 from app.schemas.clothing import (
     CategoryCreate, CategoryUpdate, CategoryResponse, CategoryTreeResponse,
     ClothingCreate, ClothingUpdate, ClothingResponse, ClothingDetailResponse,
@@ -28,31 +30,8 @@ class CategoryService:
         return query.order_by(Category.sort_order, Category.name).all()
 
     def get_tree(self) -> List[CategoryTreeResponse]:
-        large_categories = (
-            self.db.query(Category)
-            .filter(Category.level == CategoryLevel.LARGE, Category.is_active == True)
-            .order_by(Category.sort_order)
-            .all()
-        )
-        return [self._build_tree(cat) for cat in large_categories]
-
-    def _build_tree(self, category: Category) -> CategoryTreeResponse:
-        children = (
-            self.db.query(Category)
-            .filter(Category.parent_id == category.id, Category.is_active == True)
-            .order_by(Category.sort_order)
-            .all()
-        )
-        return CategoryTreeResponse(
-            id=category.id,
-            name=category.name,
-            level=category.level,
-            parent_id=category.parent_id,
-            sort_order=category.sort_order,
-            is_active=category.is_active,
-            created_at=category.created_at,
-            children=[self._build_tree(child) for child in children],
-        )
+        """활성 카테고리 트리 (스냅샷에서 반환, 변경 시에만 1회 조회)"""
+        return list(category_tree.get_snapshot(self.db).tree)
 
     def create(self, data: CategoryCreate) -> Category:
         if data.parent_id:
@@ -70,6 +49,7 @@ class CategoryService:
         )
         self.db.add(category)
         self.db.commit()
+        category_tree.invalidate()
         self.db.refresh(category)
         return category
 
@@ -83,6 +63,7 @@ class CategoryService:
             setattr(category, key, value)
 
         self.db.commit()
+        category_tree.invalidate()
         self.db.refresh(category)
         return category
 
@@ -101,139 +82,112 @@ class CategoryService:
 
         self.db.delete(category)
         self.db.commit()
+        category_tree.invalidate()
         return True
 
-    def export_to_excel(self) -> StreamingResponse:
-        from xlwt import Workbook
-        
-        wb = Workbook()
-        ws = wb.add_sheet('Sheet1')
-        
-        ws.write(0, 0, '대분류')
-        ws.write(0, 1, '중분류')
-        ws.write(0, 2, '품목')
-        ws.write(0, 3, '피복타입')
-        
-        row = 1
-        large_cats = self.db.query(Category).filter(
-            Category.level == CategoryLevel.LARGE, Category.is_active == True
-        ).order_by(Category.sort_order).all()
-        
-        for large in large_cats:
-            medium_cats = self.db.query(Category).filter(
-                Category.parent_id == large.id, Category.is_active == True
-            ).order_by(Category.sort_order).all()
-            
-            if not medium_cats:
-                ws.write(row, 0, large.name)
-                clothing_type = '완제품' if large.name == '완제품' else '맞춤피복'
-                ws.write(row, 3, clothing_type)
-                row += 1
-                continue
-            
-            for medium in medium_cats:
-                small_cats = self.db.query(Category).filter(
-                    Category.parent_id == medium.id, Category.is_active == True
-                ).order_by(Category.sort_order).all()
-                
-                if not small_cats:
-                    ws.write(row, 0, large.name)
-                    ws.write(row, 1, medium.name)
-                    clothing_type = '완제품' if large.name == '완제품' else '맞춤피복'
-                    ws.write(row, 3, clothing_type)
-                    row += 1
-                    continue
-                
-                for small in small_cats:
-                    ws.write(row, 0, large.name)
-                    ws.write(row, 1, medium.name)
-                    ws.write(row, 2, small.name)
-                    clothing_type = '완제품' if large.name == '완제품' else '맞춤피복'
-                    ws.write(row, 3, clothing_type)
-                    row += 1
-        
-        output = BytesIO()
-        wb.save(output)
-        output.seek(0)
-        
-        return StreamingResponse(
-            output,
-            media_type='application/vnd.ms-excel',
-            headers={'Content-Disposition': 'attachment; filename="cloth_category.xls"'}
-        )
+    def _read_category_rows(self, file, filename: str) -> list:
+        """업로드 파일의 (행 번호, 첫 3열 값) 목록, 제목 행 제외 (CSV 또는 xls)"""
+        content = file.read()
+        if filename.lower().endswith('.csv'):
+            reader = csv.reader(io.StringIO(content.decode('utf-8-sig')))
+            return [(row_no, (row + ['', '', ''])[:3]) for row_no, row in enumerate(reader, start=1) if row_no > 1]
 
-    def import_from_excel(self, file) -> dict:
         import xlrd
-        
-        wb = xlrd.open_workbook(file_contents=file.read())
-        ws = wb.sheet_by_index(0)
-        
-        created = 0
+
+        ws = xlrd.open_workbook(file_contents=content).sheet_by_index(0)
+        return [(row_idx + 1, ws.row_values(row_idx, 0, 3)) for row_idx in range(1, ws.nrows)]
+
+    def import_from_excel(self, file, dry_run: bool = False, filename: str = "") -> dict:
+        """
+        카테고리 엑셀(xls) 또는 CSV 일괄 등록 (대분류/중분류/품목 열)
+        - 기존 카테고리를 1회 조회하여 이름 경로 색인 구성, 행마다 조회하지 않음
+        - 대/중/소분류 순으로 새 카테고리만 골라 단계별 일괄 INSERT ... RETURNING (최대 3회)
+        - 정렬순서: 대/중분류는 파일 내 같은 상위 아래 처음 나온 순서, 소분류는 0
+        - dry_run 이면 저장하지 않고 생성될 카테고리 목록(new_categories)만 반환
+        """
+        started = time.perf_counter()
         errors = []
-        
-        large_cache = {}
-        medium_cache = {}
-        
-        for row_idx in range(1, ws.nrows):
+        paths = []
+        for row_no, values in self._read_category_rows(file, filename):
             try:
-                large_name = str(ws.cell_value(row_idx, 0)).strip()
-                medium_name = str(ws.cell_value(row_idx, 1)).strip()
-                small_name = str(ws.cell_value(row_idx, 2)).strip()
-                clothing_type_str = str(ws.cell_value(row_idx, 3)).strip()
-                
-                if not large_name:
-                    continue
-                
-                clothing_type = ClothingType.CUSTOM if '맞춤' in clothing_type_str else ClothingType.READY_MADE
-                
-                if large_name not in large_cache:
-                    large = self.db.query(Category).filter(
-                        Category.name == large_name, Category.level == CategoryLevel.LARGE
-                    ).first()
-                    if not large:
-                        large = Category(name=large_name, level=CategoryLevel.LARGE, sort_order=len(large_cache))
-                        self.db.add(large)
-                        self.db.flush()
-                    large_cache[large_name] = large.id
-                
-                if medium_name:
-                    medium_key = f"{large_name}_{medium_name}"
-                    if medium_key not in medium_cache:
-                        medium = self.db.query(Category).filter(
-                            Category.name == medium_name,
-                            Category.parent_id == large_cache[large_name]
-                        ).first()
-                        if not medium:
-                            medium = Category(
-                                name=medium_name,
-                                level=CategoryLevel.MEDIUM,
-                                parent_id=large_cache[large_name],
-                                sort_order=len([k for k in medium_cache if k.startswith(large_name)])
-                            )
-                            self.db.add(medium)
-                            self.db.flush()
-                        medium_cache[medium_key] = medium.id
-                
-                if small_name and medium_name:
-                    existing = self.db.query(Category).filter(
-                        Category.name == small_name,
-                        Category.parent_id == medium_cache[medium_key]
-                    ).first()
-                    if not existing:
-                        small = Category(
-                            name=small_name,
-                            level=CategoryLevel.SMALL,
-                            parent_id=medium_cache[medium_key],
-                            sort_order=0
-                        )
-                        self.db.add(small)
-                        created += 1
-                        
+                large_name, medium_name, small_name = (str(value).strip() for value in values)
             except Exception as e:
-                errors.append(f"행 {row_idx + 1}: {str(e)}")
-        
-        self.db.commit()
-        return {'created': created, 'errors': errors}
+                errors.append(f"행 {row_no}: {str(e)}")
+                continue
+            if not large_name:
+                continue
+            path = (large_name,)
+            if medium_name:
+                path += (medium_name,)
+                if small_name:
+                    path += (small_name,)
+            paths.append(path)
+
+        large_ids = {}
+        child_ids = {}
+        for row in self.db.query(Category.id, Category.name, Category.level, Category.parent_id).order_by(Category.id):
+            if row.level == CategoryLevel.LARGE:
+                large_ids.setdefault(row.name, row.id)
+            if row.parent_id is not None:
+                child_ids.setdefault((row.parent_id, row.name), row.id)
+
+        path_ids = {}  # 이름 경로 → 카테고리 ID (기존 또는 INSERT 후 확보, dry_run 의 새 카테고리는 없음)
+        levels = {}
+        new_categories = []
+        for depth, level in enumerate([CategoryLevel.LARGE, CategoryLevel.MEDIUM, CategoryLevel.SMALL], start=1):
+            nodes = list(dict.fromkeys(path[:depth] for path in paths if len(path) >= depth))
+            sibling_counts = {}
+            new_nodes = []
+            new_rows = []
+            for node in nodes:
+                parent_id = path_ids.get(node[:-1])
+                if depth == 1:
+                    existing_id = large_ids.get(node[0])
+                else:
+                    existing_id = child_ids.get((parent_id, node[-1])) if parent_id else None
+
+                position = sibling_counts.get(node[:-1], 0)
+                sibling_counts[node[:-1]] = position + 1
+                if existing_id:
+                    path_ids[node] = existing_id
+                    continue
+
+                new_nodes.append(node)
+                new_rows.append({
+                    "name": node[-1],
+                    "level": level,
+                    "parent_id": parent_id,
+                    "sort_order": 0 if level == CategoryLevel.SMALL else position,
+                })
+
+            levels[level.value] = {"created": len(new_rows), "skipped": len(nodes) - len(new_rows)}
+            if dry_run:
+                new_categories.extend({"level": level.value, "path": " > ".join(node)} for node in new_nodes)
+            elif new_rows:
+                inserted = self.db.execute(
+                    insert(Category).returning(Category.parent_id, Category.name, Category.id), new_rows
+                ).all()
+                inserted_ids = {(r.parent_id, r.name): r.id for r in inserted}
+                for node, row in zip(new_nodes, new_rows):
+                    path_ids[node] = inserted_ids[(row["parent_id"], row["name"])]
+
+        created = sum(counts["created"] for counts in levels.values())
+        if not dry_run:
+            self.db.commit()
+            if created:
+                category_tree.invalidate()
+
+        result = {
+            'created': created,
+            'skipped': sum(counts["skipped"] for counts in levels.values()),
+            'levels': levels,
+            'errors': errors,
+            'dry_run': dry_run,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 1),
+        }
+        if dry_run:
+            result['new_categories'] = new_categories
+        return result
 
 
 class ClothingService:
@@ -244,12 +198,8 @@ class ClothingService:
         return self.db.query(ClothingItem).filter(ClothingItem.id == item_id).first()
 
     def _get_descendant_ids(self, category_id: int) -> List[int]:
-        """지정된 카테고리와 모든 하위 카테고리 ID를 반환"""
-        ids = [category_id]
-        children = self.db.query(Category).filter(Category.parent_id == category_id).all()
-        for child in children:
-            ids.extend(self._get_descendant_ids(child.id))
-        return ids
+        """지정된 카테고리와 모든 하위 카테고리 ID를 반환 (카테고리 트리 스냅샷 사용)"""
+        return category_tree.get_snapshot(self.db).descendant_ids(category_id)
 
     def get_list(
         self,
@@ -0,0 +1,78 @@
+"""
+대시보드 캐시
+- 역할별 대시보드 통계(COUNT 쿼리 묶음)를 짧은 TTL 로 캐시
+- 키: admin / sales_office:{판매소 ID} / tailor / user:{사용자 ID}
+- 주문/재고/체척권 변경을 커밋한 서비스가 관련 키를 무효화
+- 백엔드는 DASHBOARD_CACHE_URL 설정에 따라 프로세스 내 LRU 또는 Redis 공유 캐시
+"""
+from typing import Callable, Optional
+
+from app.config import settings
+from app.utils.cache import create_cache
+
+_backend = None
+
+
+def get_backend():
+    """캐시 백엔드 (최초 사용 시 설정값으로 생성)"""
+    global _backend
+    if _backend is None:
+        _backend = create_cache(settings.DASHBOARD_CACHE_URL, settings.DASHBOARD_CACHE_MAX_ENTRIES)
+    return _backend
+
+
+def set_backend(backend) -> None:
+    """캐시 백엔드 교체 (get/set/delete/clear 를 가진 객체)"""
+    global _backend
+    _backend = backend
+
+
+def admin_key() -> str:
+    return "dashboard:admin"
+
+
+def sales_office_key(sales_office_id: Optional[int]) -> str:
+    return f"dashboard:sales_office:{sales_office_id}"
+
+
+def tailor_key() -> str:
+    return "dashboard:tailor"
+
+
+def user_key(user_id: int) -> str:
+    return f"dashboard:user:{user_id}"
+
+
+def get_or_set(key: str, loader: Callable[[], dict]) -> dict:
+    """캐시된 대시보드 반환, 없거나 만료되었으면 loader 결과를 저장 후 반환"""
+    ttl = settings.DASHBOARD_CACHE_TTL
+    if ttl <= 0:
+        return loader()
+
+    backend = get_backend()
+    cached = backend.get(key)
+    if cached is not None:
+        return cached
+
+    value = loader()
+    backend.set(key, value, ttl)
+    return value
+
+
+def invalidate(*keys: str) -> None:
+    get_backend().delete(*keys)
+
+
+def invalidate_order(order) -> None:
+    """주문 변경 후: 판매소(금일 판매/배송/재고/반품) 및 주문자 대시보드"""
+    invalidate(sales_office_key(order.sales_office_id), user_key(order.user_id))
+
+
+def invalidate_inventory(sales_office_id: int) -> None:
+    """재고 변경 후: 판매소 대시보드 (재고 부족 품목)"""
+    invalidate(sales_office_key(sales_office_id))
+
+
+def invalidate_voucher(voucher) -> None:
+    """체척권 변경 후: 체척업체 및 사용자 대시보드"""
+    invalidate(tailor_key(), user_key(voucher.user_id))
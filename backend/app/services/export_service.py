@@ -0,0 +1,109 @@
+"""
+내보내기 서비스
+- 카테고리/품목 카탈로그를 정렬된 단일 쿼리로 읽어 CSV 로 스트리밍
+- 행은 yield_per 단위로 가져오므로(PostgreSQL 은 서버 측 커서) 데이터 규모와 무관하게 메모리 사용량 일정
+- 응답 전송은 요청 세션이 닫힌 뒤에도 이어지므로 내보내기 전용 세션을 열고 순회가 끝나면 닫음
+"""
+from typing import Iterator
+
+from sqlalchemy import and_, select
+from sqlalchemy.orm import aliased
+
+from app.database import SessionLocal
+from app.models.clothing import Category, CategoryLevel, ClothingItem, ClothingSpec, ClothingType
+from app.models.sales import Inventory, SalesOffice
+
+BATCH_SIZE = 1000
+
+CATEGORY_HEADER = ["대분류", "중분류", "품목", "피복타입"]
+CATALOG_HEADER = ["품목ID", "품목명", "카테고리", "피복타입", "사용여부"]
+SPEC_HEADER = ["규격코드", "사이즈", "가격"]
+INVENTORY_HEADER = ["판매소", "재고수량", "예약수량"]
+
+CLOTHING_TYPE_LABELS = {ClothingType.READY_MADE: "완제품", ClothingType.CUSTOM: "맞춤피복"}
+
+
+def _stream(statement) -> Iterator:
+    """내보내기 전용 세션으로 쿼리 결과를 BATCH_SIZE 단위로 순회"""
+    db = SessionLocal()
+    try:
+        yield from db.execute(statement.execution_options(yield_per=BATCH_SIZE))
+    finally:
+        db.close()
+
+
+def category_rows() -> Iterator[list]:
+    """
+    카테고리 엑셀 업로드 양식과 같은 행 (대분류, 중분류, 품목, 피복타입)
+    - 활성 카테고리만, 하위가 없는 대/중분류는 단독 행
+    """
+    large = aliased(Category)
+    medium = aliased(Category)
+    small = aliased(Category)
+    statement = (
+        select(large.name, medium.name, small.name)
+        .select_from(large)
+        .outerjoin(medium, and_(medium.parent_id == large.id, medium.is_active == True))
+        .outerjoin(small, and_(small.parent_id == medium.id, small.is_active == True))
+        .where(large.level == CategoryLevel.LARGE, large.is_active == True)
+        .order_by(large.sort_order, large.id, medium.sort_order, medium.id, small.sort_order, small.id)
+    )
+    for large_name, medium_name, small_name in _stream(statement):
+        clothing_type = "완제품" if large_name == "완제품" else "맞춤피복"
+        yield [large_name, medium_name or "", small_name or "", clothing_type]
+
+
+def catalog_header(include_specs: bool = True, include_inventory: bool = False) -> list:
+    header = list(CATALOG_HEADER)
+    if include_specs or include_inventory:
+        header += SPEC_HEADER
+    if include_inventory:
+        header += INVENTORY_HEADER
+    return header
+
+
+def catalog_rows(include_specs: bool = True, include_inventory: bool = False) -> Iterator[list]:
+    """
+    품목 카탈로그 행
+    - 품목별 1행, include_specs 면 규격별 1행, include_inventory 면 규격 x 판매소별 1행
+    - 카테고리는 대 > 중 > 소 경로로 표시
+    """
+    include_specs = include_specs or include_inventory
+    category = aliased(Category)
+    parent = aliased(Category)
+    grandparent = aliased(Category)
+    columns = [
+        ClothingItem.id, ClothingItem.name, grandparent.name, parent.name, category.name,
+        ClothingItem.clothing_type, ClothingItem.is_active,
+    ]
+    if include_specs:
+        columns += [ClothingSpec.spec_code, ClothingSpec.size, ClothingSpec.price]
+    if include_inventory:
+        columns += [SalesOffice.name, Inventory.quantity, Inventory.reserved_quantity]
+
+    statement = (
+        select(*columns)
+        .outerjoin(category, category.id == ClothingItem.category_id)
+        .outerjoin(parent, parent.id == category.parent_id)
+        .outerjoin(grandparent, grandparent.id == parent.parent_id)
+    )
+    order_by = [ClothingItem.id]
+    if include_specs:
+        statement = statement.outerjoin(ClothingSpec, ClothingSpec.item_id == ClothingItem.id)
+        order_by.append(ClothingSpec.id)
+    if include_inventory:
+        statement = statement.outerjoin(
+            Inventory, and_(Inventory.item_id == ClothingItem.id, Inventory.spec_id == ClothingSpec.id)
+        ).outerjoin(SalesOffice, SalesOffice.id == Inventory.sales_office_id)
+        order_by.append(Inventory.sales_office_id)
+
+    for row in _stream(statement.order_by(*order_by)):
+        item_id, name, *path, clothing_type, is_active = row[:7]
+        values = [
+            item_id,
+            name,
+            " > ".join(p for p in path if p),
+            CLOTHING_TYPE_LABELS.get(clothing_type, ""),
+            "Y" if is_active else "N",
+        ]
+        yield values + ["" if v is None else v for v in row[7:]]
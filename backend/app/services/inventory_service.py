@@ -1,9 +1,12 @@
 from typing import Optional
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.models.sales import Inventory, InventoryHistory, AdjustmentType
+from app.models.clothing import Category, ClothingItem, ClothingSpec
+from app.models.sales import Inventory, InventoryHistory, AdjustmentType, SalesOffice
 from app.schemas.sales import InventoryAdjust, InventoryReceive
+from app.services import dashboard_cache
 
 
 def get_inventory_list(
@@ -23,6 +26,72 @@ def get_inventory_list(
     return inventory_list, total
 
 
+def get_inventory_rows(
+    db: Session,
+    sales_office_id: Optional[int] = None,
+    item_id: Optional[int] = None,
+    keyword: Optional[str] = None,
+    in_stock_only: bool = False,
+    skip: int = 0,
+    limit: int = 50,
+) -> tuple[list, int]:
+    """
+    재고 목록 화면용 조회
+    - 재고/판매소/품목/카테고리/규격을 한 번에 조인하여 응답에 필요한 컬럼만 조회 (ORM 객체 미생성)
+    - 페이지 크기와 무관하게 목록 1회 + 건수 1회 조회
+    - keyword: 품목명 부분 일치, in_stock_only: 실재고 1개 이상
+    """
+    filters = []
+    if sales_office_id:
+        filters.append(Inventory.sales_office_id == sales_office_id)
+    if item_id:
+        filters.append(Inventory.item_id == item_id)
+    if in_stock_only:
+        filters.append(Inventory.quantity > 0)
+    if keyword:
+        filters.append(ClothingItem.name.contains(keyword))
+
+    count_query = db.query(func.count(Inventory.id))
+    if keyword:
+        count_query = count_query.join(ClothingItem, ClothingItem.id == Inventory.item_id)
+    total = count_query.filter(*filters).scalar()
+
+    rows = db.query(
+        Inventory.id,
+        Inventory.sales_office_id,
+        Inventory.item_id,
+        Inventory.spec_id,
+        Inventory.quantity,
+        Inventory.reserved_quantity,
+        (Inventory.quantity - Inventory.reserved_quantity).label("available_quantity"),
+        Inventory.updated_at,
+        SalesOffice.id.label("office_id"),
+        SalesOffice.name.label("office_name"),
+        ClothingItem.id.label("product_id"),
+        ClothingItem.name.label("item_name"),
+        ClothingItem.is_active.label("item_is_active"),
+        ClothingItem.clothing_type,
+        ClothingItem.description,
+        ClothingItem.image_url,
+        ClothingItem.thumbnail_url,
+        Category.id.label("category_id"),
+        Category.name.label("category_name"),
+        ClothingSpec.id.label("spec_row_id"),
+        ClothingSpec.size.label("spec_size"),
+        ClothingSpec.price.label("spec_price"),
+    ).outerjoin(
+        SalesOffice, SalesOffice.id == Inventory.sales_office_id
+    ).outerjoin(
+        ClothingItem, ClothingItem.id == Inventory.item_id
+    ).outerjoin(
+        Category, Category.id == ClothingItem.category_id
+    ).outerjoin(
+        ClothingSpec, ClothingSpec.id == Inventory.spec_id
+    ).filter(*filters).order_by(Inventory.id).offset(skip).limit(limit).all()
+
+    return rows, total
+
+
 def get_inventory(db: Session, inventory_id: int) -> Optional[Inventory]:
     return db.query(Inventory).filter(Inventory.id == inventory_id).first()
 
@@ -61,6 +130,7 @@ def receive_inventory(db: Session, staff_id: int, receive_data: InventoryReceive
     
     db.commit()
     db.refresh(inventory)
+    dashboard_cache.invalidate_inventory(inventory.sales_office_id)
     return inventory
 
 
@@ -96,6 +166,7 @@ def adjust_inventory(db: Session, staff_id: int, adjust_data: InventoryAdjust) -
     
     db.commit()
     db.refresh(inventory)
+    dashboard_cache.invalidate_inventory(inventory.sales_office_id)
     return inventory
 
 
@@ -117,19 +188,37 @@ def get_inventory_history(
     return history, total
 
 
-def get_inventory_summary(db: Session, sales_office_id: Optional[int] = None) -> dict:
-    query = db.query(Inventory)
+def get_inventory_summary(db: Session, sales_office_id: Optional[int] = None, by_office: bool = False) -> dict:
+    """
+    재고 요약 (전체 품목 수, 재고 부족 품목, 품절 품목)
+    - 재고 행을 불러오지 않고 판매소별 COUNT(*) FILTER (WHERE ...) 집계 1회로 계산
+    - by_office: 판매소별 요약(offices)도 함께 반환
+    """
+    rows = db.query(
+        Inventory.sales_office_id,
+        SalesOffice.name.label("sales_office_name"),
+        func.count(Inventory.id).label("total_items"),
+        func.count(Inventory.id).filter(Inventory.quantity > 0, Inventory.quantity <= 10).label("low_stock"),
+        func.count(Inventory.id).filter(Inventory.quantity == 0).label("out_of_stock"),
+    ).outerjoin(SalesOffice, SalesOffice.id == Inventory.sales_office_id)
     if sales_office_id:
-        query = query.filter(Inventory.sales_office_id == sales_office_id)
-    
-    inventory_list = query.all()
-    
-    total_items = len(inventory_list)
-    low_stock = sum(1 for inv in inventory_list if 0 < inv.quantity <= 10)
-    out_of_stock = sum(1 for inv in inventory_list if inv.quantity == 0)
+        rows = rows.filter(Inventory.sales_office_id == sales_office_id)
+    rows = rows.group_by(Inventory.sales_office_id, SalesOffice.name).order_by(Inventory.sales_office_id).all()
     
-    return {
-        "totalItems": total_items,
-        "lowStock": low_stock,
-        "outOfStock": out_of_stock,
+    summary = {
+        "totalItems": sum(r.total_items for r in rows),
+        "lowStock": sum(r.low_stock for r in rows),
+        "outOfStock": sum(r.out_of_stock for r in rows),
     }
+    if by_office:
+        summary["offices"] = [
+            {
+                "sales_office_id": r.sales_office_id,
+                "sales_office_name": r.sales_office_name,
+                "totalItems": r.total_items,
+                "lowStock": r.low_stock,
+                "outOfStock": r.out_of_stock,
+            }
+            for r in rows
+        ]
+    return summary
@@ -9,6 +9,7 @@ from sqlalchemy import or_
 from app.models.menu import Menu, MenuPermission
 from app.models.user import UserRole
 from app.schemas.menu import MenuCreate, MenuUpdate, MenuTreeResponse
+from app.services import menu_tree
 
 
 class MenuService:
@@ -25,94 +26,12 @@ class MenuService:
         return query.order_by(Menu.sort_order).all()
 
     def get_tree(self) -> List[MenuTreeResponse]:
-        """전체 메뉴 트리 조회"""
-        root_menus = (
-            self.db.query(Menu)
-            .filter(Menu.parent_id == None, Menu.is_active == True)
-            .order_by(Menu.sort_order)
-            .all()
-        )
-        return [self._build_tree(menu) for menu in root_menus]
+        """전체 메뉴 트리 조회 (스냅샷에서 반환, 변경 시에만 1회 조회)"""
+        return list(menu_tree.get_snapshot(self.db).tree)
 
     def get_tree_by_role(self, role: str) -> List[MenuTreeResponse]:
-        """역할별 메뉴 트리 조회"""
-        root_menus = (
-            self.db.query(Menu)
-            .filter(Menu.parent_id == None, Menu.is_active == True)
-            .order_by(Menu.sort_order)
-            .all()
-        )
-        
-        result = []
-        for menu in root_menus:
-            tree = self._build_tree_with_role(menu, role)
-            if tree:
-                result.append(tree)
-        return result
-
-    def _build_tree(self, menu: Menu) -> MenuTreeResponse:
-        children = (
-            self.db.query(Menu)
-            .filter(Menu.parent_id == menu.id, Menu.is_active == True)
-            .order_by(Menu.sort_order)
-            .all()
-        )
-        return MenuTreeResponse(
-            id=menu.id,
-            name=menu.name,
-            path=menu.path,
-            icon=menu.icon,
-            parent_id=menu.parent_id,
-            sort_order=menu.sort_order,
-            is_category=menu.is_category,
-            is_active=menu.is_active,
-            allowed_roles=menu.get_allowed_roles_list(),
-            children=[self._build_tree(child) for child in children],
-            created_at=menu.created_at,
-        )
-
-    def _build_tree_with_role(self, menu: Menu, role: str) -> Optional[MenuTreeResponse]:
-        """역할 권한에 따른 메뉴 트리 구성"""
-        allowed_roles = menu.get_allowed_roles_list()
-        
-        # 대분류는 권한 체크 없이 표시, 하위 메뉴에서 필터링
-        if not menu.is_category:
-            # 권한이 없으면 None 반환
-            if allowed_roles and role not in allowed_roles:
-                return None
-
-        # 하위 메뉴 조회
-        children = (
-            self.db.query(Menu)
-            .filter(Menu.parent_id == menu.id, Menu.is_active == True)
-            .order_by(Menu.sort_order)
-            .all()
-        )
-        
-        # 하위 메뉴 필터링
-        filtered_children = []
-        for child in children:
-            child_tree = self._build_tree_with_role(child, role)
-            if child_tree:
-                filtered_children.append(child_tree)
-        
-        # 대분류인데 하위 메뉴가 없으면 None 반환
-        if menu.is_category and not filtered_children:
-            return None
-
-        return MenuTreeResponse(
-            id=menu.id,
-            name=menu.name,
-            path=menu.path,
-            icon=menu.icon,
-            parent_id=menu.parent_id,
-            sort_order=menu.sort_order,
-            is_category=menu.is_category,
-            is_active=menu.is_active,
-            allowed_roles=allowed_roles,
-            children=filtered_children,
-            created_at=menu.created_at,
-        )
+        """역할별 메뉴 트리 조회 (역할별로 미리 구성된 스냅샷에서 반환)"""
+        return menu_tree.get_snapshot(self.db).tree_by_role(role)
 
     def create(self, data: MenuCreate) -> Menu:
         if data.parent_id:
@@ -133,6 +52,7 @@ class MenuService:
         
         self.db.add(menu)
         self.db.commit()
+        menu_tree.invalidate()
         self.db.refresh(menu)
         return menu
 
@@ -151,6 +71,7 @@ class MenuService:
             setattr(menu, key, value)
 
         self.db.commit()
+        menu_tree.invalidate()
         self.db.refresh(menu)
         return menu
 
@@ -166,6 +87,7 @@ class MenuService:
 
         self.db.delete(menu)
         self.db.commit()
+        menu_tree.invalidate()
         return True
 
     def initialize_default_menus(self):
@@ -230,3 +152,4 @@ class MenuService:
             parent_map[menu.name] = menu.id
         
         self.db.commit()
+        menu_tree.invalidate()
@@ -0,0 +1,108 @@
+"""
+메뉴 트리 스냅샷
+- 활성 메뉴 전체를 1회 조회하여 전체 트리와 역할별 트리를 미리 구성
+- 권한(allowed_roles) JSON 은 스냅샷 구성 시 메뉴당 1회만 해석
+- 메뉴 생성/수정/삭제/기본 메뉴 초기화 커밋 후 invalidate() 로 버전 증가 → 다음 조회 시 재구성
+- 다른 워커의 변경은 MENU_TREE_TTL(초) 경과 후 재구성으로 반영 (SnapshotCache)
+"""
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.menu import Menu
+from app.models.user import UserRole
+from app.schemas.menu import MenuTreeResponse
+from app.utils.snapshot import SnapshotCache
+
+
+class MenuTreeSnapshot:
+    """
+    메뉴 트리 불변 스냅샷
+    - tree: 활성 최상위 메뉴부터 활성 하위만 따라간 전체 트리 (관리자 화면 관리용)
+    - role_trees: 역할 → 권한이 있는 메뉴만 남긴 트리 (UserRole 4종 미리 구성)
+    """
+
+    def __init__(self, rows: list):
+        ordered = sorted(rows, key=lambda r: (r.sort_order or 0, r.id))
+        self._children = {}
+        for row in ordered:
+            self._children.setdefault(row.parent_id, []).append(row)
+        self._roles = {row.id: Menu.parse_allowed_roles(row.allowed_roles) for row in ordered}
+
+        self.tree = tuple(self._build_tree(row) for row in self._children.get(None, ()))
+        self.role_trees = {role.value: self._build_role_trees(role.value) for role in UserRole}
+
+    def _response(self, row, children: list) -> MenuTreeResponse:
+        return MenuTreeResponse(
+            id=row.id,
+            name=row.name,
+            path=row.path,
+            icon=row.icon,
+            parent_id=row.parent_id,
+            sort_order=row.sort_order,
+            is_category=row.is_category,
+            is_active=row.is_active,
+            allowed_roles=self._roles[row.id],
+            children=children,
+            created_at=row.created_at,
+        )
+
+    def _build_tree(self, row) -> MenuTreeResponse:
+        return self._response(row, [self._build_tree(child) for child in self._children.get(row.id, ())])
+
+    def _build_tree_with_role(self, row, role: str) -> Optional[MenuTreeResponse]:
+        """역할 권한에 따른 메뉴 트리 구성 (대분류는 권한 대신 표시할 하위 메뉴 유무로 판단)"""
+        allowed_roles = self._roles[row.id]
+        if not row.is_category and allowed_roles and role not in allowed_roles:
+            return None
+
+        children = []
+        for child in self._children.get(row.id, ()):
+            child_tree = self._build_tree_with_role(child, role)
+            if child_tree:
+                children.append(child_tree)
+
+        if row.is_category and not children:
+            return None
+        return self._response(row, children)
+
+    def _build_role_trees(self, role: str) -> tuple:
+        trees = (self._build_tree_with_role(row, role) for row in self._children.get(None, ()))
+        return tuple(tree for tree in trees if tree)
+
+    def tree_by_role(self, role: str) -> List[MenuTreeResponse]:
+        """역할별 메뉴 트리 (UserRole 외 역할은 요청 시 구성)"""
+        trees = self.role_trees.get(role)
+        if trees is None:
+            trees = self._build_role_trees(role)
+        return list(trees)
+
+
+def _load_rows(db: Session) -> list:
+    return db.query(
+        Menu.id,
+        Menu.name,
+        Menu.path,
+        Menu.icon,
+        Menu.parent_id,
+        Menu.sort_order,
+        Menu.is_category,
+        Menu.is_active,
+        Menu.allowed_roles,
+        Menu.created_at,
+    ).filter(Menu.is_active == True).all()
+
+
+_cache: SnapshotCache[MenuTreeSnapshot] = SnapshotCache(
+    lambda db: MenuTreeSnapshot(_load_rows(db)), "MENU_TREE_TTL",
+)
+
+
+def get_snapshot(db: Session) -> MenuTreeSnapshot:
+    """현재 스냅샷 반환, 무효화되었거나 만료되었으면 1회 조회로 재구성"""
+    return _cache.get(db)
+
+
+def invalidate() -> None:
+    """메뉴 변경 커밋 후 호출 (버전 증가)"""
+    _cache.invalidate()
@@ -1,20 +1,36 @@
-import uuid
 from datetime import datetime
-from typing import Optional
+from typing import NamedTuple, Optional
 
+from sqlalchemy import case, insert, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
 from app.models.order import Order, OrderItem, Delivery, OrderStatus, OrderType, DeliveryType, DeliveryStatus
-from app.models.point import PointTransaction, TransactionType
+from app.models.point import TransactionType
 from app.models.sales import Inventory, InventoryHistory, AdjustmentType
 from app.models.clothing import ClothingSpec
+from app.database import execute_with_retry
+from app.utils.business_number import NumberGenerator, flush_numbered, insert_numbered
 from app.schemas.order import OrderCreate, DeliveryUpdate, OrderCancel
+from app.services import dashboard_cache, point_ledger, sales_stats_service
+
+
+class InsufficientStockError(ValueError):
+    """
+    재고 부족으로 예약 불가
+    - shortages: 부족한 품목별 {item_id, spec_id, requested, available}
+    """
+    def __init__(self, shortages: list):
+        self.shortages = shortages
+        super().__init__(f"재고가 부족한 품목이 있습니다. ({len(shortages)}건)")
+
+
+_order_numbers = NumberGenerator("ORD")
 
 
 def generate_order_number() -> str:
-    date_str = datetime.now().strftime("%Y%m%d")
-    unique = uuid.uuid4().hex[:8].upper()
-    return f"ORD-{date_str}-{unique}"
+    """주문번호 ORD-YYYYMMDD-XXXXXXXXXX (시간순, 워커 ID + 순번, 저장 시 충돌하면 새 번호로 재시도)"""
+    return _order_numbers.next()
 
 
 def create_order(db: Session, user_id: int, order_data: OrderCreate) -> Order:
@@ -38,30 +54,32 @@ def create_order(db: Session, user_id: int, order_data: OrderCreate) -> Order:
         used_point=0,
         used_voucher_amount=0,
     )
-    db.add(order)
-    db.flush()
+    flush_numbered(db, order, "order_number", generate_order_number)
     
     total_amount = 0
     total_point = 0
     total_voucher = 0
-    order_items_list = []
+    order_item_rows = []
+    
+    # 주문 품목 규격 가격을 한 번에 조회
+    spec_ids = {item_data.spec_id for item_data in order_data.items if item_data.spec_id}
+    spec_prices = dict(
+        db.query(ClothingSpec.id, ClothingSpec.price).filter(ClothingSpec.id.in_(spec_ids)).all()
+    ) if spec_ids else {}
     
     for item_data in order_data.items:
-        spec = db.query(ClothingSpec).filter(ClothingSpec.id == item_data.spec_id).first() if item_data.spec_id else None
-        unit_price = spec.price if spec else 0
+        unit_price = spec_prices.get(item_data.spec_id, 0)
         total_price = unit_price * item_data.quantity
         
-        order_item = OrderItem(
-            order_id=order.id,
-            item_id=item_data.item_id,
-            spec_id=item_data.spec_id,
-            quantity=item_data.quantity,
-            unit_price=unit_price,
-            total_price=total_price,
-            payment_method=item_data.payment_method,
-        )
-        db.add(order_item)
-        order_items_list.append(order_item)
+        order_item_rows.append({
+            "order_id": order.id,
+            "item_id": item_data.item_id,
+            "spec_id": item_data.spec_id,
+            "quantity": item_data.quantity,
+            "unit_price": unit_price,
+            "total_price": total_price,
+            "payment_method": item_data.payment_method,
+        })
         
         total_amount += total_price
         if item_data.payment_method.value == "point":
@@ -74,20 +92,30 @@ def create_order(db: Session, user_id: int, order_data: OrderCreate) -> Order:
     # 포인트 검증 (마이너스 방지)
     available_point = user.current_point - user.reserved_point
     if total_point > available_point:
+        db.rollback()
         raise ValueError(f"사용 가능한 포인트가 부족합니다. (사용가능: {available_point}P, 필요: {total_point}P)")
     
-    if order_data.order_type == OrderType.ONLINE:
-        order.reserved_point = total_point
-        order.used_point = 0
-        _reserve_points(db, user_id, order.id, total_point)
-        _reserve_inventory(db, order.id, order_data.sales_office_id, order_items_list)
-        order.status = OrderStatus.CONFIRMED
-    else:
-        order.used_point = total_point
-        order.used_voucher_amount = total_voucher
-        _deduct_points(db, user_id, order.id, total_point)
-        _deduct_inventory(db, order.id, order_data.sales_office_id, order_items_list)
-        order.status = OrderStatus.DELIVERED
+    # 주문 품목 일괄 INSERT (품목 수와 무관하게 1회)
+    if order_item_rows:
+        db.execute(insert(OrderItem), order_item_rows)
+    
+    # 포인트/재고 부족 시 먼저 저장(flush)한 주문까지 되돌림
+    try:
+        if order_data.order_type == OrderType.ONLINE:
+            order.reserved_point = total_point
+            order.used_point = 0
+            _reserve_points(db, user_id, order.id, total_point)
+            _reserve_inventory(db, order.id, order_data.sales_office_id, order_data.items)
+            order.status = OrderStatus.CONFIRMED
+        else:
+            order.used_point = total_point
+            order.used_voucher_amount = total_voucher
+            _deduct_points(db, user_id, order.id, total_point)
+            _deduct_inventory(db, order.id, order_data.sales_office_id, order_data.items)
+            order.status = OrderStatus.DELIVERED
+    except ValueError:
+        db.rollback()
+        raise
     
     if order_data.delivery_type:
         delivery = Delivery(
@@ -104,79 +132,434 @@ def create_order(db: Session, user_id: int, order_data: OrderCreate) -> Order:
             delivery.delivered_at = datetime.utcnow()
         db.add(delivery)
     
+    sales_stats_service.record_order(db, order)
+    
     db.commit()
     db.refresh(order)
+    dashboard_cache.invalidate_order(order)
     return order
 
 
 def _reserve_points(db: Session, user_id: int, order_id: int, amount: int) -> None:
-    from app.models.user import User
-    user = db.query(User).filter(User.id == user_id).first()
-    if user and amount > 0:
-        user.reserved_point += amount
-        transaction = PointTransaction(
-            user_id=user_id,
-            transaction_type=TransactionType.RESERVE,
-            amount=amount,
-            balance_after=user.current_point,
-            reserved_after=user.reserved_point,
+    if amount > 0:
+        point_ledger.reserve(
+            db, user_id, amount,
+            insufficient_message="사용 가능한 포인트가 부족합니다. (사용가능: {available}P, 필요: {required}P)",
             order_id=order_id,
             description="주문 포인트 예약",
         )
-        db.add(transaction)
 
 
 def _reserve_inventory(db: Session, order_id: int, sales_office_id: int, items: list) -> None:
-    """온라인 주문 생성 시 재고 예약"""
-    for item in items:
-        inventory = db.query(Inventory).filter(
-            Inventory.sales_office_id == sales_office_id,
-            Inventory.item_id == item.item_id,
-            Inventory.spec_id == item.spec_id,
-        ).first()
-        if inventory:
-            inventory.reserved_quantity += item.quantity
+    """온라인 주문 생성 시 재고 예약 (가용 재고 조건부, 부족 시 InsufficientStockError)"""
+    apply_inventory_changes(db, sales_office_id, items, reserved_sign=1, require_available=True)
 
 
 def _deduct_points(db: Session, user_id: int, order_id: int, amount: int) -> None:
-    from app.models.user import User
-    user = db.query(User).filter(User.id == user_id).first()
-    if user and amount > 0:
-        user.current_point -= amount
-        transaction = PointTransaction(
-            user_id=user_id,
+    if amount > 0:
+        point_ledger.use(
+            db, user_id, amount,
             transaction_type=TransactionType.DEDUCT,
-            amount=amount,
-            balance_after=user.current_point,
-            reserved_after=user.reserved_point,
+            insufficient_message="사용 가능한 포인트가 부족합니다. (사용가능: {available}P, 필요: {required}P)",
             order_id=order_id,
             description="오프라인 구매 포인트 차감",
         )
-        db.add(transaction)
 
 
 def _deduct_inventory(db: Session, order_id: int, sales_office_id: int, items: list) -> None:
-    from app.models.user import User
+    apply_inventory_changes(
+        db, sales_office_id, items,
+        quantity_sign=-1,
+        history={
+            "adjustment_type": AdjustmentType.DECREASE,
+            "reason": "오프라인 판매",
+            "adjusted_by": 1,
+            "order_id": order_id,
+        },
+    )
+
+
+def _load_inventory_ids(db: Session, sales_office_id: int, items: list) -> dict:
+    """주문 품목에 해당하는 판매소 재고 행을 한 번의 쿼리로 조회 - {(item_id, spec_id): inventory_id}"""
+    item_ids = {item.item_id for item in items}
+    if not item_ids:
+        return {}
+    rows = db.query(Inventory.id, Inventory.item_id, Inventory.spec_id).filter(
+        Inventory.sales_office_id == sales_office_id,
+        Inventory.item_id.in_(item_ids),
+    ).all()
+    return {(row.item_id, row.spec_id): row.id for row in rows}
+
+
+def apply_inventory_changes(
+    db: Session,
+    sales_office_id: int,
+    items: list,
+    quantity_sign: int = 0,
+    reserved_sign: int = 0,
+    guard_reserved: bool = False,
+    require_available: bool = False,
+    history: Optional[dict] = None,
+    history_keys: tuple = (),
+) -> None:
+    """
+    주문 품목 수량만큼 재고를 일괄 변경
+    - 재고 조회 1회, CASE 식 UPDATE ... RETURNING 1회, 이력 일괄 INSERT 1회 (품목 수와 무관)
+    
+    Args:
+        items: item_id, spec_id, quantity 속성을 가진 주문 품목 목록
+        quantity_sign: 실재고 변경 방향 (+1 증가, -1 감소, 0 변경 없음)
+        reserved_sign: 예약 수량 변경 방향 (+1 증가, -1 감소, 0 변경 없음)
+        guard_reserved: 예약 수량이 부족하면 해당 재고의 예약 수량은 변경하지 않음
+        require_available: 가용 재고(quantity - reserved_quantity)가 변경량 이상인 행만 변경,
+            하나라도 부족하거나 판매소에 재고 행이 없으면 InsufficientStockError (호출자가 주문 트랜잭션을 롤백)
+        history: InventoryHistory 공통 값 (adjustment_type, reason, adjusted_by, order_id), None 이면 이력 미기록
+        history_keys: 품목별로 이력에 기록할 속성 (여러 주문의 품목을 한 번에 처리할 때 ("order_id",))
+    """
+    inventory_ids = _load_inventory_ids(db, sales_office_id, items)
+    
+    deltas = {}
+    lines = []
+    missing = {}
     for item in items:
-        inventory = db.query(Inventory).filter(
-            Inventory.sales_office_id == sales_office_id,
-            Inventory.item_id == item.item_id,
-            Inventory.spec_id == item.spec_id,
-        ).first()
-        if inventory:
-            before = inventory.quantity
-            inventory.quantity -= item.quantity
-            history = InventoryHistory(
-                inventory_id=inventory.id,
-                adjustment_type=AdjustmentType.DECREASE,
-                quantity=item.quantity,
-                before_quantity=before,
-                after_quantity=inventory.quantity,
-                reason="오프라인 판매",
-                adjusted_by=1,
-                order_id=order_id,
+        inventory_id = inventory_ids.get((item.item_id, item.spec_id))
+        if inventory_id is None:
+            # 판매소 미취급 품목: 가용 재고 확인 시 가용 0 으로 부족 처리
+            key = (item.item_id, item.spec_id)
+            missing[key] = missing.get(key, 0) + item.quantity
+            continue
+        deltas[inventory_id] = deltas.get(inventory_id, 0) + item.quantity
+        lines.append((inventory_id, item))
+    unstocked = [
+        {"item_id": item_id, "spec_id": spec_id, "requested": quantity, "available": 0}
+        for (item_id, spec_id), quantity in missing.items()
+    ] if require_available else []
+    if not deltas:
+        if unstocked:
+            raise InsufficientStockError(unstocked)
+        return
+    
+    delta = case(deltas, value=Inventory.id, else_=0)
+    values = {}
+    if quantity_sign:
+        values["quantity"] = Inventory.quantity + quantity_sign * delta
+    if reserved_sign:
+        new_reserved = Inventory.reserved_quantity + reserved_sign * delta
+        if guard_reserved:
+            new_reserved = case((Inventory.reserved_quantity >= delta, new_reserved), else_=Inventory.reserved_quantity)
+        values["reserved_quantity"] = new_reserved
+    
+    conditions = [Inventory.id.in_(list(deltas))]
+    if require_available:
+        conditions.append(Inventory.quantity - Inventory.reserved_quantity >= delta)
+    
+    after_quantities = dict(execute_with_retry(
+        db,
+        update(Inventory)
+        .where(*conditions)
+        .values(**values)
+        .returning(Inventory.id, Inventory.quantity)
+        .execution_options(synchronize_session=False),
+    ).all())
+    
+    if require_available and (unstocked or len(after_quantities) < len(deltas)):
+        short_ids = [inventory_id for inventory_id in deltas if inventory_id not in after_quantities]
+        shortages = _collect_shortages(db, short_ids, deltas) if short_ids else []
+        raise InsufficientStockError(shortages + unstocked)
+    
+    if history:
+        # 같은 재고에 여러 품목이 있으면 품목 순서대로 이전/이후 수량을 이어서 기록
+        running = {
+            inventory_id: after_quantities[inventory_id] - quantity_sign * deltas[inventory_id]
+            for inventory_id in deltas
+        }
+        rows = []
+        for inventory_id, item in lines:
+            before = running[inventory_id]
+            running[inventory_id] = before + quantity_sign * item.quantity
+            rows.append({
+                "inventory_id": inventory_id,
+                "quantity": item.quantity,
+                "before_quantity": before,
+                "after_quantity": running[inventory_id],
+                **history,
+                **{key: getattr(item, key) for key in history_keys},
+            })
+        db.execute(insert(InventoryHistory), rows)
+
+
+def _collect_shortages(db: Session, inventory_ids: list, deltas: dict) -> list:
+    """재고 부족 품목의 요청 수량과 현재 가용 수량 조회"""
+    rows = db.query(
+        Inventory.id, Inventory.item_id, Inventory.spec_id, Inventory.quantity, Inventory.reserved_quantity,
+    ).filter(Inventory.id.in_(inventory_ids)).all()
+    return [
+        {
+            "item_id": row.item_id,
+            "spec_id": row.spec_id,
+            "requested": deltas[row.id],
+            "available": row.quantity - row.reserved_quantity,
+        }
+        for row in rows
+    ]
+
+
+# 일괄 주문 청크 크기 (청크마다 커밋)
+BATCH_CHUNK_SIZE = 100
+
+
+class _OrderLine(NamedTuple):
+    """일괄 주문의 재고 변경 대상 품목"""
+    order_id: int
+    item_id: int
+    spec_id: Optional[int]
+    quantity: int
+
+
+def create_orders(db: Session, orders: list, staff_id: int, chunk_size: int = BATCH_CHUNK_SIZE) -> list[dict]:
+    """
+    여러 사용자 주문 일괄 생성 (피복 지급일 부대 일괄 주문 등, 요청 순서대로 주문별 결과 반환)
+    - 사용자 잔액, 규격 가격, 재고를 각각 1회 조회하고 포인트/가용 재고는 요청 순서대로 메모리에서 검증
+    - 검증을 통과한 주문은 chunk_size 단위로 주문/품목/배송/포인트 거래/재고/롤업을 일괄 INSERT·UPDATE 후 커밋
+    - 조회 이후 다른 요청이 포인트/재고를 먼저 사용해 청크 적용이 실패하면 해당 청크만 create_order 로 개별 처리
+
+    Args:
+        orders: user_id 를 포함한 주문 목록 (BatchOrderCreate)
+        staff_id: 등록자 ID (오프라인 판매 재고 이력)
+    """
+    from app.models.user import User
+
+    results: list = [None] * len(orders)
+    if not orders:
+        return results
+
+    user_ids = {order_data.user_id for order_data in orders}
+    balances = {
+        row.id: row.current_point - row.reserved_point
+        for row in db.query(User.id, User.current_point, User.reserved_point).filter(User.id.in_(user_ids))
+    }
+    spec_ids = {item.spec_id for order_data in orders for item in order_data.items if item.spec_id}
+    spec_prices = dict(
+        db.query(ClothingSpec.id, ClothingSpec.price).filter(ClothingSpec.id.in_(spec_ids)).all()
+    ) if spec_ids else {}
+    office_ids = {order_data.sales_office_id for order_data in orders}
+    item_ids = {item.item_id for order_data in orders for item in order_data.items}
+    available_stock = {
+        (row.sales_office_id, row.item_id, row.spec_id): row.quantity - row.reserved_quantity
+        for row in db.query(
+            Inventory.sales_office_id, Inventory.item_id, Inventory.spec_id, Inventory.quantity, Inventory.reserved_quantity,
+        ).filter(Inventory.sales_office_id.in_(office_ids), Inventory.item_id.in_(item_ids))
+    } if item_ids else {}
+
+    plans = []
+    for index, order_data in enumerate(orders):
+        if order_data.user_id not in balances:
+            results[index] = _batch_failure(index, order_data, "사용자를 찾을 수 없습니다.")
+            continue
+
+        items = []
+        total_amount = total_point = total_voucher = 0
+        for item_data in order_data.items:
+            unit_price = spec_prices.get(item_data.spec_id, 0)
+            total_price = unit_price * item_data.quantity
+            items.append({
+                "item_id": item_data.item_id,
+                "spec_id": item_data.spec_id,
+                "quantity": item_data.quantity,
+                "unit_price": unit_price,
+                "total_price": total_price,
+                "payment_method": item_data.payment_method,
+            })
+            total_amount += total_price
+            if item_data.payment_method.value == "point":
+                total_point += total_price
+            else:
+                total_voucher += total_price
+
+        available_point = balances[order_data.user_id]
+        if total_point > available_point:
+            results[index] = _batch_failure(
+                index, order_data, f"사용 가능한 포인트가 부족합니다. (사용가능: {available_point}P, 필요: {total_point}P)",
+            )
+            continue
+
+        # 온라인 주문은 가용 재고 확인, 판매소 미취급 품목은 가용 0 (create_order 와 동일)
+        requested = {}
+        for item_data in order_data.items:
+            key = (order_data.sales_office_id, item_data.item_id, item_data.spec_id)
+            requested[key] = requested.get(key, 0) + item_data.quantity
+        if order_data.order_type == OrderType.ONLINE:
+            shortages = [
+                {"item_id": key[1], "spec_id": key[2], "requested": quantity, "available": available_stock.get(key, 0)}
+                for key, quantity in requested.items()
+                if available_stock.get(key, 0) < quantity
+            ]
+            if shortages:
+                error = InsufficientStockError(shortages)
+                results[index] = _batch_failure(index, order_data, str(error), shortages=shortages)
+                continue
+
+        balances[order_data.user_id] -= total_point
+        for key, quantity in requested.items():
+            # 재고 행이 있는 품목만 변경
+            if key in available_stock:
+                available_stock[key] -= quantity
+        plans.append({
+            "index": index,
+            "order_data": order_data,
+            "items": items,
+            "total_amount": total_amount,
+            "total_point": total_point,
+            "total_voucher": total_voucher,
+        })
+
+    for start in range(0, len(plans), chunk_size):
+        chunk = plans[start:start + chunk_size]
+        try:
+            chunk_results = _create_orders_chunk(db, chunk, staff_id)
+            db.commit()
+            dashboard_cache.invalidate(*{
+                key
+                for plan in chunk
+                for key in (
+                    dashboard_cache.sales_office_key(plan["order_data"].sales_office_id),
+                    dashboard_cache.user_key(plan["order_data"].user_id),
+                )
+            })
+        except (ValueError, IntegrityError):
+            # 조회 이후 잔액/재고가 바뀐 경우: 해당 청크만 개별 주문으로 재처리
+            db.rollback()
+            chunk_results = _create_orders_each(db, chunk)
+        for plan, result in zip(chunk, chunk_results):
+            results[plan["index"]] = result
+    return results
+
+
+def _batch_failure(index: int, order_data, message: str, **extra) -> dict:
+    return {"index": index, "user_id": order_data.user_id, "success": False, "message": message, **extra}
+
+
+def _batch_success(index: int, user_id: int, order_id: int, order_number: str, status: OrderStatus) -> dict:
+    return {
+        "index": index,
+        "user_id": user_id,
+        "success": True,
+        "order_id": order_id,
+        "order_number": order_number,
+        "status": status.value,
+    }
+
+
+def _create_orders_chunk(db: Session, chunk: list, staff_id: int) -> list[dict]:
+    """
+    검증된 주문 청크 일괄 저장 (커밋은 호출자가 수행)
+    - 주문 INSERT ... RETURNING, 품목/배송 일괄 INSERT
+    - 포인트: 사용자별 CASE 식 UPDATE 1회 + 거래 내역 일괄 INSERT (잔액 조건 불충족 시 InsufficientPointError)
+    - 재고: 판매소/주문 유형별 apply_inventory_changes (온라인은 가용 재고 조건, 부족 시 InsufficientStockError)
+    """
+    now = datetime.utcnow()
+    order_rows = []
+    for plan in chunk:
+        order_data = plan["order_data"]
+        online = order_data.order_type == OrderType.ONLINE
+        order_rows.append({
+            "order_number": generate_order_number(),
+            "user_id": order_data.user_id,
+            "sales_office_id": order_data.sales_office_id,
+            "order_type": order_data.order_type,
+            "status": OrderStatus.CONFIRMED if online else OrderStatus.DELIVERED,
+            "total_amount": plan["total_amount"],
+            "reserved_point": plan["total_point"] if online else 0,
+            "used_point": 0 if online else plan["total_point"],
+            "used_voucher_amount": 0 if online else plan["total_voucher"],
+            "ordered_at": now,
+        })
+    order_ids = insert_numbered(db, Order, order_rows, "order_number", generate_order_number)
+
+    item_rows = []
+    delivery_rows = []
+    point_entries = []
+    inventory_lines = {}
+    for plan, order_row, order_id in zip(chunk, order_rows, order_ids):
+        order_data = plan["order_data"]
+        online = order_data.order_type == OrderType.ONLINE
+        for item in plan["items"]:
+            item_rows.append({"order_id": order_id, **item})
+            inventory_lines.setdefault((order_data.sales_office_id, online), []).append(
+                _OrderLine(order_id, item["item_id"], item["spec_id"], item["quantity"])
             )
-            db.add(history)
+
+        if order_data.delivery_type:
+            delivery_rows.append({
+                "order_id": order_id,
+                "delivery_type": order_data.delivery_type,
+                "status": DeliveryStatus.PREPARING if online else DeliveryStatus.DELIVERED,
+                "delivery_location_id": order_data.delivery_location_id,
+                "recipient_name": order_data.recipient_name,
+                "recipient_phone": order_data.recipient_phone,
+                "shipping_address": order_data.shipping_address,
+                "delivery_note": order_data.delivery_note,
+                "delivered_at": None if online else now,
+            })
+
+        amount = plan["total_point"]
+        if amount > 0:
+            point_entries.append({
+                "user_id": order_data.user_id,
+                "transaction_type": TransactionType.RESERVE if online else TransactionType.DEDUCT,
+                "amount": amount,
+                "current_delta": 0 if online else -amount,
+                "reserved_delta": amount if online else 0,
+                "min_available": amount,
+                "order_id": order_id,
+                "description": "주문 포인트 예약" if online else "오프라인 구매 포인트 차감",
+            })
+
+    if item_rows:
+        db.execute(insert(OrderItem), item_rows)
+    if delivery_rows:
+        db.execute(insert(Delivery), delivery_rows)
+    point_ledger.apply_changes(db, point_entries)
+
+    for (sales_office_id, online), lines in inventory_lines.items():
+        if online:
+            apply_inventory_changes(db, sales_office_id, lines, reserved_sign=1, require_available=True)
+        else:
+            apply_inventory_changes(
+                db, sales_office_id, lines,
+                quantity_sign=-1,
+                history={"adjustment_type": AdjustmentType.DECREASE, "reason": "오프라인 판매", "adjusted_by": staff_id},
+                history_keys=("order_id",),
+            )
+
+    sales_stats_service.record_new_orders(db, order_rows, [
+        {"sales_office_id": order_row["sales_office_id"], "ordered_at": now, **item}
+        for plan, order_row in zip(chunk, order_rows)
+        for item in plan["items"]
+    ])
+    return [
+        _batch_success(plan["index"], order_row["user_id"], order_id, order_row["order_number"], order_row["status"])
+        for plan, order_row, order_id in zip(chunk, order_rows, order_ids)
+    ]
+
+
+def _create_orders_each(db: Session, chunk: list) -> list[dict]:
+    """청크 일괄 저장 실패 시 주문별 create_order 로 처리 (주문별 성공/실패 사유)"""
+    results = []
+    for plan in chunk:
+        order_data = plan["order_data"]
+        try:
+            order = create_order(db, order_data.user_id, order_data)
+        except InsufficientStockError as e:
+            results.append(_batch_failure(plan["index"], order_data, str(e), shortages=e.shortages))
+        except ValueError as e:
+            results.append(_batch_failure(plan["index"], order_data, str(e)))
+        except IntegrityError:
+            db.rollback()
+            results.append(_batch_failure(plan["index"], order_data, "주문을 저장할 수 없습니다. (품목/판매소 정보 확인)"))
+        else:
+            results.append(_batch_success(plan["index"], order.user_id, order.id, order.order_number, order.status))
+    return results
 
 
 def get_orders(db: Session, user_id: Optional[int] = None, skip: int = 0, limit: int = 20) -> tuple[list, int]:
@@ -215,13 +598,15 @@ def cancel_order(db: Session, order_id: int, user_id: int, cancel_data: OrderCan
     if order.order_type == OrderType.ONLINE:
         _release_reserved_inventory(db, order)
     
-    order.status = OrderStatus.CANCELLED
+    with sales_stats_service.track_order(db, order):
+        order.status = OrderStatus.CANCELLED
     order.cancelled_at = datetime.utcnow()
     order.cancel_reason = cancel_data.reason
     order.cancelled_by = user_id
     
     db.commit()
     db.refresh(order)
+    dashboard_cache.invalidate_order(order)
     return order
 
 
@@ -240,83 +625,52 @@ def force_cancel_order(db: Session, order_id: int, admin_id: int, cancel_data: O
         _refund_points(db, order.user_id, order_id, order.used_point)
         _restore_inventory(db, order_id, order.sales_office_id, order.items)
     
-    order.status = OrderStatus.CANCELLED
+    with sales_stats_service.track_order(db, order):
+        order.status = OrderStatus.CANCELLED
     order.cancelled_at = datetime.utcnow()
     order.cancel_reason = cancel_data.reason
     order.cancelled_by = admin_id
     
     db.commit()
     db.refresh(order)
+    dashboard_cache.invalidate_order(order)
     return order
 
 
 def _release_points(db: Session, user_id: int, order_id: int, amount: int) -> None:
-    from app.models.user import User
-    user = db.query(User).filter(User.id == user_id).first()
-    if user and amount > 0:
-        user.reserved_point -= amount
-        transaction = PointTransaction(
-            user_id=user_id,
-            transaction_type=TransactionType.RELEASE,
-            amount=amount,
-            balance_after=user.current_point,
-            reserved_after=user.reserved_point,
+    if amount > 0:
+        point_ledger.release(
+            db, user_id, amount,
             order_id=order_id,
             description="주문 취소 포인트 해제",
         )
-        db.add(transaction)
 
 
 def _refund_points(db: Session, user_id: int, order_id: int, amount: int) -> None:
-    from app.models.user import User
-    user = db.query(User).filter(User.id == user_id).first()
-    if user and amount > 0:
-        user.current_point += amount
-        transaction = PointTransaction(
-            user_id=user_id,
-            transaction_type=TransactionType.REFUND,
-            amount=amount,
-            balance_after=user.current_point,
-            reserved_after=user.reserved_point,
+    if amount > 0:
+        point_ledger.credit(
+            db, user_id, amount,
             order_id=order_id,
             description="주문 취소 포인트 환불",
         )
-        db.add(transaction)
 
 
 def _release_reserved_inventory(db: Session, order: Order) -> None:
     """온라인 주문 취소 시 예약 재고 해제"""
-    for order_item in order.items:
-        inventory = db.query(Inventory).filter(
-            Inventory.sales_office_id == order.sales_office_id,
-            Inventory.item_id == order_item.item_id,
-            Inventory.spec_id == order_item.spec_id,
-        ).first()
-        if inventory and inventory.reserved_quantity >= order_item.quantity:
-            inventory.reserved_quantity -= order_item.quantity
+    apply_inventory_changes(db, order.sales_office_id, order.items, reserved_sign=-1, guard_reserved=True)
 
 
 def _restore_inventory(db: Session, order_id: int, sales_office_id: int, items: list) -> None:
-    for item in items:
-        inventory = db.query(Inventory).filter(
-            Inventory.sales_office_id == sales_office_id,
-            Inventory.item_id == item.item_id,
-            Inventory.spec_id == item.spec_id,
-        ).first()
-        if inventory:
-            before = inventory.quantity
-            inventory.quantity += item.quantity
-            history = InventoryHistory(
-                inventory_id=inventory.id,
-                adjustment_type=AdjustmentType.RETURN,
-                quantity=item.quantity,
-                before_quantity=before,
-                after_quantity=inventory.quantity,
-                reason="주문 취소 재고 복구",
-                adjusted_by=1,
-                order_id=order_id,
-            )
-            db.add(history)
+    apply_inventory_changes(
+        db, sales_office_id, items,
+        quantity_sign=1,
+        history={
+            "adjustment_type": AdjustmentType.RETURN,
+            "reason": "주문 취소 재고 복구",
+            "adjusted_by": 1,
+            "order_id": order_id,
+        },
+    )
 
 
 def update_delivery(db: Session, order_id: int, delivery_data: DeliveryUpdate) -> Optional[Order]:
@@ -344,6 +698,7 @@ def update_delivery(db: Session, order_id: int, delivery_data: DeliveryUpdate) -
     
     db.commit()
     db.refresh(order)
+    dashboard_cache.invalidate_order(order)
     return order
 
 
@@ -372,52 +727,30 @@ def receive_order(db: Session, order_id: int, user_id: int) -> Optional[Order]:
     
     db.commit()
     db.refresh(order)
+    dashboard_cache.invalidate_order(order)
     return order
 
 
 def _confirm_inventory_deduction(db: Session, order: Order) -> None:
-    """온라인 주문 수령 시 재고 확정 차감"""
-    for order_item in order.items:
-        inventory = db.query(Inventory).filter(
-            Inventory.sales_office_id == order.sales_office_id,
-            Inventory.item_id == order_item.item_id,
-            Inventory.spec_id == order_item.spec_id,
-        ).first()
-        if inventory:
-            before = inventory.quantity
-            reserved_before = inventory.reserved_quantity
-            
-            # 예약 수량 감소
-            inventory.reserved_quantity -= order_item.quantity
-            # 실재고 감소
-            inventory.quantity -= order_item.quantity
-            
-            history = InventoryHistory(
-                inventory_id=inventory.id,
-                adjustment_type=AdjustmentType.DECREASE,
-                quantity=order_item.quantity,
-                before_quantity=before,
-                after_quantity=inventory.quantity,
-                reason="온라인 주문 수령 확정",
-                adjusted_by=order.user_id,
-                order_id=order.id,
-            )
-            db.add(history)
+    """온라인 주문 수령 시 재고 확정 차감 (예약 수량 → 실재고 차감)"""
+    apply_inventory_changes(
+        db, order.sales_office_id, order.items,
+        quantity_sign=-1,
+        reserved_sign=-1,
+        history={
+            "adjustment_type": AdjustmentType.DECREASE,
+            "reason": "온라인 주문 수령 확정",
+            "adjusted_by": order.user_id,
+            "order_id": order.id,
+        },
+    )
 
 
 def _confirm_points(db: Session, user_id: int, order_id: int, amount: int) -> None:
-    from app.models.user import User
-    user = db.query(User).filter(User.id == user_id).first()
-    if user and amount > 0:
-        user.current_point -= amount
-        user.reserved_point -= amount
-        transaction = PointTransaction(
-            user_id=user_id,
+    if amount > 0:
+        point_ledger.deduct_reserved(
+            db, user_id, amount,
             transaction_type=TransactionType.USE,
-            amount=amount,
-            balance_after=user.current_point,
-            reserved_after=user.reserved_point,
             order_id=order_id,
             description="배송 완료 포인트 확정 차감",
         )
-        db.add(transaction)
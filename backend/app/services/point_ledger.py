@@ -0,0 +1,193 @@
+"""
+포인트 원장 (Point Ledger)
+- 사용자 포인트 잔액 변경을 조건부 단일 UPDATE ... RETURNING 으로 원자적으로 적용
+- 잔액을 읽어서 계산 후 쓰지 않으므로 동시 주문에서도 갱신 손실(lost update)이 없음
+- 잔액 조건(사용가능/예약 포인트)은 WHERE 절에서 DB 가 검사
+- 커밋은 호출자가 수행 (주문/판매 등 업무 트랜잭션과 함께 커밋)
+"""
+from typing import Optional
+
+from sqlalchemy import case, insert, update
+from sqlalchemy.orm import Session
+
+from app.database import execute_with_retry
+from app.models.user import User
+from app.models.point import PointTransaction, TransactionType
+
+
+class InsufficientPointError(ValueError):
+    """잔액 조건을 만족하지 못해 포인트 변경이 적용되지 않음"""
+    pass
+
+
+def apply_change(
+    db: Session,
+    user_id: int,
+    transaction_type: TransactionType,
+    amount: int,
+    current_delta: int = 0,
+    reserved_delta: int = 0,
+    min_available: int = 0,
+    min_reserved: int = 0,
+    insufficient_message: str = "포인트가 부족합니다",
+    order_id: Optional[int] = None,
+    voucher_id: Optional[int] = None,
+    point_grant_id: Optional[int] = None,
+    description: Optional[str] = None,
+    reason: Optional[str] = None,
+) -> PointTransaction:
+    """
+    포인트 잔액 변경 및 거래 내역 생성
+
+    Args:
+        db: DB 세션
+        user_id: 사용자 ID
+        transaction_type: 거래 유형
+        amount: 거래 금액 (거래 내역 기록용)
+        current_delta: 보유 포인트 변화량
+        reserved_delta: 예약 포인트 변화량
+        min_available: 변경 전 필요한 최소 사용가능 포인트 (보유 - 예약)
+        min_reserved: 변경 전 필요한 최소 예약 포인트
+        insufficient_message: 잔액 부족 시 오류 메시지 ({available}, {reserved}, {required} 치환)
+
+    Returns:
+        PointTransaction: 생성된 거래 내역 (커밋 전)
+    """
+    conditions = [User.id == user_id]
+    if min_available:
+        conditions.append(User.current_point - User.reserved_point >= min_available)
+    if min_reserved:
+        conditions.append(User.reserved_point >= min_reserved)
+
+    stmt = (
+        update(User)
+        .where(*conditions)
+        .values(
+            current_point=User.current_point + current_delta,
+            reserved_point=User.reserved_point + reserved_delta,
+        )
+        .returning(User.current_point, User.reserved_point)
+        .execution_options(synchronize_session="fetch")
+    )
+    row = execute_with_retry(db, stmt).first()
+
+    if row is None:
+        balance = db.query(User.current_point, User.reserved_point).filter(User.id == user_id).first()
+        if balance is None:
+            raise ValueError("사용자를 찾을 수 없습니다")
+        raise InsufficientPointError(insufficient_message.format(
+            available=balance.current_point - balance.reserved_point,
+            reserved=balance.reserved_point,
+            required=max(min_available, min_reserved),
+        ))
+
+    transaction = PointTransaction(
+        user_id=user_id,
+        transaction_type=transaction_type,
+        amount=amount,
+        balance_after=row.current_point,
+        reserved_after=row.reserved_point,
+        order_id=order_id,
+        voucher_id=voucher_id,
+        point_grant_id=point_grant_id,
+        description=description,
+        reason=reason,
+    )
+    db.add(transaction)
+    return transaction
+
+
+def credit(db: Session, user_id: int, amount: int, transaction_type: TransactionType = TransactionType.REFUND, **kwargs) -> PointTransaction:
+    """보유 포인트 증가 (지급/환불)"""
+    return apply_change(db, user_id, transaction_type, amount, current_delta=amount, **kwargs)
+
+
+def use(db: Session, user_id: int, amount: int, transaction_type: TransactionType = TransactionType.USE, **kwargs) -> PointTransaction:
+    """사용가능 포인트 즉시 차감 (보유 - 예약 >= 금액 조건)"""
+    kwargs.setdefault("insufficient_message", "사용 가능한 포인트가 부족합니다 (현재: {available})")
+    return apply_change(
+        db, user_id, transaction_type, amount,
+        current_delta=-amount, min_available=amount, **kwargs,
+    )
+
+
+def reserve(db: Session, user_id: int, amount: int, **kwargs) -> PointTransaction:
+    """포인트 예약 (보유 - 예약 >= 금액 조건)"""
+    kwargs.setdefault("insufficient_message", "예약 가능한 포인트가 부족합니다 (현재: {available})")
+    return apply_change(
+        db, user_id, TransactionType.RESERVE, amount,
+        reserved_delta=amount, min_available=amount, **kwargs,
+    )
+
+
+def release(db: Session, user_id: int, amount: int, **kwargs) -> PointTransaction:
+    """예약 포인트 해제 (예약 >= 금액 조건)"""
+    kwargs.setdefault("insufficient_message", "해제할 예약 포인트가 부족합니다 (현재: {reserved})")
+    return apply_change(
+        db, user_id, TransactionType.RELEASE, amount,
+        reserved_delta=-amount, min_reserved=amount, **kwargs,
+    )
+
+
+def deduct_reserved(db: Session, user_id: int, amount: int, transaction_type: TransactionType = TransactionType.DEDUCT, **kwargs) -> PointTransaction:
+    """예약 포인트 확정 차감 - 보유/예약 모두 감소 (예약 >= 금액 조건)"""
+    kwargs.setdefault("insufficient_message", "차감할 예약 포인트가 부족합니다 (현재: {reserved})")
+    return apply_change(
+        db, user_id, transaction_type, amount,
+        current_delta=-amount, reserved_delta=-amount, min_reserved=amount, **kwargs,
+    )
+
+
+def apply_changes(db: Session, entries: list) -> None:
+    """
+    여러 사용자의 포인트 변경을 일괄 적용 (일괄 주문 등)
+    - 사용자별 변화량을 합산해 CASE 식 UPDATE ... RETURNING 1회, 거래 내역 일괄 INSERT 1회
+    - 사용자별 필요 금액(min_available 합계)만큼 사용가능 포인트가 없으면 InsufficientPointError (호출자가 롤백)
+    - 거래 내역의 잔액(balance_after/reserved_after)은 entries 순서대로 이어서 기록
+
+    Args:
+        entries: user_id, transaction_type, amount, current_delta, reserved_delta, min_available
+            및 거래 내역 값(order_id, description 등)을 가진 dict 목록
+    """
+    if not entries:
+        return
+
+    ledger_keys = ("current_delta", "reserved_delta", "min_available")
+    current_deltas, reserved_deltas, required = {}, {}, {}
+    for entry in entries:
+        user_id = entry["user_id"]
+        current_deltas[user_id] = current_deltas.get(user_id, 0) + entry.get("current_delta", 0)
+        reserved_deltas[user_id] = reserved_deltas.get(user_id, 0) + entry.get("reserved_delta", 0)
+        required[user_id] = required.get(user_id, 0) + entry.get("min_available", 0)
+
+    required_point = case(required, value=User.id, else_=0)
+    stmt = (
+        update(User)
+        .where(User.id.in_(list(required)), User.current_point - User.reserved_point >= required_point)
+        .values(
+            current_point=User.current_point + case(current_deltas, value=User.id, else_=0),
+            reserved_point=User.reserved_point + case(reserved_deltas, value=User.id, else_=0),
+        )
+        .returning(User.id, User.current_point, User.reserved_point)
+        .execution_options(synchronize_session=False)
+    )
+    balances = {row.id: [row.current_point, row.reserved_point] for row in execute_with_retry(db, stmt)}
+    if len(balances) < len(required):
+        short = len(required) - len(balances)
+        raise InsufficientPointError(f"사용 가능한 포인트가 부족한 사용자가 있습니다. ({short}명)")
+
+    # 변경 전 잔액부터 거래 순서대로 누적
+    for user_id, balance in balances.items():
+        balance[0] -= current_deltas[user_id]
+        balance[1] -= reserved_deltas[user_id]
+    rows = []
+    for entry in entries:
+        balance = balances[entry["user_id"]]
+        balance[0] += entry.get("current_delta", 0)
+        balance[1] += entry.get("reserved_delta", 0)
+        rows.append({
+            **{key: value for key, value in entry.items() if key not in ledger_keys},
+            "balance_after": balance[0],
+            "reserved_after": balance[1],
+        })
+    db.execute(insert(PointTransaction), rows)
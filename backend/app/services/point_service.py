@@ -2,21 +2,53 @@
 포인트 서비스
 - 포인트 지급, 사용, 예약, 환불 등 포인트 관련 비즈니스 로직 처리
 """
+import base64
+import json
+import time
 from datetime import date, datetime
-from typing import Optional, List, Tuple
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from typing import Callable, Optional, List, Tuple
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, case, func, insert, select, tuple_, update
 
-from app.models.user import User
+from app.models.user import User, Rank, calculate_service_years
 from app.models.point import PointGrant, PointTransaction, PointType, TransactionType
 from app.schemas.point import (
     PointGrantCreate, PointGrantYearlyCreate, PointGrantResponse,
-    PointTransactionResponse, PointHistoryResponse, MyPointResponse,
+    PointTransactionResponse, PointHistoryResponse, PointHistoryCursorResponse, MyPointResponse,
     PointBulkGrantRequest, PointSingleGrantRequest,
 )
+from app.services import point_ledger
 from app.services.user_service import UserService
 
 
+# 일괄 지급 시 한 번의 INSERT/UPDATE 로 처리할 사용자 수
+BULK_CHUNK_SIZE = 1000
+
+
+def _parse_legacy_reason(description: Optional[str]) -> str:
+    """reason 컬럼 도입 이전 거래의 사유를 설명 문자열 '...(사유)' 에서 추출"""
+    if description and "(" in description:
+        return description.split("(")[1].rstrip(")")
+    return "기타"
+
+
+def encode_history_cursor(created_at: datetime, transaction_id: int) -> str:
+    """거래 내역 커서 인코딩 (created_at, id) → 불투명 문자열"""
+    raw = json.dumps({"t": created_at.isoformat(), "i": transaction_id})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_history_cursor(cursor: str) -> Tuple[datetime, int]:
+    """거래 내역 커서 디코딩 (잘못된 커서는 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(raw["t"]), int(raw["i"])
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("잘못된 커서입니다")
+
+
 class PointService:
     """
     포인트 관련 비즈니스 로직을 처리하는 서비스 클래스
@@ -94,7 +126,12 @@ class PointService:
 
         total = query.count()
         offset = (page - 1) * page_size
-        items = query.order_by(PointTransaction.created_at.desc()).offset(offset).limit(page_size).all()
+        items = (
+            query.order_by(PointTransaction.created_at.desc(), PointTransaction.id.desc())
+            .offset(offset)
+            .limit(page_size)
+            .all()
+        )
 
         return PointHistoryResponse(
             items=[self._transaction_to_response(t) for t in items],
@@ -103,6 +140,68 @@ class PointService:
             page_size=page_size,
         )
 
+    def get_history_cursor(
+        self,
+        user_id: int,
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        transaction_type: Optional[TransactionType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        include_total: bool = False,
+    ) -> PointHistoryCursorResponse:
+        """
+        사용자의 포인트 거래 내역 조회 (커서 기반)
+        - (created_at, id) 키셋으로 페이지를 이어가므로 깊은 페이지도 첫 페이지와 비용이 같음
+        - (user_id, created_at DESC, id DESC) 인덱스를 그대로 따라 읽음
+        
+        Args:
+            user_id: 사용자 ID
+            cursor: 이전 응답의 next_cursor (첫 페이지는 None)
+            page_size: 페이지 크기
+            transaction_type: 거래 유형 필터 (선택)
+            start_date: 시작일 필터 (선택)
+            end_date: 종료일 필터 (선택)
+            include_total: 전체 건수 포함 여부 (COUNT 쿼리 추가 실행)
+            
+        Returns:
+            PointHistoryCursorResponse: 거래 내역 목록 및 다음 커서
+        """
+        query = self.db.query(PointTransaction).filter(PointTransaction.user_id == user_id)
+
+        if transaction_type:
+            query = query.filter(PointTransaction.transaction_type == transaction_type)
+        if start_date:
+            query = query.filter(PointTransaction.created_at >= start_date)
+        if end_date:
+            query = query.filter(PointTransaction.created_at < end_date)
+
+        total = query.count() if include_total else None
+
+        if cursor:
+            cursor_created_at, cursor_id = decode_history_cursor(cursor)
+            query = query.filter(
+                tuple_(PointTransaction.created_at, PointTransaction.id) < tuple_(cursor_created_at, cursor_id)
+            )
+
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        rows = (
+            query.order_by(PointTransaction.created_at.desc(), PointTransaction.id.desc())
+            .limit(page_size + 1)
+            .all()
+        )
+        has_more = len(rows) > page_size
+        items = rows[:page_size]
+        next_cursor = encode_history_cursor(items[-1].created_at, items[-1].id) if has_more else None
+
+        return PointHistoryCursorResponse(
+            items=[self._transaction_to_response(t) for t in items],
+            next_cursor=next_cursor,
+            has_more=has_more,
+            page_size=page_size,
+            total=total,
+        )
+
     def get_grant_history(
         self,
         page: int = 1,
@@ -118,28 +217,46 @@ class PointService:
         Returns:
             dict: 지급 내역 목록 (사용자 정보 포함)
         """
-        query = self.db.query(PointTransaction).filter(
-            PointTransaction.transaction_type == TransactionType.GRANT
+        query = (
+            self.db.query(
+                PointTransaction.id,
+                PointTransaction.created_at,
+                PointTransaction.amount,
+                PointTransaction.reason,
+                PointTransaction.description,
+                User.id.label("user_id"),
+                User.name.label("user_name"),
+                User.service_number,
+                User.unit,
+            )
+            .outerjoin(User, User.id == PointTransaction.user_id)
+            .filter(PointTransaction.transaction_type == TransactionType.GRANT)
         )
 
-        total = query.count()
+        total = self.db.query(func.count(PointTransaction.id)).filter(
+            PointTransaction.transaction_type == TransactionType.GRANT
+        ).scalar()
         offset = (page - 1) * page_size
-        items = query.order_by(PointTransaction.created_at.desc()).offset(offset).limit(page_size).all()
+        rows = (
+            query.order_by(PointTransaction.created_at.desc(), PointTransaction.id.desc())
+            .offset(offset)
+            .limit(page_size)
+            .all()
+        )
 
         result = []
-        for t in items:
-            user = self.db.query(User).filter(User.id == t.user_id).first()
+        for t in rows:
             result.append({
                 "id": t.id,
                 "createdAt": t.created_at.isoformat() if t.created_at else None,
                 "user": {
-                    "id": user.id if user else None,
-                    "name": user.name if user else "알 수 없음",
-                    "employeeId": user.service_number if user else None,
-                    "unit": user.unit if user else None,
+                    "id": t.user_id,
+                    "name": t.user_name if t.user_id else "알 수 없음",
+                    "employeeId": t.service_number,
+                    "unit": t.unit,
                 },
                 "amount": t.amount,
-                "reason": t.description.split("(")[1].rstrip(")") if t.description and "(" in t.description else "기타",
+                "reason": t.reason or _parse_legacy_reason(t.description),
                 "note": t.description,
             })
 
@@ -195,67 +312,222 @@ class PointService:
             granted_by=granted_by,
         )
         self.db.add(grant)
+        self.db.flush()
 
-        # 사용자 포인트 증가
-        user.current_point += grant.total_amount
-
-        # 거래 내역 생성
-        transaction = PointTransaction(
-            user_id=data.user_id,
+        # 사용자 포인트 증가 및 거래 내역 생성
+        point_ledger.credit(
+            self.db,
+            data.user_id,
+            grant.total_amount,
             transaction_type=TransactionType.GRANT,
-            amount=grant.total_amount,
-            balance_after=user.current_point,
-            reserved_after=user.reserved_point,
             point_grant_id=grant.id,
             description=data.description or f"{data.year}년 {data.point_type.value} 포인트 지급",
+            reason=data.point_type.value,
         )
-        self.db.add(transaction)
 
         self.db.commit()
         self.db.refresh(grant)
         return grant
 
-    def grant_yearly(self, data: PointGrantYearlyCreate, granted_by: Optional[int] = None) -> Tuple[int, List[str]]:
+    def grant_yearly(
+        self,
+        data: PointGrantYearlyCreate,
+        granted_by: Optional[int] = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Tuple[int, List[str]]:
         """
         연간 포인트 일괄 지급
-        - 대상 사용자의 연간 포인트 자동 계산 후 지급
+        - 대상 사용자와 계급을 한 번의 쿼리로 조회하고 연간 포인트는 메모리에서 계산
+        - 기존 지급 내역은 같은 쿼리의 LEFT JOIN (anti-join) 으로 한 번에 확인
+        - 청크 단위로 PointGrant/PointTransaction 일괄 INSERT, 사용자 포인트 일괄 UPDATE 후 커밋
         
         Args:
             data: 지급 정보 (연도, 대상 사용자 ID 목록)
             granted_by: 지급자 ID
+            chunk_size: 한 번에 처리할 사용자 수
+            on_progress: 청크 처리 후 호출되는 콜백 (처리 건수, 전체 건수)
             
         Returns:
             Tuple[int, List[str]]: (지급 성공 수, 오류 메시지 목록)
         """
+        existing_grant = aliased(PointGrant)
+        query = (
+            self.db.query(
+                User.id,
+                User.name,
+                User.service_number,
+                User.enlistment_date,
+                User.retirement_date,
+                Rank.annual_point,
+                Rank.service_year_bonus,
+                existing_grant.id.label("existing_grant_id"),
+            )
+            .outerjoin(Rank, Rank.id == User.rank_id)
+            .outerjoin(
+                existing_grant,
+                and_(
+                    existing_grant.user_id == User.id,
+                    existing_grant.year == data.year,
+                    existing_grant.point_type == data.point_type,
+                ),
+            )
+        )
         if data.user_ids:
-            users = [self.user_service.get_by_id(uid) for uid in data.user_ids]
-            users = [u for u in users if u is not None]
+            query = query.filter(User.id.in_(data.user_ids))
         else:
-            users = self.db.query(User).filter(User.is_active == True, User.rank_id != None).all()
+            query = query.filter(User.is_active == True, User.rank_id != None)
 
         granted_count = 0
         errors = []
+        targets = []
+
+        for row in query.order_by(User.id).all():
+            if row.existing_grant_id is not None:
+                errors.append(
+                    f"{row.name}({row.service_number}): "
+                    f"{data.year}년 {data.point_type.value} 포인트가 이미 지급되었습니다"
+                )
+                continue
+
+            # 연간 포인트 자동 계산
+            if row.annual_point is None:
+                calc = {"base_amount": 0, "service_year_bonus": 0, "daily_calc_amount": 0}
+            else:
+                calc = UserService.calculate_yearly_amounts(
+                    annual_point=row.annual_point,
+                    service_year_bonus=row.service_year_bonus,
+                    service_years=calculate_service_years(row.enlistment_date),
+                    retirement_date=row.retirement_date,
+                    year=data.year,
+                )
+            targets.append({
+                "user_id": row.id,
+                "name": row.name,
+                "service_number": row.service_number,
+                "base_amount": calc["base_amount"],
+                "service_year_bonus": calc["service_year_bonus"],
+                "daily_calc_amount": calc["daily_calc_amount"],
+            })
 
-        for user in users:
+        total = len(targets)
+        for start in range(0, total, chunk_size):
+            chunk = targets[start:start + chunk_size]
             try:
-                # 연간 포인트 자동 계산
-                calc = self.user_service.calculate_yearly_point(user, data.year, data.grant_date)
+                self._grant_yearly_chunk(chunk, data, granted_by)
+                self.db.commit()
+                granted_count += len(chunk)
+            except IntegrityError:
+                # 조회 이후 다른 요청이 먼저 지급한 경우: 해당 청크만 개별 지급으로 재처리
+                self.db.rollback()
+                chunk_granted, chunk_errors = self._grant_yearly_each(chunk, data, granted_by)
+                granted_count += chunk_granted
+                errors.extend(chunk_errors)
+            except Exception:
+                self.db.rollback()
+                errors.extend(
+                    f"{t['name']}({t['service_number']}): 포인트 지급 중 오류 발생" for t in chunk
+                )
+
+            if on_progress:
+                on_progress(start + len(chunk), total)
+
+        return granted_count, errors
 
+    def _grant_yearly_chunk(
+        self,
+        chunk: List[dict],
+        data: PointGrantYearlyCreate,
+        granted_by: Optional[int],
+    ) -> None:
+        """
+        연간 포인트 청크 지급 (커밋은 호출자가 수행)
+        - PointGrant 일괄 INSERT ... RETURNING 으로 지급 ID 확보
+        - users.current_point 를 CASE 식 UPDATE ... RETURNING 한 번으로 증가
+        - PointTransaction 일괄 INSERT
+        """
+        description = f"{data.year}년 연간 포인트 지급"
+        grant_date = date.today()
+        amounts = {
+            t["user_id"]: t["base_amount"] + t["service_year_bonus"] + t["daily_calc_amount"]
+            for t in chunk
+        }
+
+        grant_ids = dict(
+            self.db.execute(
+                insert(PointGrant).returning(PointGrant.user_id, PointGrant.id),
+                [
+                    {
+                        "user_id": t["user_id"],
+                        "year": data.year,
+                        "point_type": data.point_type,
+                        "base_amount": t["base_amount"],
+                        "service_year_bonus": t["service_year_bonus"],
+                        "daily_calc_amount": t["daily_calc_amount"],
+                        "total_amount": amounts[t["user_id"]],
+                        "grant_date": grant_date,
+                        "description": description,
+                        "granted_by": granted_by,
+                    }
+                    for t in chunk
+                ],
+            ).all()
+        )
+
+        balances = self.db.execute(
+            update(User)
+            .where(User.id.in_(list(amounts)))
+            .values(current_point=User.current_point + case(amounts, value=User.id, else_=0))
+            .returning(User.id, User.current_point, User.reserved_point)
+            .execution_options(synchronize_session=False)
+        ).all()
+
+        self.db.execute(
+            insert(PointTransaction),
+            [
+                {
+                    "user_id": user_id,
+                    "transaction_type": TransactionType.GRANT,
+                    "amount": amounts[user_id],
+                    "balance_after": current_point,
+                    "reserved_after": reserved_point,
+                    "point_grant_id": grant_ids[user_id],
+                    "description": description,
+                    "reason": data.point_type.value,
+                }
+                for user_id, current_point, reserved_point in balances
+            ],
+        )
+
+    def _grant_yearly_each(
+        self,
+        chunk: List[dict],
+        data: PointGrantYearlyCreate,
+        granted_by: Optional[int],
+    ) -> Tuple[int, List[str]]:
+        """연간 포인트 개별 지급 (일괄 지급 청크가 충돌한 경우의 대체 경로)"""
+        granted_count = 0
+        errors = []
+
+        for t in chunk:
+            try:
                 grant_data = PointGrantCreate(
-                    user_id=user.id,
+                    user_id=t["user_id"],
                     year=data.year,
                     point_type=data.point_type,
-                    base_amount=calc["base_amount"],
-                    service_year_bonus=calc["service_year_bonus"],
-                    daily_calc_amount=calc["daily_calc_amount"],
+                    base_amount=t["base_amount"],
+                    service_year_bonus=t["service_year_bonus"],
+                    daily_calc_amount=t["daily_calc_amount"],
                     description=f"{data.year}년 연간 포인트 지급",
                 )
                 self.grant_point(grant_data, granted_by)
                 granted_count += 1
             except ValueError as e:
-                errors.append(f"{user.name}({user.service_number}): {str(e)}")
+                self.db.rollback()
+                errors.append(f"{t['name']}({t['service_number']}): {str(e)}")
             except Exception as e:
-                errors.append(f"{user.name}({user.service_number}): 포인트 지급 중 오류 발생")
+                self.db.rollback()
+                errors.append(f"{t['name']}({t['service_number']}): 포인트 지급 중 오류 발생")
 
         return granted_count, errors
 
@@ -275,19 +547,16 @@ class PointService:
         if not user:
             raise ValueError("사용자를 찾을 수 없습니다")
 
-        # 사용자 포인트 증가
-        user.current_point += data.amount
-
-        # 거래 내역 생성
-        transaction = PointTransaction(
-            user_id=data.user_id,
+        # 사용자 포인트 증가 및 거래 내역 생성
+        transaction = point_ledger.credit(
+            self.db,
+            data.user_id,
+            data.amount,
             transaction_type=TransactionType.GRANT,
-            amount=data.amount,
-            balance_after=user.current_point,
-            reserved_after=user.reserved_point,
             description=data.note or f"포인트 지급 ({data.reason})",
+            reason=data.reason,
         )
-        self.db.add(transaction)
+        balance_after = transaction.balance_after
 
         self.db.commit()
         
@@ -295,51 +564,94 @@ class PointService:
             "user_id": data.user_id,
             "user_name": user.name,
             "amount": data.amount,
-            "balance_after": user.current_point,
+            "balance_after": balance_after,
         }
 
-    def grant_bulk(self, data: PointBulkGrantRequest, granted_by: Optional[int] = None) -> Tuple[int, List[str]]:
+    def grant_bulk(
+        self,
+        data: PointBulkGrantRequest,
+        granted_by: Optional[int] = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Tuple[int, List[str], float]:
         """
         일괄 포인트 지급
         - 전체 또는 특정 계급 사용자에게 동일 금액 지급
+        - 사용자 ORM 객체를 로드하지 않고 ID 순으로 청크를 잘라 처리
+        - 청크마다 UPDATE ... RETURNING 으로 잔액을 받아 거래 내역을 한 번에 INSERT
+        - 전체를 한 트랜잭션으로 커밋 (청크는 메모리 사용량만 제한), 오류 시 전체 취소하여 재시도해도 중복 지급 없음
         
         Args:
             data: 지급 정보 (대상, 금액, 사유)
             granted_by: 지급자 ID
+            chunk_size: 한 번에 처리할 사용자 수
+            on_progress: 청크 처리 후 호출되는 콜백 (누적 처리 건수, 전체 건수, 커밋 전)
             
         Returns:
-            Tuple[int, List[str]]: (지급 성공 수, 오류 메시지 목록)
+            Tuple[int, List[str], float]: (지급 성공 수, 오류 메시지 목록, 초당 처리 건수), 오류 시 지급 성공 수 0
         """
-        query = self.db.query(User).filter(User.is_active == True)
-        
+        conditions = [User.is_active == True]
         if data.target == "rank" and data.rank_id:
-            query = query.filter(User.rank_id == data.rank_id)
-        
-        users = query.all()
-        
+            conditions.append(User.rank_id == data.rank_id)
+
+        total = self.db.query(func.count(User.id)).filter(*conditions).scalar()
+        description = data.note or f"일괄 포인트 지급 ({data.reason})"
+
         granted_count = 0
         errors = []
-        
-        for user in users:
-            try:
-                user.current_point += data.amount
-                
-                transaction = PointTransaction(
-                    user_id=user.id,
-                    transaction_type=TransactionType.GRANT,
-                    amount=data.amount,
-                    balance_after=user.current_point,
-                    reserved_after=user.reserved_point,
-                    description=data.note or f"일괄 포인트 지급 ({data.reason})",
+        last_id = 0
+        started = time.perf_counter()
+
+        try:
+            while True:
+                # 다음 청크의 대상 ID (키셋 방식: 이전 청크의 마지막 ID 이후)
+                chunk_ids = (
+                    select(User.id)
+                    .where(*conditions, User.id > last_id)
+                    .order_by(User.id)
+                    .limit(chunk_size)
+                    .scalar_subquery()
+                )
+                balances = self.db.execute(
+                    update(User)
+                    .where(User.id.in_(chunk_ids))
+                    .values(current_point=User.current_point + data.amount)
+                    .returning(User.id, User.current_point, User.reserved_point)
+                    .execution_options(synchronize_session=False)
+                ).all()
+                if not balances:
+                    break
+
+                self.db.execute(
+                    insert(PointTransaction),
+                    [
+                        {
+                            "user_id": user_id,
+                            "transaction_type": TransactionType.GRANT,
+                            "amount": data.amount,
+                            "balance_after": current_point,
+                            "reserved_after": reserved_point,
+                            "description": description,
+                            "reason": data.reason,
+                        }
+                        for user_id, current_point, reserved_point in balances
+                    ],
                 )
-                self.db.add(transaction)
-                granted_count += 1
-            except Exception as e:
-                errors.append(f"{user.name}: {str(e)}")
-        
-        self.db.commit()
-        
-        return granted_count, errors
+
+                granted_count += len(balances)
+                last_id = max(user_id for user_id, _, _ in balances)
+                if on_progress:
+                    on_progress(granted_count, total)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            errors.append(f"지급 중 오류가 발생하여 전체 지급을 취소했습니다: {str(e)}")
+            granted_count = 0
+
+        elapsed = time.perf_counter() - started
+        rows_per_second = granted_count / elapsed if elapsed > 0 else 0.0
+
+        return granted_count, errors, rows_per_second
 
     def use_point(
         self,
@@ -363,26 +675,14 @@ class PointService:
         Returns:
             PointTransaction: 생성된 거래 내역
         """
-        user = self.user_service.get_by_id(user_id)
-        if not user:
-            raise ValueError("사용자를 찾을 수 없습니다")
-
-        if user.available_point < amount:
-            raise ValueError(f"사용 가능한 포인트가 부족합니다 (현재: {user.available_point})")
-
-        user.current_point -= amount
-
-        transaction = PointTransaction(
-            user_id=user_id,
-            transaction_type=TransactionType.USE,
-            amount=amount,
-            balance_after=user.current_point,
-            reserved_after=user.reserved_point,
+        transaction = point_ledger.use(
+            self.db,
+            user_id,
+            amount,
             order_id=order_id,
             voucher_id=voucher_id,
             description=description or "포인트 사용",
         )
-        self.db.add(transaction)
 
         self.db.commit()
         self.db.refresh(transaction)
@@ -408,26 +708,14 @@ class PointService:
         Returns:
             PointTransaction: 생성된 거래 내역
         """
-        user = self.user_service.get_by_id(user_id)
-        if not user:
-            raise ValueError("사용자를 찾을 수 없습니다")
-
-        if user.available_point < amount:
-            raise ValueError(f"예약 가능한 포인트가 부족합니다 (현재: {user.available_point})")
-
-        # 예약 포인트 증가
-        user.reserved_point += amount
-
-        transaction = PointTransaction(
-            user_id=user_id,
-            transaction_type=TransactionType.RESERVE,
-            amount=amount,
-            balance_after=user.current_point,
-            reserved_after=user.reserved_point,
+        # 예약 포인트 증가 (사용가능 포인트 조건부)
+        transaction = point_ledger.reserve(
+            self.db,
+            user_id,
+            amount,
             order_id=order_id,
             description=description or "포인트 예약",
         )
-        self.db.add(transaction)
 
         self.db.commit()
         self.db.refresh(transaction)
@@ -453,25 +741,13 @@ class PointService:
         Returns:
             PointTransaction: 생성된 거래 내역
         """
-        user = self.user_service.get_by_id(user_id)
-        if not user:
-            raise ValueError("사용자를 찾을 수 없습니다")
-
-        if user.reserved_point < amount:
-            raise ValueError(f"해제할 예약 포인트가 부족합니다 (현재: {user.reserved_point})")
-
-        user.reserved_point -= amount
-
-        transaction = PointTransaction(
-            user_id=user_id,
-            transaction_type=TransactionType.RELEASE,
-            amount=amount,
-            balance_after=user.current_point,
-            reserved_after=user.reserved_point,
+        transaction = point_ledger.release(
+            self.db,
+            user_id,
+            amount,
             order_id=order_id,
             description=description or "포인트 예약 해제",
         )
-        self.db.add(transaction)
 
         self.db.commit()
         self.db.refresh(transaction)
@@ -500,27 +776,14 @@ class PointService:
         Returns:
             PointTransaction: 생성된 거래 내역
         """
-        user = self.user_service.get_by_id(user_id)
-        if not user:
-            raise ValueError("사용자를 찾을 수 없습니다")
-
-        if user.reserved_point < amount:
-            raise ValueError(f"차감할 예약 포인트가 부족합니다 (현재: {user.reserved_point})")
-
-        user.reserved_point -= amount
-        user.current_point -= amount
-
-        transaction = PointTransaction(
-            user_id=user_id,
-            transaction_type=TransactionType.DEDUCT,
-            amount=amount,
-            balance_after=user.current_point,
-            reserved_after=user.reserved_point,
+        transaction = point_ledger.deduct_reserved(
+            self.db,
+            user_id,
+            amount,
             order_id=order_id,
             voucher_id=voucher_id,
             description=description or "예약 포인트 차감",
         )
-        self.db.add(transaction)
 
         self.db.commit()
         self.db.refresh(transaction)
@@ -548,23 +811,14 @@ class PointService:
         Returns:
             PointTransaction: 생성된 거래 내역
         """
-        user = self.user_service.get_by_id(user_id)
-        if not user:
-            raise ValueError("사용자를 찾을 수 없습니다")
-
-        user.current_point += amount
-
-        transaction = PointTransaction(
-            user_id=user_id,
-            transaction_type=TransactionType.REFUND,
-            amount=amount,
-            balance_after=user.current_point,
-            reserved_after=user.reserved_point,
+        transaction = point_ledger.credit(
+            self.db,
+            user_id,
+            amount,
             order_id=order_id,
             voucher_id=voucher_id,
             description=description or "포인트 환불",
         )
-        self.db.add(transaction)
 
         self.db.commit()
         self.db.refresh(transaction)
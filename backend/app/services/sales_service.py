@@ -1,16 +1,18 @@
 from datetime import datetime
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from sqlalchemy.orm import Session
 
-from app.models.order import Order, OrderItem, OrderStatus, OrderType
-from app.models.point import PointTransaction, TransactionType
-from app.models.sales import Inventory, InventoryHistory, AdjustmentType
+from app.models.order import Order, OrderItem, OrderStatus, OrderType, PaymentMethod
+from app.models.point import TransactionType
+from app.models.sales import AdjustmentType
 from app.schemas.sales import OfflineSaleCreate, RefundCreate
+from app.services import dashboard_cache, point_ledger, sales_stats_service
 
 
 def create_offline_sale(db: Session, staff_id: int, sale_data: OfflineSaleCreate) -> Order:
     from app.services.order_service import generate_order_number
+    from app.utils.business_number import flush_numbered
     
     order_number = generate_order_number()
     
@@ -25,8 +27,7 @@ def create_offline_sale(db: Session, staff_id: int, sale_data: OfflineSaleCreate
         used_point=0,
         used_voucher_amount=0,
     )
-    db.add(order)
-    db.flush()
+    flush_numbered(db, order, "order_number", generate_order_number)
     
     total_amount = 0
     total_point = 0
@@ -63,133 +64,160 @@ def create_offline_sale(db: Session, staff_id: int, sale_data: OfflineSaleCreate
     
     _deduct_inventory_for_sale(db, order.id, sale_data.sales_office_id, order_items_list, staff_id)
     
+    sales_stats_service.record_order(db, order)
+    
     db.commit()
     db.refresh(order)
+    dashboard_cache.invalidate_order(order)
     return order
 
 
 def _deduct_user_points(db: Session, user_id: int, order_id: int, amount: int) -> None:
-    from app.models.user import User
-    user = db.query(User).filter(User.id == user_id).first()
-    if user and amount > 0:
-        user.current_point -= amount
-        transaction = PointTransaction(
-            user_id=user_id,
+    if amount > 0:
+        point_ledger.use(
+            db, user_id, amount,
             transaction_type=TransactionType.DEDUCT,
-            amount=amount,
-            balance_after=user.current_point,
-            reserved_after=user.reserved_point,
             order_id=order_id,
             description="오프라인 판매 포인트 차감",
         )
-        db.add(transaction)
 
 
 def _deduct_inventory_for_sale(db: Session, order_id: int, sales_office_id: int, items: list, staff_id: int) -> None:
-    for item in items:
-        inventory = db.query(Inventory).filter(
-            Inventory.sales_office_id == sales_office_id,
-            Inventory.item_id == item.item_id,
-            Inventory.spec_id == item.spec_id,
-        ).first()
-        if inventory:
-            before = inventory.quantity
-            inventory.quantity -= item.quantity
-            history = InventoryHistory(
-                inventory_id=inventory.id,
-                adjustment_type=AdjustmentType.DECREASE,
-                quantity=item.quantity,
-                before_quantity=before,
-                after_quantity=inventory.quantity,
-                reason="오프라인 판매",
-                adjusted_by=staff_id,
-                order_id=order_id,
-            )
-            db.add(history)
+    from app.services.order_service import apply_inventory_changes
+    apply_inventory_changes(
+        db, sales_office_id, items,
+        quantity_sign=-1,
+        history={
+            "adjustment_type": AdjustmentType.DECREASE,
+            "reason": "오프라인 판매",
+            "adjusted_by": staff_id,
+            "order_id": order_id,
+        },
+    )
 
 
-def process_refund(db: Session, staff_id: int, refund_data: RefundCreate) -> Optional[Order]:
-    order = db.query(Order).filter(Order.id == refund_data.order_id).first()
-    if not order:
-        return None
-    
-    if order.status not in [OrderStatus.DELIVERED, OrderStatus.SHIPPED]:
+class _RefundLine(NamedTuple):
+    """재고 복구 대상 주문 품목 (반품 수량 기준)"""
+    order_id: int
+    item_id: int
+    spec_id: Optional[int]
+    quantity: int
+
+
+REFUNDABLE_STATUSES = (OrderStatus.DELIVERED, OrderStatus.SHIPPED)
+
+
+def process_refund(db: Session, staff_id: int, refund_data: RefundCreate, sales_office_id: Optional[int] = None) -> Optional[Order]:
+    """주문 1건 반품 (반품 불가 시 None, sales_office_id 지정 시 해당 판매소 주문만)"""
+    result = process_refunds(db, staff_id, [refund_data], sales_office_id=sales_office_id)[0]
+    if not result["success"]:
         return None
-    
-    total_refund_point = 0
-    
-    for refund_item in refund_data.items:
-        order_item = db.query(OrderItem).filter(
-            OrderItem.id == refund_item.order_item_id,
-            OrderItem.order_id == order.id,
-        ).first()
-        if not order_item or order_item.is_returned:
+    return db.get(Order, refund_data.order_id)
+
+
+def process_refunds(db: Session, staff_id: int, refunds: list[RefundCreate], sales_office_id: Optional[int] = None) -> list[dict]:
+    """
+    여러 주문 일괄 반품 (요청 순서대로 주문별 결과 반환)
+    - 주문 조회 1회, 주문 품목 조회 1회, 판매소별 재고 복구(재고 조회/UPDATE/이력 INSERT) 각 1회
+    - 포인트 환불은 사용자 잔액 이력 순서를 지키기 위해 주문별 1회
+    - 반품할 수 없는 주문은 사유와 함께 실패로 보고하고, 나머지 주문은 한 트랜잭션으로 커밋
+    - sales_office_id 지정 시 해당 판매소 주문만 처리
+    """
+    order_ids = {refund.order_id for refund in refunds}
+    orders = {order.id: order for order in db.query(Order).filter(Order.id.in_(order_ids))} if order_ids else {}
+    items_by_order = {}
+    if orders:
+        for order_item in db.query(OrderItem).filter(OrderItem.order_id.in_(list(orders))):
+            items_by_order.setdefault(order_item.order_id, {})[order_item.id] = order_item
+
+    now = datetime.utcnow()
+    results = []
+    lines_by_office = {}
+    point_refunds = []
+    cache_keys = set()
+    for refund in refunds:
+        order = orders.get(refund.order_id)
+        if order is None or (sales_office_id and order.sales_office_id != sales_office_id):
+            results.append({"order_id": refund.order_id, "success": False, "message": "주문을 찾을 수 없습니다"})
             continue
-        
-        refund_quantity = min(refund_item.quantity, order_item.quantity - (order_item.quantity if order_item.is_returned else 0))
-        if refund_quantity <= 0:
+        if order.status not in REFUNDABLE_STATUSES:
+            results.append({"order_id": order.id, "success": False, "message": "반품할 수 없는 주문 상태입니다"})
             continue
-        
-        refund_amount = order_item.unit_price * refund_quantity
-        
-        if order_item.payment_method.value == "point":
-            total_refund_point += refund_amount
-        
-        _restore_inventory_for_refund(db, order.id, order.sales_office_id, order_item, refund_quantity, staff_id)
-        
-        order_item.is_returned = True
-        order_item.returned_at = datetime.utcnow()
-        order_item.return_reason = refund_item.reason
-    
-    if total_refund_point > 0:
-        _refund_user_points(db, order.user_id, order.id, total_refund_point)
-    
-    all_returned = all(item.is_returned for item in order.items)
-    if all_returned:
-        order.status = OrderStatus.REFUNDED
-    
+
+        order_items = items_by_order.get(order.id, {})
+        returned_items = 0
+        refund_point = 0
+        for refund_item in refund.items:
+            order_item = order_items.get(refund_item.order_item_id)
+            if not order_item or order_item.is_returned:
+                continue
+            refund_quantity = min(refund_item.quantity, order_item.quantity)
+            if refund_quantity <= 0:
+                continue
+
+            if order_item.payment_method == PaymentMethod.POINT:
+                refund_point += order_item.unit_price * refund_quantity
+            lines_by_office.setdefault(order.sales_office_id, []).append(
+                _RefundLine(order.id, order_item.item_id, order_item.spec_id, refund_quantity)
+            )
+            order_item.is_returned = True
+            order_item.returned_at = now
+            order_item.return_reason = refund_item.reason
+            returned_items += 1
+
+        if not returned_items:
+            results.append({"order_id": order.id, "success": False, "message": "반품할 품목이 없습니다"})
+            continue
+
+        if refund_point > 0:
+            point_refunds.append((order.user_id, order.id, refund_point))
+        if all(order_item.is_returned for order_item in order_items.values()):
+            order.status = OrderStatus.REFUNDED
+        cache_keys.update((dashboard_cache.sales_office_key(order.sales_office_id), dashboard_cache.user_key(order.user_id)))
+        results.append({
+            "order_id": order.id,
+            "success": True,
+            "message": "반품이 처리되었습니다",
+            "returned_items": returned_items,
+            "refund_point": refund_point,
+            "status": order.status.value,
+        })
+
+    if not cache_keys:
+        return results
+
+    for office_id, lines in lines_by_office.items():
+        _restore_inventory_for_refund(db, office_id, lines, staff_id)
+    for user_id, order_id, amount in point_refunds:
+        _refund_user_points(db, user_id, order_id, amount)
+
     db.commit()
-    db.refresh(order)
-    return order
+    dashboard_cache.invalidate(*cache_keys)
+    return results
 
 
 def _refund_user_points(db: Session, user_id: int, order_id: int, amount: int) -> None:
-    from app.models.user import User
-    user = db.query(User).filter(User.id == user_id).first()
-    if user and amount > 0:
-        user.current_point += amount
-        transaction = PointTransaction(
-            user_id=user_id,
-            transaction_type=TransactionType.REFUND,
-            amount=amount,
-            balance_after=user.current_point,
-            reserved_after=user.reserved_point,
+    if amount > 0:
+        point_ledger.credit(
+            db, user_id, amount,
             order_id=order_id,
             description="반품 포인트 환불",
         )
-        db.add(transaction)
-
-
-def _restore_inventory_for_refund(db: Session, order_id: int, sales_office_id: int, order_item: OrderItem, quantity: int, staff_id: int) -> None:
-    inventory = db.query(Inventory).filter(
-        Inventory.sales_office_id == sales_office_id,
-        Inventory.item_id == order_item.item_id,
-        Inventory.spec_id == order_item.spec_id,
-    ).first()
-    if inventory:
-        before = inventory.quantity
-        inventory.quantity += quantity
-        history = InventoryHistory(
-            inventory_id=inventory.id,
-            adjustment_type=AdjustmentType.RETURN,
-            quantity=quantity,
-            before_quantity=before,
-            after_quantity=inventory.quantity,
-            reason="반품 재고 복구",
-            adjusted_by=staff_id,
-            order_id=order_id,
-        )
-        db.add(history)
+
+
+def _restore_inventory_for_refund(db: Session, sales_office_id: int, lines: list, staff_id: int) -> None:
+    """판매소 1곳의 반품 품목 재고 일괄 복구 (이력은 품목별 주문 ID 로 기록)"""
+    from app.services.order_service import apply_inventory_changes
+    apply_inventory_changes(
+        db, sales_office_id, lines,
+        quantity_sign=1,
+        history={
+            "adjustment_type": AdjustmentType.RETURN,
+            "reason": "반품 재고 복구",
+            "adjusted_by": staff_id,
+        },
+        history_keys=("order_id",),
+    )
 
 
 def get_sales_history(db: Session, sales_office_id: Optional[int] = None, skip: int = 0, limit: int = 20) -> tuple[list, int]:
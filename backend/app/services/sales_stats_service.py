@@ -0,0 +1,271 @@
+"""
+판매 통계 서비스
+- 일별 집계(롤업) 테이블 증분 갱신, 재집계(backfill), 조회
+- 판매 통계 API 는 주문 테이블 대신 롤업만 조회하므로 주문 이력이 늘어도 조회 비용이 일정
+- 롤업 기준: 주문일(ordered_at, UTC), 취소 주문은 매출/판매건에서 제외하고 취소 건수로만 집계
+"""
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import Date, case, delete, func
+from sqlalchemy.orm import Session
+
+from app.models.clothing import Category, ClothingItem
+from app.models.order import Order, OrderItem, OrderStatus
+from app.models.stats import DailySalesStat, DailyItemSalesStat
+from app.utils.date_range import date_range_filters
+
+
+DAILY_KEYS = ["sales_office_id", "sale_date"]
+DAILY_VALUES = ["order_count", "total_amount", "used_point", "refund_count"]
+ITEM_KEYS = ["sales_office_id", "sale_date", "item_id"]
+ITEM_VALUES = ["quantity", "amount"]
+
+
+def _upsert(db: Session, model, keys: list, values: list, rows: list) -> None:
+    """키가 같은 행이 있으면 값에 더하고, 없으면 새로 추가 (INSERT ... ON CONFLICT DO UPDATE)"""
+    if not rows:
+        return
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+
+    stmt = insert(model)
+    set_ = {name: getattr(model, name) + getattr(stmt.excluded, name) for name in values}
+    set_["updated_at"] = datetime.utcnow()
+    db.execute(stmt.on_conflict_do_update(index_elements=keys, set_=set_), rows)
+
+
+def record_order(db: Session, order: Order, sign: int = 1) -> None:
+    """
+    주문 1건의 집계 기여분을 롤업에 반영
+    - sign=1: 더하기, sign=-1: 빼기
+    - 주문 품목은 DB 에서 품목별로 합산하므로 호출 전 주문 품목이 저장(flush)되어 있어야 함
+    """
+    sale_date = order.ordered_at.date()
+    cancelled = order.status == OrderStatus.CANCELLED
+
+    _upsert(db, DailySalesStat, DAILY_KEYS, DAILY_VALUES, [{
+        "sales_office_id": order.sales_office_id,
+        "sale_date": sale_date,
+        "order_count": 0 if cancelled else sign,
+        "total_amount": 0 if cancelled else sign * order.total_amount,
+        "used_point": 0 if cancelled else sign * order.used_point,
+        "refund_count": sign if cancelled else 0,
+    }])
+    if cancelled:
+        return
+
+    db.flush()
+    item_totals = db.query(
+        OrderItem.item_id,
+        func.sum(OrderItem.quantity).label("quantity"),
+        func.sum(OrderItem.total_price).label("amount"),
+    ).filter(OrderItem.order_id == order.id).group_by(OrderItem.item_id).all()
+
+    _upsert(db, DailyItemSalesStat, ITEM_KEYS, ITEM_VALUES, [
+        {
+            "sales_office_id": order.sales_office_id,
+            "sale_date": sale_date,
+            "item_id": r.item_id,
+            "quantity": sign * r.quantity,
+            "amount": sign * r.amount,
+        }
+        for r in item_totals
+    ])
+
+
+def record_new_orders(db: Session, orders: list, items: list) -> None:
+    """
+    새 주문 여러 건의 집계 기여분을 한 번에 반영 (일괄 주문)
+    - orders: sales_office_id, ordered_at, total_amount, used_point 값을 가진 dict
+    - items: sales_office_id, ordered_at, item_id, quantity, total_price 값을 가진 dict
+    - 같은 롤업 키끼리 메모리에서 합산 후 테이블별 UPSERT 1회
+    """
+    daily = {}
+    for order in orders:
+        key = (order["sales_office_id"], order["ordered_at"].date())
+        row = daily.setdefault(key, {"order_count": 0, "total_amount": 0, "used_point": 0, "refund_count": 0})
+        row["order_count"] += 1
+        row["total_amount"] += order["total_amount"]
+        row["used_point"] += order["used_point"]
+
+    item_totals = {}
+    for item in items:
+        key = (item["sales_office_id"], item["ordered_at"].date(), item["item_id"])
+        row = item_totals.setdefault(key, {"quantity": 0, "amount": 0})
+        row["quantity"] += item["quantity"]
+        row["amount"] += item["total_price"]
+
+    _upsert(db, DailySalesStat, DAILY_KEYS, DAILY_VALUES, [
+        {"sales_office_id": office_id, "sale_date": sale_date, **values}
+        for (office_id, sale_date), values in daily.items()
+    ])
+    _upsert(db, DailyItemSalesStat, ITEM_KEYS, ITEM_VALUES, [
+        {"sales_office_id": office_id, "sale_date": sale_date, "item_id": item_id, **values}
+        for (office_id, sale_date, item_id), values in item_totals.items()
+    ])
+
+
+@contextmanager
+def track_order(db: Session, order: Order):
+    """
+    주문 상태/금액 변경 구간을 감싸 롤업 갱신
+    - 진입 시 변경 전 기여분을 빼고, 종료 시 변경 후 기여분을 더함
+    - 커밋은 호출자가 주문 변경과 함께 수행
+    """
+    record_order(db, order, -1)
+    yield
+    record_order(db, order, 1)
+
+
+def rebuild(db: Session, start_date: Optional[date] = None, end_date: Optional[date] = None) -> tuple[int, int]:
+    """
+    주문 테이블에서 롤업 재집계 (backfill)
+    - 기간(주문일 기준, 양 끝 포함)의 기존 롤업을 지우고 다시 계산
+    - 기간 미지정 시 전체 재집계
+
+    Returns:
+        tuple: (일별 집계 행 수, 품목별 집계 행 수)
+    """
+    sale_date = func.date(Order.ordered_at, type_=Date)
+    order_filters = date_range_filters(Order.ordered_at, start_date, end_date)
+    daily_filters = []
+    item_filters = []
+    if start_date:
+        daily_filters.append(DailySalesStat.sale_date >= start_date)
+        item_filters.append(DailyItemSalesStat.sale_date >= start_date)
+    if end_date:
+        daily_filters.append(DailySalesStat.sale_date <= end_date)
+        item_filters.append(DailyItemSalesStat.sale_date <= end_date)
+
+    db.execute(delete(DailySalesStat).where(*daily_filters))
+    db.execute(delete(DailyItemSalesStat).where(*item_filters))
+
+    active = Order.status != OrderStatus.CANCELLED
+    daily_rows = db.query(
+        Order.sales_office_id,
+        sale_date.label("sale_date"),
+        func.sum(case((active, 1), else_=0)).label("order_count"),
+        func.sum(case((active, Order.total_amount), else_=0)).label("total_amount"),
+        func.sum(case((active, Order.used_point), else_=0)).label("used_point"),
+        func.sum(case((active, 0), else_=1)).label("refund_count"),
+    ).filter(*order_filters).group_by(Order.sales_office_id, sale_date).all()
+
+    item_rows = db.query(
+        Order.sales_office_id,
+        sale_date.label("sale_date"),
+        OrderItem.item_id,
+        func.sum(OrderItem.quantity).label("quantity"),
+        func.sum(OrderItem.total_price).label("amount"),
+    ).join(OrderItem, OrderItem.order_id == Order.id).filter(
+        active, *order_filters
+    ).group_by(Order.sales_office_id, sale_date, OrderItem.item_id).all()
+
+    _upsert(db, DailySalesStat, DAILY_KEYS, DAILY_VALUES, [dict(r._mapping) for r in daily_rows])
+    _upsert(db, DailyItemSalesStat, ITEM_KEYS, ITEM_VALUES, [dict(r._mapping) for r in item_rows])
+    db.commit()
+    return len(daily_rows), len(item_rows)
+
+
+def get_sales_stats(db: Session, start_date: date, end_date: date, sales_office_id: Optional[int] = None) -> dict:
+    """판매 통계 종합 (롤업 조회, 기간 양 끝 포함)"""
+    daily_filters = [DailySalesStat.sale_date >= start_date, DailySalesStat.sale_date <= end_date]
+    item_filters = [DailyItemSalesStat.sale_date >= start_date, DailyItemSalesStat.sale_date <= end_date]
+    if sales_office_id:
+        daily_filters.append(DailySalesStat.sales_office_id == sales_office_id)
+        item_filters.append(DailyItemSalesStat.sales_office_id == sales_office_id)
+
+    # 총 매출, 판매건, 포인트 사용액, 반품 건수
+    total_result = db.query(
+        func.sum(DailySalesStat.total_amount).label("total"),
+        func.sum(DailySalesStat.order_count).label("count"),
+        func.sum(DailySalesStat.used_point).label("points"),
+        func.sum(DailySalesStat.refund_count).label("refunds"),
+    ).filter(*daily_filters).first()
+
+    total_sales = total_result.total or 0
+    total_orders = total_result.count or 0
+    total_points = total_result.points or 0
+    refund_count = total_result.refunds or 0
+
+    # 일별 판매 추이
+    daily_results = db.query(
+        DailySalesStat.sale_date,
+        func.sum(DailySalesStat.total_amount).label("amount"),
+        func.sum(DailySalesStat.order_count).label("count"),
+    ).filter(*daily_filters).group_by(DailySalesStat.sale_date).having(
+        func.sum(DailySalesStat.order_count) > 0
+    ).order_by(DailySalesStat.sale_date).all()
+
+    daily_sales = [
+        {
+            "date": str(r.sale_date),
+            "amount": r.amount or 0,
+            "count": r.count or 0,
+        }
+        for r in daily_results
+    ]
+
+    # 인기 상품 TOP 10
+    top_results = db.query(
+        ClothingItem.id.label("id"),
+        ClothingItem.name.label("name"),
+        func.sum(DailyItemSalesStat.quantity).label("quantity"),
+        func.sum(DailyItemSalesStat.amount).label("amount"),
+    ).join(ClothingItem, ClothingItem.id == DailyItemSalesStat.item_id).filter(*item_filters).group_by(
+        ClothingItem.id, ClothingItem.name
+    ).having(
+        func.sum(DailyItemSalesStat.quantity) > 0
+    ).order_by(func.sum(DailyItemSalesStat.amount).desc()).limit(10).all()
+
+    top_products = [
+        {
+            "id": r.id,
+            "name": r.name,
+            "quantity": r.quantity or 0,
+            "amount": r.amount or 0,
+        }
+        for r in top_results
+    ]
+
+    # 결제 수단별 현황 (포인트만 사용)
+    payment_methods = [
+        {
+            "type": "points",
+            "count": total_orders,
+            "amount": total_points,
+            "percentage": 100.0 if total_sales > 0 else 0,
+        }
+    ]
+
+    # 카테고리별 판매
+    category_results = db.query(
+        Category.name.label("name"),
+        func.sum(DailyItemSalesStat.amount).label("amount"),
+    ).join(ClothingItem, ClothingItem.id == DailyItemSalesStat.item_id).join(
+        Category, Category.id == ClothingItem.category_id
+    ).filter(*item_filters).group_by(Category.name).having(
+        func.sum(DailyItemSalesStat.quantity) > 0
+    ).all()
+
+    category_sales = [
+        {
+            "name": r.name,
+            "amount": r.amount or 0,
+        }
+        for r in category_results
+    ]
+
+    return {
+        "totalSales": total_sales,
+        "totalOrders": total_orders,
+        "totalPoints": total_points,
+        "refundCount": refund_count,
+        "dailySales": daily_sales,
+        "topProducts": top_products,
+        "paymentMethods": payment_methods,
+        "categorySales": category_sales,
+    }
@@ -1,18 +1,21 @@
-import uuid
 from datetime import datetime
 from typing import Optional
 
 from sqlalchemy.orm import Session
 
 from app.models.tailor import TailorVoucher, VoucherStatus
-from app.models.point import PointTransaction, TransactionType
+from app.models.point import TransactionType
 from app.schemas.tailor import VoucherCreate, VoucherRegister, VoucherCancelRequest
+from app.services import dashboard_cache, point_ledger
+from app.utils.business_number import NumberGenerator, flush_numbered
+
+
+_voucher_numbers = NumberGenerator("TV")
 
 
 def generate_voucher_number() -> str:
-    date_str = datetime.now().strftime("%Y%m%d")
-    unique = uuid.uuid4().hex[:8].upper()
-    return f"TV-{date_str}-{unique}"
+    """체척권번호 TV-YYYYMMDD-XXXXXXXXXX (시간순, 워커 ID + 순번, 저장 시 충돌하면 새 번호로 재시도)"""
+    return _voucher_numbers.next()
 
 
 def create_voucher(db: Session, staff_id: int, voucher_data: VoucherCreate) -> TailorVoucher:
@@ -29,9 +32,10 @@ def create_voucher(db: Session, staff_id: int, voucher_data: VoucherCreate) -> T
         expires_at=voucher_data.expires_at,
         notes=voucher_data.notes,
     )
-    db.add(voucher)
+    flush_numbered(db, voucher, "voucher_number", generate_voucher_number)
     db.commit()
     db.refresh(voucher)
+    dashboard_cache.invalidate_voucher(voucher)
     return voucher
 
 
@@ -41,18 +45,6 @@ def issue_voucher_direct(db: Session, user_id: int, item_id: int, amount: int, s
     - 사용자가 맞춤피복 선택 시 즉시 체척권 발행
     - 발행과 동시에 포인트 차감
     """
-    from app.models.user import User
-    
-    # 사용자 포인트 확인
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise ValueError("사용자를 찾을 수 없습니다.")
-    
-    # 사용 가능 포인트 확인
-    available_point = user.current_point - user.reserved_point
-    if available_point < amount:
-        raise ValueError(f"사용 가능한 포인트가 부족합니다. (사용가능: {available_point}P, 필요: {amount}P)")
-    
     voucher_number = generate_voucher_number()
     
     voucher = TailorVoucher(
@@ -63,23 +55,20 @@ def issue_voucher_direct(db: Session, user_id: int, item_id: int, amount: int, s
         status=VoucherStatus.ISSUED,
         notes=notes or "맞춤피복 체척권 발행",
     )
-    db.add(voucher)
+    flush_numbered(db, voucher, "voucher_number", generate_voucher_number)
     
-    # 포인트 차감
-    user.current_point -= amount
-    transaction = PointTransaction(
-        user_id=user_id,
+    # 포인트 차감 (사용 가능 포인트 조건부)
+    point_ledger.use(
+        db, user_id, amount,
         transaction_type=TransactionType.DEDUCT,
-        amount=amount,
-        balance_after=user.current_point,
-        reserved_after=user.reserved_point,
+        insufficient_message="사용 가능한 포인트가 부족합니다. (사용가능: {available}P, 필요: {required}P)",
         voucher_id=voucher.id,
         description="체척권 발행 포인트 차감",
     )
-    db.add(transaction)
     
     db.commit()
     db.refresh(voucher)
+    dashboard_cache.invalidate_voucher(voucher)
     return voucher
 
 
@@ -124,6 +113,7 @@ def register_voucher(db: Session, staff_id: int, register_data: VoucherRegister)
     
     db.commit()
     db.refresh(voucher)
+    dashboard_cache.invalidate_voucher(voucher)
     return voucher
 
 
@@ -153,6 +143,7 @@ def request_cancel_voucher(db: Session, user_id: int, voucher_id: int, cancel_da
     
     db.commit()
     db.refresh(voucher)
+    dashboard_cache.invalidate_voucher(voucher)
     return voucher
 
 
@@ -183,22 +174,14 @@ def approve_cancel_voucher(db: Session, staff_id: int, voucher_id: int, approved
     
     db.commit()
     db.refresh(voucher)
+    dashboard_cache.invalidate_voucher(voucher)
     return voucher
 
 
 def _refund_voucher_amount(db: Session, voucher: TailorVoucher) -> None:
-    from app.models.user import User
     if voucher.amount > 0:
-        user = db.query(User).filter(User.id == voucher.user_id).first()
-        if user:
-            user.current_point += voucher.amount
-            transaction = PointTransaction(
-                user_id=voucher.user_id,
-                transaction_type=TransactionType.REFUND,
-                amount=voucher.amount,
-                balance_after=user.current_point,
-                reserved_after=user.reserved_point,
-                voucher_id=voucher.id,
-                description="체척권 취소 포인트 환불",
-            )
-            db.add(transaction)
+        point_ledger.credit(
+            db, voucher.user_id, voucher.amount,
+            voucher_id=voucher.id,
+            description="체척권 취소 포인트 환불",
+        )
@@ -0,0 +1,156 @@
+"""
+키워드 부분 일치 검색 (사용자 이름/사용자명/군번, 주문번호, 체척권번호)
+- LIKE '%키워드%' 는 B-tree 인덱스를 쓸 수 없어 전체 스캔 → 데이터베이스별 트라이그램 인덱스로 검색
+- PostgreSQL: pg_trgm GIN 인덱스 (ILIKE 가 인덱스 사용), 유사도(similarity) 높은 순 정렬
+- SQLite: FTS5 트라이그램 보조 테이블 ({테이블}_search), 원본 테이블 트리거로 동기화, bm25 순 정렬
+- 트라이그램은 3글자 이상만 인덱스로 찾을 수 있음 → SQLite 에서 짧은 키워드는 기존 부분 일치(LIKE)로 검색
+- 인덱스/보조 테이블은 init_db() 에서 생성, 트리거를 새로 만들 때마다 원본 데이터로 다시 채움
+- SQLite 보조 테이블/트리거가 없으면(init_db 미실행) 기존 부분 일치(LIKE)로 검색
+"""
+from functools import lru_cache
+
+from sqlalchemy import bindparam, column, func, literal, literal_column, or_, select, table, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from app.database import engine, is_sqlite
+
+# 검색 대상 테이블과 컬럼
+SEARCH_COLUMNS = {
+    "users": ("name", "username", "service_number"),
+    "orders": ("order_number",),
+    "tailor_vouchers": ("voucher_number",),
+}
+
+MIN_TRIGRAM_LENGTH = 3
+
+# SQLite 테이블 이름 → 보조 테이블/트리거 준비 여부 (처음 검색할 때 확인)
+_search_ready: dict = {}
+
+
+def _search_table(name: str) -> str:
+    return f"{name}_search"
+
+
+def _search_objects(name: str) -> set:
+    """보조 테이블과 동기화 트리거 이름"""
+    search = _search_table(name)
+    return {search, f"{search}_ai", f"{search}_ad", f"{search}_au"}
+
+
+def ensure_search_indexes():
+    """검색 인덱스 생성 (이미 있으면 건너뜀, SQLite 트리거가 없으면 다시 만들고 보조 테이블 재구성)"""
+    if is_sqlite:
+        _ensure_fts_tables()
+    else:
+        _ensure_trigram_indexes()
+
+
+def _ensure_fts_tables():
+    with engine.begin() as conn:
+        existing = set(conn.exec_driver_sql("SELECT name FROM sqlite_master").scalars())
+        for name, columns in SEARCH_COLUMNS.items():
+            search = _search_table(name)
+            names = ", ".join(columns)
+            new_values = ", ".join(f"new.{c}" for c in columns)
+            old_values = ", ".join(f"old.{c}" for c in columns)
+            if _search_objects(name) <= existing:
+                continue
+            if search not in existing:
+                conn.exec_driver_sql(
+                    f"CREATE VIRTUAL TABLE {search} USING fts5("
+                    f"{names}, content='{name}', content_rowid='id', tokenize='trigram')"
+                )
+            # 원본 테이블을 다시 만들면(drop_all) 트리거만 사라지고 보조 테이블은 이전 내용으로 남음 → 트리거 생성 후 다시 채움
+            conn.exec_driver_sql(
+                f"CREATE TRIGGER IF NOT EXISTS {search}_ai AFTER INSERT ON {name} BEGIN "
+                f"INSERT INTO {search}(rowid, {names}) VALUES (new.id, {new_values}); END"
+            )
+            conn.exec_driver_sql(
+                f"CREATE TRIGGER IF NOT EXISTS {search}_ad AFTER DELETE ON {name} BEGIN "
+                f"INSERT INTO {search}({search}, rowid, {names}) VALUES ('delete', old.id, {old_values}); END"
+            )
+            conn.exec_driver_sql(
+                f"CREATE TRIGGER IF NOT EXISTS {search}_au AFTER UPDATE OF {names} ON {name} BEGIN "
+                f"INSERT INTO {search}({search}, rowid, {names}) VALUES ('delete', old.id, {old_values}); "
+                f"INSERT INTO {search}(rowid, {names}) VALUES (new.id, {new_values}); END"
+            )
+            conn.exec_driver_sql(f"INSERT INTO {search}({search}) VALUES ('rebuild')")
+    _search_ready.clear()
+
+
+def _ensure_trigram_indexes():
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except DBAPIError:
+        # 확장 생성 권한이 없으면 인덱스 없이 ILIKE 검색 (결과는 같고 속도만 느림)
+        return
+    _has_trigram.cache_clear()
+    with engine.begin() as conn:
+        for name, columns in SEARCH_COLUMNS.items():
+            for c in columns:
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS ix_{name}_{c}_trgm ON {name} USING gin ({c} gin_trgm_ops)"
+                ))
+
+
+def _has_search_table(db: Session, name: str) -> bool:
+    """보조 테이블과 트리거가 모두 있는지 (호출한 세션의 연결로 확인)"""
+    ready = _search_ready.get(name)
+    if ready is None:
+        objects = _search_objects(name)
+        statement = text("SELECT name FROM sqlite_master WHERE name IN :names").bindparams(
+            bindparam("names", expanding=True)
+        )
+        ready = set(db.execute(statement, {"names": list(objects)}).scalars()) == objects
+        _search_ready[name] = ready
+    return ready
+
+
+@lru_cache(maxsize=1)
+def _has_trigram() -> bool:
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")).first() is not None
+
+
+def _like_pattern(keyword: str) -> str:
+    escaped = keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def matches(db: Session, model, keyword: str):
+    """
+    키워드를 포함하는 행의 (id, rank) 서브쿼리, rank 가 작을수록 관련도 높음
+    - 모델 테이블의 검색 대상 컬럼 중 하나라도 키워드를 포함하면 일치 (대소문자 구분 없음)
+    """
+    name = model.__tablename__
+    columns = [getattr(model, c) for c in SEARCH_COLUMNS[name]]
+
+    if is_sqlite and len(keyword) >= MIN_TRIGRAM_LENGTH and _has_search_table(db, name):
+        search = table(_search_table(name), column("rowid"), column("rank"))
+        phrase = '"' + keyword.replace('"', '""') + '"'
+        statement = select(search.c.rowid.label("id"), search.c.rank.label("rank")).where(
+            literal_column(search.name).match(phrase)
+        )
+    elif is_sqlite:
+        statement = select(model.id.label("id"), literal(0).label("rank")).where(
+            or_(*[c.contains(keyword, autoescape=True) for c in columns])
+        )
+    else:
+        pattern = _like_pattern(keyword)
+        if _has_trigram():
+            similarities = [func.similarity(c, keyword) for c in columns]
+            rank = -(func.greatest(*similarities) if len(similarities) > 1 else similarities[0])
+        else:
+            rank = literal(0)
+        statement = select(model.id.label("id"), rank.label("rank")).where(
+            or_(*[c.ilike(pattern, escape="\\") for c in columns])
+        )
+    return statement.subquery()
+
+
+def match_condition(db: Session, model, keyword: str):
+    """키워드를 포함하는 행 조건 (정렬이 필요 없는 목록 검색용)"""
+    found = matches(db, model, keyword)
+    return model.id.in_(select(found.c.id))
@@ -0,0 +1,125 @@
+"""
+사용자 자동완성 인덱스
+- 활성 사용자 전체를 1회 조회하여 군번/이름(소문자) 정렬 키 목록을 메모리에 구성, 접두어는 이진 탐색으로 조회
+- 항목은 자동완성에 필요한 값만 튜플로 보관 (ID, 이름, 군번, 소속, 계급명)
+- 사용자 생성/수정/진급 커밋 후 upsert(), 삭제 후 remove() 로 해당 사용자 키만 갱신
+- 일괄 등록 후에는 invalidate() 로 버전 증가 → 다음 조회 시 재구성
+- 다른 워커의 변경은 USER_LOOKUP_TTL(초) 경과 후 재구성으로 반영, 재구성 중에는 이전 인덱스로 응답 (SnapshotCache)
+"""
+from bisect import bisect_left, bisect_right
+from typing import List, NamedTuple, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.user import Rank, User
+from app.utils.snapshot import SnapshotCache
+
+
+class LookupEntry(NamedTuple):
+    id: int
+    name: str
+    service_number: str
+    unit: Optional[str]
+    rank: Optional[str]
+
+
+def _keys(entry: LookupEntry) -> tuple:
+    return (entry.service_number.casefold(), entry.name.casefold())
+
+
+class UserLookupIndex:
+    """
+    군번/이름 접두어 인덱스 (변경과 조회는 스냅샷 캐시 lock 안에서 수행)
+    - keys/ids: 정렬된 검색 키와 같은 위치의 사용자 ID (사용자당 군번, 이름 2개)
+    - entries: 사용자 ID → 응답 항목
+    """
+
+    def __init__(self, entries: List[LookupEntry]):
+        self.entries = {entry.id: entry for entry in entries}
+        keys = [key for entry in entries for key in _keys(entry)]
+        ids = [entry.id for entry in entries for _ in range(2)]
+        # 같은 키는 ID 순 (조회 순서 유지 정렬)
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self.keys = [keys[i] for i in order]
+        self.ids = [ids[i] for i in order]
+
+    def put(self, entry: LookupEntry) -> None:
+        self.remove(entry.id)
+        self.entries[entry.id] = entry
+        for key in _keys(entry):
+            position = bisect_right(self.keys, key)
+            self.keys.insert(position, key)
+            self.ids.insert(position, entry.id)
+
+    def remove(self, user_id: int) -> None:
+        entry = self.entries.pop(user_id, None)
+        if entry is None:
+            return
+        for key in _keys(entry):
+            position = bisect_left(self.keys, key)
+            while self.keys[position] == key and self.ids[position] != user_id:
+                position += 1
+            del self.keys[position]
+            del self.ids[position]
+
+    def search(self, prefix: str, limit: int) -> List[LookupEntry]:
+        """키가 prefix 로 시작하는 사용자 (키 순, 일치 군번/이름이 먼저)"""
+        found = {}
+        position = bisect_left(self.keys, prefix)
+        while position < len(self.keys) and len(found) < limit and self.keys[position].startswith(prefix):
+            user_id = self.ids[position]
+            found.setdefault(user_id, self.entries[user_id])
+            position += 1
+        return list(found.values())
+
+
+def _load_entries(db: Session) -> List[LookupEntry]:
+    rank_names = dict(db.query(Rank.id, Rank.name).all())
+    rows = db.execute(
+        select(User.id, User.name, User.service_number, User.unit, User.rank_id).where(User.is_active == True).order_by(User.id)
+    ).tuples()
+    return [
+        LookupEntry(user_id, name, service_number, unit, rank_names.get(rank_id))
+        for user_id, name, service_number, unit, rank_id in rows
+    ]
+
+
+_cache: SnapshotCache[UserLookupIndex] = SnapshotCache(
+    lambda db: UserLookupIndex(_load_entries(db)), "USER_LOOKUP_TTL", serve_stale=True,
+)
+
+
+def get_index(db: Session) -> UserLookupIndex:
+    """현재 인덱스 반환, 무효화되었거나 만료되었으면 1회 조회로 재구성"""
+    return _cache.get(db)
+
+
+def search(db: Session, keyword: str, limit: int = 10) -> List[dict]:
+    """활성 사용자 중 군번 또는 이름이 keyword 로 시작하는 사용자"""
+    prefix = keyword.strip().casefold()
+    if not prefix:
+        return []
+    index = get_index(db)
+    with _cache.lock:
+        return [entry._asdict() for entry in index.search(prefix, limit)]
+
+
+def upsert(user: User) -> None:
+    """사용자 생성/수정 커밋 후 호출 (비활성 사용자는 인덱스에서 제외)"""
+    if not user.is_active:
+        remove(user.id)
+        return
+    rank = user.rank.name if user.rank else None
+    entry = LookupEntry(user.id, user.name, user.service_number, user.unit, rank)
+    _cache.update(lambda index: index.put(entry))
+
+
+def remove(user_id: int) -> None:
+    """사용자 삭제 커밋 후 호출"""
+    _cache.update(lambda index: index.remove(user_id))
+
+
+def invalidate() -> None:
+    """여러 사용자 변경(일괄 등록 등) 커밋 후 호출 (버전 증가)"""
+    _cache.invalidate()
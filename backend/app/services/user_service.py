@@ -1,12 +1,24 @@
+import re
 from datetime import date, datetime
 from typing import Optional, List, Tuple
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, case, insert
 
 from app.models.user import User, Rank, UserRankHistory, UserRole, UserRank, RANK_POINT_MAPPING
 from app.models.point import PointGrant, PointTransaction, PointType, TransactionType
 from app.schemas.user import UserCreate, UserUpdate, UserResponse, UserListResponse, PromoteRequest
-from app.utils.auth import get_password_hash
+from app.services import text_search, user_lookup
+from app.utils import principal_cache
+from app.utils.auth import get_password_hash, get_password_hashes
+
+BULK_CHUNK_SIZE = 500
+
+# 군번 형태 키워드 (숫자로 시작, 숫자/하이픈) → 일치/접두어 군번을 먼저 정렬
+SERVICE_NUMBER_PATTERN = re.compile(r"\d[\d-]*")
+
+# 액세스 토큰 클레임에 담기는 값 (변경 시 토큰 버전 증가)
+TOKEN_SCOPE_FIELDS = ("username", "role", "is_active", "sales_office_id", "tailor_company_id")
 
 
 class UserService:
@@ -39,19 +51,25 @@ class UserService:
             query = query.filter(User.rank_id == rank_id)
         if is_active is not None:
             query = query.filter(User.is_active == is_active)
+
+        order_by = [User.created_at.desc()]
         if keyword:
-            query = query.filter(
-                or_(
-                    User.name.contains(keyword),
-                    User.username.contains(keyword),
-                    User.service_number.contains(keyword),
-                )
-            )
+            # 트라이그램 인덱스 검색 (이름/사용자명/군번 포함), 관련도 순
+            found = text_search.matches(self.db, User, keyword)
+            query = query.join(found, found.c.id == User.id)
+            order_by = [found.c.rank, User.created_at.desc()]
+            if SERVICE_NUMBER_PATTERN.fullmatch(keyword):
+                # 군번 형태 키워드: 일치 군번, 군번 접두어 일치를 먼저
+                order_by.insert(0, case(
+                    (User.service_number == keyword, 0),
+                    (User.service_number.startswith(keyword, autoescape=True), 1),
+                    else_=2,
+                ))
 
         total = query.count()
         total_pages = (total + page_size - 1) // page_size
         offset = (page - 1) * page_size
-        items = query.order_by(User.created_at.desc()).offset(offset).limit(page_size).all()
+        items = query.order_by(*order_by).offset(offset).limit(page_size).all()
 
         return UserListResponse(
             items=[self._to_response(item) for item in items],
@@ -61,45 +79,59 @@ class UserService:
             total_pages=total_pages,
         )
 
-    def create(self, user_data: UserCreate) -> User:
+    def create(self, user_data: UserCreate, password_hash: Optional[str] = None) -> User:
+        """사용자 생성 (password_hash 미지정 시 현재 스레드에서 해시)"""
         if self.get_by_username(user_data.username):
             raise ValueError("이미 존재하는 사용자명입니다")
         if user_data.service_number and self.get_by_service_number(user_data.service_number):
             raise ValueError("이미 등록된 군번입니다")
 
-        user = User(
-            username=user_data.username,
-            password_hash=get_password_hash(user_data.password),
-            name=user_data.name,
-            email=user_data.email,
-            phone=user_data.phone,
-            role=user_data.role,
-            rank_id=user_data.rank_id,
-            service_number=user_data.service_number,
-            unit=user_data.unit,
-            enlistment_date=user_data.enlistment_date,
-            retirement_date=user_data.retirement_date,
-            sales_office_id=user_data.sales_office_id,
-            tailor_company_id=user_data.tailor_company_id,
-            current_point=0,
-            reserved_point=0,
-        )
+        if password_hash is None:
+            password_hash = get_password_hash(user_data.password)
+        user = User(**self._user_values(user_data, password_hash))
         self.db.add(user)
         self.db.commit()
         self.db.refresh(user)
+        user_lookup.upsert(user)
         return user
 
+    @staticmethod
+    def _user_values(user_data: UserCreate, password_hash: str) -> dict:
+        """신규 사용자 컬럼 값 (개별/일괄 등록 공용)"""
+        return {
+            "username": user_data.username,
+            "password_hash": password_hash,
+            "name": user_data.name,
+            "email": user_data.email,
+            "phone": user_data.phone,
+            "role": user_data.role,
+            "rank_id": user_data.rank_id,
+            "service_number": user_data.service_number,
+            "unit": user_data.unit,
+            "enlistment_date": user_data.enlistment_date,
+            "retirement_date": user_data.retirement_date,
+            "sales_office_id": user_data.sales_office_id,
+            "tailor_company_id": user_data.tailor_company_id,
+            "current_point": 0,
+            "reserved_point": 0,
+        }
+
     def update(self, user_id: int, user_data: UserUpdate) -> User:
         user = self.get_by_id(user_id)
         if not user:
             raise ValueError("사용자를 찾을 수 없습니다")
 
         update_data = user_data.model_dump(exclude_unset=True)
+        if any(key in update_data and update_data[key] != getattr(user, key) for key in TOKEN_SCOPE_FIELDS):
+            # 권한/소속/활성 여부가 바뀌면 이전 토큰 무효화
+            user.token_version = (user.token_version or 0) + 1
         for key, value in update_data.items():
             setattr(user, key, value)
 
         self.db.commit()
+        principal_cache.invalidate_user(user.id)
         self.db.refresh(user)
+        user_lookup.upsert(user)
         return user
 
     def delete(self, user_id: int) -> bool:
@@ -108,17 +140,83 @@ class UserService:
             return False
         self.db.delete(user)
         self.db.commit()
+        principal_cache.invalidate_user(user_id)
+        user_lookup.remove(user_id)
         return True
 
-    def bulk_create(self, users: List[UserCreate]) -> Tuple[int, List[str]]:
+    def bulk_create(self, users: List[UserCreate], chunk_size: int = BULK_CHUNK_SIZE) -> Tuple[int, List[str]]:
+        """
+        사용자 일괄 등록
+        - 사용자명/군번 중복은 파일 전체에 대해 IN 쿼리 2회로 확인 (파일 내 중복은 먼저 나온 행만 등록)
+        - 비밀번호는 프로세스 풀에서 일괄 해시
+        - 청크 단위로 일괄 INSERT 후 커밋, 충돌(이메일 중복, 동시 등록 등) 시 해당 청크만 개별 등록으로 재처리
+
+        Returns:
+            Tuple[int, List[str]]: (등록 수, "행 N: 사유" 형식 오류 목록)
+        """
+        usernames = {u.username for u in users}
+        service_numbers = {u.service_number for u in users if u.service_number}
+        taken_usernames = {
+            r.username for r in self.db.query(User.username).filter(User.username.in_(usernames))
+        } if usernames else set()
+        taken_service_numbers = {
+            r.service_number for r in self.db.query(User.service_number).filter(User.service_number.in_(service_numbers))
+        } if service_numbers else set()
+
+        errors = []
+        targets = []
+        for row_no, user_data in enumerate(users, start=1):
+            if user_data.username in taken_usernames:
+                errors.append((row_no, "이미 존재하는 사용자명입니다"))
+                continue
+            if user_data.service_number and user_data.service_number in taken_service_numbers:
+                errors.append((row_no, "이미 등록된 군번입니다"))
+                continue
+            taken_usernames.add(user_data.username)
+            if user_data.service_number:
+                taken_service_numbers.add(user_data.service_number)
+            targets.append((row_no, user_data))
+
+        password_hashes = get_password_hashes([user_data.password for _, user_data in targets])
+        rows = [
+            (row_no, self._user_values(user_data, password_hash))
+            for (row_no, user_data), password_hash in zip(targets, password_hashes)
+        ]
+
+        created = 0
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            try:
+                self.db.execute(insert(User), [values for _, values in chunk])
+                self.db.commit()
+                created += len(chunk)
+            except IntegrityError:
+                self.db.rollback()
+                chunk_created, chunk_errors = self._bulk_create_each(chunk)
+                created += chunk_created
+                errors.extend(chunk_errors)
+
+        if created:
+            user_lookup.invalidate()
+        return created, [f"행 {row_no}: {message}" for row_no, message in sorted(errors)]
+
+    def _bulk_create_each(self, chunk: List[Tuple[int, dict]]) -> Tuple[int, List[Tuple[int, str]]]:
+        """사용자 개별 등록 (일괄 등록 청크가 충돌한 경우의 대체 경로)"""
         created = 0
         errors = []
-        for i, user_data in enumerate(users):
+        for row_no, values in chunk:
             try:
-                self.create(user_data)
+                self.db.add(User(**values))
+                self.db.commit()
                 created += 1
-            except ValueError as e:
-                errors.append(f"행 {i + 1}: {str(e)}")
+            except IntegrityError:
+                self.db.rollback()
+                if self.get_by_username(values["username"]):
+                    errors.append((row_no, "이미 존재하는 사용자명입니다"))
+                elif values.get("service_number") and self.get_by_service_number(values["service_number"]):
+                    errors.append((row_no, "이미 등록된 군번입니다"))
+                else:
+                    errors.append((row_no, "중복되거나 잘못된 값이 있어 등록할 수 없습니다"))
         return created, errors
 
     def promote(self, user_id: int, promote_data: PromoteRequest, granted_by: Optional[int] = None) -> User:
@@ -155,11 +253,13 @@ class UserService:
                 balance_after=user.current_point,
                 reserved_after=user.reserved_point,
                 description=f"진급에 따른 포인트 조정 ({old_rank.name if old_rank else '없음'} → {new_rank.name})",
+                reason=PointType.PROMOTION.value,
             )
             self.db.add(transaction)
 
         self.db.commit()
         self.db.refresh(user)
+        user_lookup.upsert(user)
         return user
 
     def calculate_yearly_point(self, user: User, year: int, grant_date: date) -> dict:
@@ -167,21 +267,40 @@ class UserService:
         if not rank:
             return {"base_amount": 0, "service_year_bonus": 0, "daily_calc_amount": 0, "total_amount": 0}
 
-        base_amount = rank.annual_point
-        service_year_bonus = rank.service_year_bonus * user.service_years
+        return self.calculate_yearly_amounts(
+            annual_point=rank.annual_point,
+            service_year_bonus=rank.service_year_bonus,
+            service_years=user.service_years,
+            retirement_date=user.retirement_date,
+            year=year,
+        )
+
+    @staticmethod
+    def calculate_yearly_amounts(
+        annual_point: int,
+        service_year_bonus: int,
+        service_years: int,
+        retirement_date: Optional[date],
+        year: int,
+    ) -> dict:
+        """
+        연간 포인트 계산 (ORM 객체 없이 값만으로 계산)
+        - 일괄 지급 시 전체 대상자를 메모리에서 계산하기 위해 사용
+        """
+        base_amount = annual_point
+        service_year_bonus = service_year_bonus * service_years
 
         year_start = date(year, 1, 1)
-        year_end = date(year, 12, 31)
 
-        if user.retirement_date and user.retirement_date.year == year:
-            days_served = (user.retirement_date - year_start).days + 1
+        if retirement_date and retirement_date.year == year:
+            days_served = (retirement_date - year_start).days + 1
             total_days = 365 if year % 4 != 0 else 366
             daily_calc_amount = int((base_amount + service_year_bonus) * days_served / total_days)
         else:
             daily_calc_amount = 0
 
         total_amount = base_amount + service_year_bonus + daily_calc_amount
-        if user.retirement_date and user.retirement_date.year == year:
+        if retirement_date and retirement_date.year == year:
             total_amount = daily_calc_amount
 
         return {
@@ -5,6 +5,7 @@ from app.utils.auth import (
     verify_password,
     verify_token,
 )
+from app.utils.date_range import date_range_filters
 
 __all__ = [
     "create_access_token",
@@ -12,4 +13,5 @@ __all__ = [
     "get_password_hash",
     "verify_password",
     "get_current_user",
+    "date_range_filters",
 ]
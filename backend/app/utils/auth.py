@@ -1,15 +1,19 @@
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import List, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
-from passlib.context import CryptContext
+from sqlalchemy.orm import Session
 
 from app.config import settings
-from app.schemas.user import TokenData
+from app.database import get_db
+from app.models.user import User, UserRole
+from app.schemas.user import Principal, TokenData
+from app.utils import principal_cache
+from app.utils.password_hasher import get_hasher, pwd_context
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
 
@@ -21,6 +25,21 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def get_password_hashes(passwords: List[str]) -> List[str]:
+    """비밀번호 일괄 해시 (대량 사용자 등록용, 해시 전용 프로세스 풀에서 처리, 입력 순서 유지)"""
+    return get_hasher().hash_many(passwords)
+
+
+async def verify_password_offloaded(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """비밀번호 검증을 해시 전용 프로세스 풀에서 수행 (비용이 바뀐 해시면 새 해시 함께 반환)"""
+    return await get_hasher().verify_and_update(plain_password, hashed_password)
+
+
+async def get_password_hash_offloaded(password: str) -> str:
+    """비밀번호 해시를 해시 전용 프로세스 풀에서 수행"""
+    return await get_hasher().hash(password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     if expires_delta:
@@ -36,30 +55,107 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-def verify_token(token: str) -> Optional[TokenData]:
+def token_claims(user: User) -> dict:
+    """액세스 토큰 클레임 (권한 + 소속 판매소/체척업체 + 토큰 버전)"""
+    return {
+        "sub": str(user.id),
+        "username": user.username,
+        "role": user.role.value,
+        "sales_office_id": user.sales_office_id,
+        "tailor_company_id": user.tailor_company_id,
+        "ver": user.token_version or 0,
+    }
+
+
+def decode_token(token: str) -> Optional[dict]:
+    """서명/만료 검증 후 페이로드 반환 (유효하지 않으면 None)"""
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        user_id_str: str = payload.get("sub")
-        username: str = payload.get("username")
-        role: str = payload.get("role")
-        if user_id_str is None:
-            return None
-        return TokenData(user_id=int(user_id_str), username=username, role=role)
     except JWTError:
         return None
+    if payload.get("sub") is None:
+        return None
+    return payload
+
+
+def _token_data(payload: dict) -> dict:
+    return {
+        "user_id": int(payload["sub"]),
+        "username": payload.get("username"),
+        "role": payload.get("role"),
+        "sales_office_id": payload.get("sales_office_id"),
+        "tailor_company_id": payload.get("tailor_company_id"),
+        "token_version": payload.get("ver"),
+    }
+
+
+def verify_token(token: str) -> Optional[TokenData]:
+    payload = decode_token(token)
+    if payload is None:
+        return None
+    return TokenData(**_token_data(payload))
+
+
+def _resolve_principal(token: str, db: Session) -> Optional[Principal]:
+    """
+    토큰 검증 + 토큰 버전 확인 후 인증 주체 캐시에 저장
+    - 소속 범위는 토큰 클레임을 그대로 사용, DB 는 토큰 버전과 활성 여부만 확인
+    - 토큰 버전이 다르면(권한/소속 변경 전 발급, 버전 클레임 없는 이전 형식) 무효
+    - 캐시 유지 시간은 토큰 만료 시각과 PRINCIPAL_CACHE_TTL 중 짧은 쪽
+    """
+    payload = decode_token(token)
+    if payload is None:
+        return None
+    data = _token_data(payload)
+    version = principal_cache.user_version(data["user_id"])
+    row = db.query(User.token_version, User.is_active).filter(User.id == data["user_id"]).first()
+    if row is None or data["token_version"] != (row.token_version or 0):
+        return None
 
+    principal = Principal(**data, is_active=row.is_active)
+    ttl = min(payload.get("exp", 0) - time.time(), settings.PRINCIPAL_CACHE_TTL)
+    principal_cache.store(principal_cache.token_key(token), principal, version, ttl)
+    return principal
 
-async def get_current_user(
+
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-) -> TokenData:
+    db: Session = Depends(get_db),
+) -> Principal:
+    """
+    현재 인증 주체 (토큰 클레임 + 소속 판매소/체척업체)
+    - 같은 토큰은 캐시에서 반환하므로 서명 검증과 토큰 버전 확인은 PRINCIPAL_CACHE_TTL 당 1회
+    - 비활성화된 계정은 403
+    """
     token = credentials.credentials
-    token_data = verify_token(token)
-    if token_data is None:
+    principal = principal_cache.lookup(principal_cache.token_key(token)) or _resolve_principal(token, db)
+    if principal is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="유효하지 않은 토큰입니다",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    return token_data
+    if not principal.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="비활성화된 계정입니다",
+        )
+    return principal
+
+
+def get_sales_office_scope(current_user: Principal = Depends(get_current_user)) -> Optional[int]:
+    """
+    판매소 업무 범위 (토큰 클레임 기준, 추가 조회 없음)
+    - 관리자: None (전체 판매소)
+    - 판매소 담당자: 소속 판매소 ID, 소속이 없으면 403
+    - 그 외 역할: 403
+    """
+    if current_user.role == UserRole.ADMIN.value:
+        return None
+    if current_user.role == UserRole.SALES_OFFICE.value:
+        if current_user.sales_office_id:
+            return current_user.sales_office_id
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="판매소 정보가 없습니다")
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="접근 권한이 없습니다")
@@ -0,0 +1,138 @@
+"""
+업무 번호 생성 (주문번호/체척권번호)
+- 형식: {접두어}-YYYYMMDD-{10자리}, 10자리는 [당일 경과 ms 27bit | 워커 ID 10bit | 순번 12bit] 를 Crockford Base32 로 표기
+- 같은 날짜 안에서 문자열 순서 = 생성 순서 → 유니크 인덱스에 항상 오른쪽 끝으로 추가되고, 번호 접두어로 범위 검색 가능
+- 같은 ms 에 순번(4096개)을 다 쓰면 다음 ms 값을 미리 사용, 시계가 뒤로 가면 마지막 시각을 계속 사용 (프로세스 안에서 단조 증가)
+- 워커 ID 는 NUMBER_WORKER_ID 설정 (0~1023), 음수(기본)면 호스트명 + 프로세스 ID 해시로 정함
+- 해시로 정한 워커 ID 는 드물게 겹칠 수 있음 → 번호 유니크 충돌 시 새 번호로 한 번 더 저장 (flush_numbered, insert_numbered)
+"""
+import hashlib
+import os
+import socket
+import threading
+from datetime import datetime
+from functools import lru_cache
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"  # Crockford Base32 (문자 코드 순 = 값 순)
+SUFFIX_LENGTH = 10
+WORKER_BITS = 10
+SEQUENCE_BITS = 12
+MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+
+# 번호 유니크 충돌 시 새 번호로 다시 저장하는 횟수
+NUMBER_RETRIES = 1
+
+# 접두어 검색 상한 (업무 번호에 쓰이는 문자 중 가장 큰 문자를 번호 길이보다 길게 붙임)
+PREFIX_UPPER_PAD = "Z" * 32
+
+
+def _encode(value: int) -> str:
+    chars = []
+    for _ in range(SUFFIX_LENGTH):
+        value, digit = divmod(value, 32)
+        chars.append(ALPHABET[digit])
+    return "".join(reversed(chars))
+
+
+@lru_cache(maxsize=4)
+def _derived_worker_id(pid: int) -> int:
+    # 컨테이너마다 프로세스 ID 가 같아도(보통 1) 호스트명이 다르므로 둘을 함께 해시
+    digest = hashlib.blake2b(f"{socket.gethostname()}:{pid}".encode(), digest_size=4).digest()
+    return int.from_bytes(digest, "big") % (1 << WORKER_BITS)
+
+
+def default_worker_id() -> int:
+    if settings.NUMBER_WORKER_ID >= 0:
+        return settings.NUMBER_WORKER_ID % (1 << WORKER_BITS)
+    return _derived_worker_id(os.getpid())
+
+
+class NumberGenerator:
+    """날짜 접두어가 붙은 시간순 업무 번호 생성기 (스레드 안전)"""
+
+    def __init__(self, prefix: str, worker_id: int | None = None):
+        self.prefix = prefix
+        self._worker_id = None if worker_id is None else worker_id % (1 << WORKER_BITS)
+        self._lock = threading.Lock()
+        self._last = ("", -1)
+        self._sequence = 0
+
+    @property
+    def worker_id(self) -> int:
+        # 미지정 시 호출 시점에 계산 (앱을 불러온 뒤 fork 한 워커도 각자의 프로세스 ID 사용)
+        return default_worker_id() if self._worker_id is None else self._worker_id
+
+    def next(self, now: datetime | None = None) -> str:
+        now = now or datetime.now()
+        day = now.strftime("%Y%m%d")
+        millis = ((now.hour * 60 + now.minute) * 60 + now.second) * 1000 + now.microsecond // 1000
+
+        worker_id = self.worker_id
+        with self._lock:
+            last_day, last_millis = self._last
+            if day < last_day or (day == last_day and millis <= last_millis):
+                # 같은 ms 이거나 시계가 뒤로 간 경우: 마지막 시각에서 순번 증가
+                day, millis = last_day, last_millis
+                self._sequence += 1
+                if self._sequence > MAX_SEQUENCE:
+                    millis += 1
+                    self._sequence = 0
+            else:
+                self._sequence = 0
+            self._last = (day, millis)
+            value = (millis << (WORKER_BITS + SEQUENCE_BITS)) | (worker_id << SEQUENCE_BITS) | self._sequence
+
+        return f"{self.prefix}-{day}-{_encode(value)}"
+
+
+def _is_number_conflict(error: IntegrityError, column_name: str) -> bool:
+    return column_name in str(error.orig)
+
+
+def flush_numbered(db: Session, obj, column_name: str, generate) -> None:
+    """
+    번호가 붙은 새 객체 저장(flush), 번호 유니크 충돌이면 롤백 후 새 번호로 다시 저장
+    - 트랜잭션의 첫 쓰기일 때만 사용 (충돌 시 트랜잭션 전체를 롤백)
+    """
+    for attempt in range(NUMBER_RETRIES + 1):
+        db.add(obj)
+        try:
+            db.flush()
+            return
+        except IntegrityError as e:
+            db.rollback()
+            if attempt == NUMBER_RETRIES or not _is_number_conflict(e, column_name):
+                raise
+            setattr(obj, column_name, generate())
+
+
+def insert_numbered(db: Session, model, rows: list, column_name: str, generate) -> list:
+    """
+    번호가 붙은 행 일괄 INSERT (입력 순서대로 ID 반환), 번호 유니크 충돌이면 롤백 후 모든 행에 새 번호로 다시 INSERT
+    - 트랜잭션의 첫 쓰기일 때만 사용 (충돌 시 트랜잭션 전체를 롤백)
+    """
+    for attempt in range(NUMBER_RETRIES + 1):
+        try:
+            return db.execute(insert(model).returning(model.id, sort_by_parameter_order=True), rows).scalars().all()
+        except IntegrityError as e:
+            db.rollback()
+            if attempt == NUMBER_RETRIES or not _is_number_conflict(e, column_name):
+                raise
+            for row in rows:
+                row[column_name] = generate()
+
+
+def prefix_filters(column, prefix: str) -> list:
+    """
+    업무 번호 접두어 검색 조건 (대문자/숫자/하이픈 번호 전용)
+    - LIKE '%...%' 는 인덱스를 쓸 수 없으므로 column >= 접두어 AND column < 접두어 + 'ZZ..' 범위로 인덱스 검색
+    - 정렬 규칙(collation)과 무관하게 정확하도록 접두어 일치(LIKE '접두어%') 조건을 함께 적용
+    """
+    prefix = prefix.upper()
+    return [column >= prefix, column < prefix + PREFIX_UPPER_PAD, column.startswith(prefix, autoescape=True)]
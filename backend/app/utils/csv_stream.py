@@ -0,0 +1,37 @@
+"""
+CSV 스트리밍 응답
+- 행을 일정 크기 단위로 모아 인코딩 후 바로 전송, 전체 파일을 메모리에 만들지 않음
+- Excel 에서 한글이 깨지지 않도록 UTF-8 BOM 으로 시작
+"""
+import csv
+import io
+from typing import Iterable, Iterator, Sequence
+
+from fastapi.responses import StreamingResponse
+
+CHUNK_SIZE = 64 * 1024
+
+
+def iter_csv(header: Sequence[str], rows: Iterable[Sequence], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """헤더와 행을 CSV 로 변환하여 chunk_size 바이트 내외 단위로 반환"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")
+    writer.writerow(header)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def csv_response(filename: str, header: Sequence[str], rows: Iterable[Sequence]) -> StreamingResponse:
+    """CSV 다운로드 응답 (rows 는 응답 전송 중에 순회)"""
+    return StreamingResponse(
+        iter_csv(header, rows),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,16 @@
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+
+
+def date_range_filters(column, start_date: Optional[date] = None, end_date: Optional[date] = None) -> list:
+    """
+    날짜 기간(양 끝 포함)을 일시 컬럼의 반열린 구간 조건으로 변환
+    - func.date(column) 비교는 컬럼을 함수로 감싸 인덱스를 쓸 수 없으므로
+      column >= 시작일 00:00 AND column < (종료일 + 1일) 00:00 형태로 비교
+    """
+    filters = []
+    if start_date:
+        filters.append(column >= datetime.combine(start_date, time.min))
+    if end_date:
+        filters.append(column < datetime.combine(end_date + timedelta(days=1), time.min))
+    return filters
@@ -0,0 +1,140 @@
+"""
+비밀번호 해시 전용 실행기
+- bcrypt 해시/검증은 CPU 연산이라 요청 스레드풀에서 돌리면 로그인 폭주 시 다른 API 가 스레드를 잃음
+- 별도 프로세스 풀(PASSWORD_HASH_WORKERS)에서 처리하고, 요청 핸들러는 결과를 await
+- 처리 중 + 대기 작업이 PASSWORD_HASH_WORKERS + PASSWORD_HASH_QUEUE_SIZE 를 넘으면 즉시 HasherBusyError
+- bcrypt 비용은 BCRYPT_ROUNDS 설정, 다른 비용으로 저장된 해시는 로그인 성공 시 재해시 대상으로 반환
+"""
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import List, Optional, Tuple
+
+from passlib.context import CryptContext
+
+from app.config import settings
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+
+class HasherBusyError(Exception):
+    """해시 실행기 대기열이 가득 참"""
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify_and_update(password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    return pwd_context.verify_and_update(password, hashed_password)
+
+
+class PasswordHasher:
+    """프로세스 풀 기반 비밀번호 해시 실행기 (풀은 최초 사용 시 생성)"""
+
+    def __init__(self, workers: int = 0, queue_size: int = 64):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._total_seconds = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def _submit(self, fn, *args, bounded: bool = True):
+        """작업 제출 (bounded 이면 상한 초과 시 HasherBusyError), 완료 시 지표 갱신"""
+        executor = self._get_executor()
+        with self._lock:
+            if bounded and self._in_flight >= self.workers + self.queue_size:
+                self._rejected += 1
+                raise HasherBusyError("비밀번호 처리 요청이 많습니다. 잠시 후 다시 시도해 주세요")
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+        started = time.perf_counter()
+
+        def done(future):
+            with self._lock:
+                self._in_flight -= 1
+                self._total_seconds += time.perf_counter() - started
+                if future.cancelled() or future.exception() is not None:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+
+        try:
+            future = executor.submit(fn, *args)
+        except Exception:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        future.add_done_callback(done)
+        return future
+
+    async def hash(self, password: str) -> str:
+        return await asyncio.wrap_future(self._submit(_hash, password))
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """비밀번호 검증, 설정과 다른 비용의 해시면 새 해시를 함께 반환"""
+        return await asyncio.wrap_future(self._submit(_verify_and_update, password, hashed_password))
+
+    def hash_many(self, passwords: List[str]) -> List[str]:
+        """
+        비밀번호 일괄 해시 (동기, 입력 순서 유지)
+        - 동시에 제출하는 작업을 워커 수로 스스로 제한하므로 상한 검사 없이 제출
+        - 일괄 작업 중에도 로그인 요청이 대기열에 끼어들 수 있음
+        """
+        results: List[Optional[str]] = [None] * len(passwords)
+        pending = {}
+        for index, password in enumerate(passwords):
+            if len(pending) >= self.workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[pending.pop(future)] = future.result()
+            pending[self._submit(_hash, password, bounded=False)] = index
+        for future in pending:
+            results[pending[future]] = future.result()
+        return results
+
+    def metrics(self) -> dict:
+        with self._lock:
+            finished = self._completed + self._failed
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "rounds": settings.BCRYPT_ROUNDS,
+                "in_flight": self._in_flight,
+                "peak_in_flight": self._peak_in_flight,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "avg_ms": round(self._total_seconds / finished * 1000, 1) if finished else 0,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+_hasher: Optional[PasswordHasher] = None
+
+
+def get_hasher() -> PasswordHasher:
+    """설정값으로 생성한 프로세스 공용 해시 실행기"""
+    global _hasher
+    if _hasher is None:
+        _hasher = PasswordHasher(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE_SIZE)
+    return _hasher
@@ -0,0 +1,60 @@
+"""
+인증 주체(principal) 캐시
+- 키: 토큰 SHA-256 해시, 값: 검증된 클레임(소속 판매소/체척업체 포함) + 계정 활성 여부
+- 토큰 만료 시각(exp)과 PRINCIPAL_CACHE_TTL 중 짧은 시간만 유지, PRINCIPAL_CACHE_MAX_ENTRIES 초과 시 오래 안 쓴 항목부터 제거
+- 같은 토큰의 후속 요청은 서명 검증과 토큰 버전 확인 없이 캐시에서 반환
+- 사용자 변경 커밋 후 invalidate_user() 로 이 프로세스의 해당 사용자 항목 즉시 무효화
+- 다른 워커는 PRINCIPAL_CACHE_TTL 경과 후 토큰 버전(users.token_version) 확인으로 이전 토큰을 거부
+"""
+import hashlib
+import threading
+from typing import Optional
+
+from app.config import settings
+from app.schemas.user import Principal
+from app.utils.cache import MemoryCache
+
+_lock = threading.Lock()
+_user_versions: dict = {}
+_cache: Optional[MemoryCache] = None
+
+
+def _get_cache() -> MemoryCache:
+    global _cache
+    if _cache is None:
+        _cache = MemoryCache(settings.PRINCIPAL_CACHE_MAX_ENTRIES)
+    return _cache
+
+
+def token_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def user_version(user_id: int) -> int:
+    """사용자별 무효화 버전 (조회 전에 읽어 두고 저장 시 함께 기록)"""
+    return _user_versions.get(user_id, 0)
+
+
+def lookup(key: str) -> Optional[Principal]:
+    entry = _get_cache().get(key)
+    if entry is None:
+        return None
+    version, principal = entry
+    if version != user_version(principal.user_id):
+        return None
+    return principal
+
+
+def store(key: str, principal: Principal, version: int, ttl: float) -> None:
+    if ttl > 0:
+        _get_cache().set(key, (version, principal), ttl)
+
+
+def invalidate_user(user_id: int) -> None:
+    """사용자 정보 변경 커밋 후 호출, 해당 사용자의 모든 토큰 항목이 다음 요청에서 다시 조회됨"""
+    with _lock:
+        _user_versions[user_id] = _user_versions.get(user_id, 0) + 1
+
+
+def clear() -> None:
+    _get_cache().clear()
@@ -0,0 +1,83 @@
+"""
+버전 + TTL 스냅샷 캐시
+- build(db) 로 만든 값을 프로세스 메모리에 보관, invalidate() 로 버전이 바뀌거나 TTL(설정 이름) 경과 시 다음 조회에서 재구성
+- 재구성은 한 스레드만 수행 (serve_stale 이면 그동안 다른 스레드는 이전 값으로 응답)
+- update(change): 현재 값을 제자리에서 변경 (재구성 중이면 새 값에도 다시 적용 후 교체), 값 읽기/변경은 lock 안에서
+- 카테고리/메뉴 트리, 사용자 자동완성 인덱스가 사용
+"""
+import threading
+import time
+from typing import Callable, Generic, NamedTuple, Optional, TypeVar
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+T = TypeVar("T")
+
+
+class _Entry(NamedTuple):
+    version: int
+    built_at: float
+    value: object
+
+
+class SnapshotCache(Generic[T]):
+    def __init__(self, build: Callable[[Session], T], ttl_setting: str, serve_stale: bool = False):
+        self._build = build
+        self._ttl_setting = ttl_setting
+        self._serve_stale = serve_stale
+        self.lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._version = 0
+        self._entry: Optional[_Entry] = None
+        self._pending: Optional[list] = None
+
+    def _is_fresh(self, entry: _Entry) -> bool:
+        return entry.version == self._version and time.monotonic() - entry.built_at < getattr(settings, self._ttl_setting)
+
+    def get(self, db: Session) -> T:
+        """현재 값 반환, 무효화되었거나 만료되었으면 재구성"""
+        entry = self._entry
+        if entry is not None and self._is_fresh(entry):
+            return entry.value
+
+        if entry is not None and self._serve_stale:
+            if not self._build_lock.acquire(blocking=False):
+                return entry.value
+        else:
+            self._build_lock.acquire()
+        try:
+            entry = self._entry
+            if entry is not None and self._is_fresh(entry):
+                return entry.value
+            with self.lock:
+                version = self._version
+                self._pending = []
+            try:
+                value = self._build(db)
+            except Exception:
+                with self.lock:
+                    self._pending = None
+                raise
+            with self.lock:
+                for change in self._pending:
+                    change(value)
+                self._pending = None
+                self._entry = _Entry(version, time.monotonic(), value)
+            return value
+        finally:
+            self._build_lock.release()
+
+    def update(self, change: Callable[[T], None]) -> None:
+        """현재 값에 변경 적용 (값이 없으면 다음 구성에 반영되므로 무시)"""
+        with self.lock:
+            if self._entry is not None:
+                change(self._entry.value)
+            if self._pending is not None:
+                self._pending.append(change)
+
+    def invalidate(self) -> None:
+        """원본 변경 커밋 후 호출 (버전 증가)"""
+        with self.lock:
+            self._version += 1
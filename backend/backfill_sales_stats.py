@@ -0,0 +1,29 @@
+"""
+판매 통계 롤업 재집계 (backfill)
+- 롤업 테이블 최초 생성 후, 또는 집계가 어긋났을 때 주문 테이블에서 다시 계산
+- 사용법: python backfill_sales_stats.py [--start YYYY-MM-DD] [--end YYYY-MM-DD]
+"""
+import argparse
+from datetime import date
+
+from app.database import SessionLocal, init_db
+from app.services import sales_stats_service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="판매 통계 롤업 재집계")
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="시작일 (주문일 기준, 포함)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="종료일 (주문일 기준, 포함)")
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    try:
+        daily_count, item_count = sales_stats_service.rebuild(db, args.start, args.end)
+        print(f"재집계 완료: 일별 {daily_count}행, 품목별 {item_count}행")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,15 @@
 """데이터베이스 초기화 및 시드 데이터"""
-from app.database import engine, SessionLocal, Base
+from app.database import engine, SessionLocal, Base, ensure_columns, ensure_indexes
 from app.models import *
 from app.utils.auth import get_password_hash
 from app.services.menu_service import MenuService
+from app.services.text_search import ensure_search_indexes
 
 def init_db():
     Base.metadata.create_all(bind=engine)
+    ensure_columns()
+    ensure_indexes()
+    ensure_search_indexes()
     print("테이블 생성 완료")
     
     # 기본 메뉴 초기화
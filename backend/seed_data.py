@@ -3,11 +3,13 @@ import random
 from datetime import datetime, timedelta, date
 from app.database import engine, SessionLocal, Base
 from app.models import *
+from app.services.text_search import ensure_search_indexes
 from app.utils.auth import get_password_hash
 
 def init_db():
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    ensure_search_indexes()
     print("테이블 재생성 완료")
 
 def create_ranks(db):
@@ -0,0 +1,309 @@
+"""
+동시성 정합성 테스트 스크립트
+- 여러 스레드가 같은 사용자의 포인트를 동시에 예약/해제/사용할 때 잔액 어긋남(drift)이 없는지 검증
+- 여러 스레드가 같은 재고 행에 동시에 온라인 주문을 넣을 때 초과 예약(oversell)이 없는지 검증
+- 로그인 폭주 시 비밀번호 검증이 이벤트 루프를 막지 않고, 해시 대기열 상한을 넘는 요청은 즉시 거절되는지 검증
+- 각 스레드는 별도 DB 세션 사용
+- 5회 반복 실행 (해시 실행기 검증은 1회)
+"""
+import asyncio
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi import HTTPException
+
+from app.database import SessionLocal
+from app.routers.auth import login
+from app.schemas.user import UserLogin
+from app.models.user import User
+from app.models.point import PointTransaction
+from app.models.sales import Inventory
+from app.models.order import OrderType, PaymentMethod
+from app.schemas.order import OrderCreate, OrderItemCreate, OrderCancel
+from app.services.order_service import create_order, cancel_order, InsufficientStockError
+from app.services.point_service import PointService
+from app.utils.auth import get_password_hash
+from app.utils.password_hasher import HasherBusyError, PasswordHasher
+
+
+THREADS = 8
+OPS_PER_THREAD = 25
+AMOUNT = 1000
+INITIAL_POINT = 50000
+STOCK_QUANTITY = 20
+ORDERS_PER_THREAD = 5
+LOGIN_STORM = 6
+
+
+def run_point_worker(user_id, results, lock):
+    """무작위 포인트 연산 수행 후 성공 건수 집계"""
+    db = SessionLocal()
+    counts = {'reserve': 0, 'release': 0, 'use': 0, 'rejected': 0}
+    try:
+        service = PointService(db)
+        for _ in range(OPS_PER_THREAD):
+            op = random.choice(['reserve', 'reserve', 'release', 'use'])
+            try:
+                if op == 'reserve':
+                    service.reserve_point(user_id, AMOUNT, description="동시성 테스트 예약")
+                elif op == 'release':
+                    service.release_point(user_id, AMOUNT, description="동시성 테스트 해제")
+                else:
+                    service.use_point(user_id, AMOUNT, description="동시성 테스트 사용")
+                counts[op] += 1
+            except ValueError:
+                db.rollback()
+                counts['rejected'] += 1
+    finally:
+        db.close()
+
+    with lock:
+        for key, value in counts.items():
+            results[key] += value
+
+
+def test_concurrent_point_ledger(db, user):
+    """동시 예약/해제/사용 후 잔액 = 초기값 + 성공 연산 합계"""
+    print("\n=== 포인트 동시성 테스트 ===")
+
+    user.current_point = INITIAL_POINT
+    user.reserved_point = 0
+    db.commit()
+    last_transaction_id = db.query(PointTransaction.id).order_by(PointTransaction.id.desc()).limit(1).scalar() or 0
+
+    results = {'reserve': 0, 'release': 0, 'use': 0, 'rejected': 0}
+    lock = threading.Lock()
+    threads = [
+        threading.Thread(target=run_point_worker, args=(user.id, results, lock))
+        for _ in range(THREADS)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    db.expire_all()
+    final = db.query(User).filter(User.id == user.id).first()
+    expected_current = INITIAL_POINT - results['use'] * AMOUNT
+    expected_reserved = (results['reserve'] - results['release']) * AMOUNT
+    transaction_count = db.query(PointTransaction).filter(
+        PointTransaction.user_id == user.id,
+        PointTransaction.id > last_transaction_id,
+    ).count()
+
+    print(f"성공: 예약 {results['reserve']}, 해제 {results['release']}, 사용 {results['use']}, 거부 {results['rejected']}")
+    print(f"최종: 보유 {final.current_point}P (기대 {expected_current}P), 예약 {final.reserved_point}P (기대 {expected_reserved}P)")
+
+    assert final.current_point == expected_current, "보유 포인트가 성공 연산 합계와 다름"
+    assert final.reserved_point == expected_reserved, "예약 포인트가 성공 연산 합계와 다름"
+    assert 0 <= final.reserved_point <= final.current_point, "예약 포인트가 보유 포인트를 초과함"
+    assert transaction_count == results['reserve'] + results['release'] + results['use'], "거래 내역 수가 성공 연산 수와 다름"
+
+    print("✅ 포인트 동시성 테스트 통과")
+    return True
+
+
+def run_order_worker(user_id, inventory, results, lock):
+    """같은 재고 행에 1개씩 온라인 주문 반복"""
+    db = SessionLocal()
+    created = []
+    shortages = 0
+    try:
+        order_data = OrderCreate(
+            sales_office_id=inventory['sales_office_id'],
+            order_type=OrderType.ONLINE,
+            items=[OrderItemCreate(
+                item_id=inventory['item_id'],
+                spec_id=inventory['spec_id'],
+                quantity=1,
+                payment_method=PaymentMethod.POINT,
+            )],
+        )
+        for _ in range(ORDERS_PER_THREAD):
+            try:
+                order = create_order(db, user_id, order_data)
+                created.append(order.id)
+            except InsufficientStockError as e:
+                db.rollback()
+                assert e.shortages and e.shortages[0]['requested'] == 1, "재고 부족 응답에 품목 정보가 없음"
+                shortages += 1
+    finally:
+        db.close()
+
+    with lock:
+        results['created'].extend(created)
+        results['shortages'] += shortages
+
+
+def test_concurrent_inventory_reservation(db, user, inventory):
+    """동시 주문 후 예약 수량 = 성공 주문 수 <= 실재고"""
+    print("\n=== 재고 동시 예약 테스트 ===")
+
+    inventory.quantity = STOCK_QUANTITY
+    inventory.reserved_quantity = 0
+    user.current_point = 100000000
+    user.reserved_point = 0
+    db.commit()
+    target = {
+        'sales_office_id': inventory.sales_office_id,
+        'item_id': inventory.item_id,
+        'spec_id': inventory.spec_id,
+    }
+
+    results = {'created': [], 'shortages': 0}
+    lock = threading.Lock()
+    threads = [
+        threading.Thread(target=run_order_worker, args=(user.id, target, results, lock))
+        for _ in range(THREADS)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    db.expire_all()
+    reserved = db.query(Inventory.reserved_quantity).filter(Inventory.id == inventory.id).scalar()
+    attempts = THREADS * ORDERS_PER_THREAD
+
+    print(f"주문 시도 {attempts}건: 성공 {len(results['created'])}, 재고 부족 {results['shortages']}")
+    print(f"최종: 실재고 {STOCK_QUANTITY}, 예약 {reserved}")
+
+    assert reserved == len(results['created']), "예약 수량이 성공 주문 수와 다름"
+    assert reserved <= STOCK_QUANTITY, "실재고보다 많이 예약됨 (oversell)"
+    assert len(results['created']) == min(attempts, STOCK_QUANTITY), "가용 재고가 있는데 주문이 거부됨"
+    assert len(results['created']) + results['shortages'] == attempts, "처리되지 않은 주문 시도가 있음"
+
+    # 생성한 주문 취소 → 예약 재고 원복
+    for order_id in results['created']:
+        cancel_order(db, order_id, user.id, OrderCancel(reason="동시성 테스트"))
+    db.expire_all()
+    reserved = db.query(Inventory.reserved_quantity).filter(Inventory.id == inventory.id).scalar()
+    assert reserved == 0, "주문 취소 후 예약 재고가 남음"
+
+    print("✅ 재고 동시 예약 테스트 통과")
+    return True
+
+
+def test_password_hasher_storm(db):
+    """
+    해시 실행기: 워커 1 + 대기 2 인 실행기에 LOGIN_STORM 건을 동시에 요청
+    - 상한(3건)까지만 처리되고 나머지는 즉시 HasherBusyError
+    - 검증이 도는 동안에도 이벤트 루프의 다른 코루틴이 지연 없이 실행됨
+    - 로그인 라우트는 올바른 비밀번호만 토큰 발급
+    """
+    print(f"\n--- 해시 실행기 (동시 검증 {LOGIN_STORM}건, 워커 1 + 대기 2) ---")
+    hasher = PasswordHasher(workers=1, queue_size=2)
+    hashed = get_password_hash("storm123")
+
+    async def storm():
+        gaps = []
+        stop = asyncio.Event()
+
+        async def ticker():
+            last = time.perf_counter()
+            while not stop.is_set():
+                await asyncio.sleep(0.01)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        async def attempt(password):
+            try:
+                verified, _ = await hasher.verify_and_update(password, hashed)
+                return verified
+            except HasherBusyError:
+                return None
+
+        tick = asyncio.create_task(ticker())
+        results = await asyncio.gather(*(attempt("storm123" if i % 2 == 0 else "wrong") for i in range(LOGIN_STORM)))
+        stop.set()
+        await tick
+        return results, max(gaps)
+
+    try:
+        results, max_gap = asyncio.run(storm())
+    finally:
+        hasher.shutdown()
+    metrics = hasher.metrics()
+    print(f"결과: {results}, 이벤트 루프 최대 지연 {max_gap * 1000:.0f}ms, 지표 {metrics}")
+
+    success = True
+    if results[:3] != [True, False, True] or results[3:] != [None] * (LOGIN_STORM - 3):
+        print("❌ 상한까지만 처리되고 나머지는 거절되어야 함")
+        success = False
+    if metrics['rejected'] != LOGIN_STORM - 3 or metrics['completed'] != 3:
+        print(f"❌ 지표 불일치: {metrics}")
+        success = False
+    if max_gap > 0.2:
+        print(f"❌ 비밀번호 검증 중 이벤트 루프 지연: {max_gap * 1000:.0f}ms")
+        success = False
+
+    # 로그인 라우트 (해시 전용 프로세스 풀에서 검증)
+    username = db.query(User.username).filter(User.username == 'admin').scalar()
+    if username:
+        token = asyncio.run(login(UserLogin(username=username, password="admin123"), db))
+        try:
+            asyncio.run(login(UserLogin(username=username, password="wrong-password"), db))
+            rejected = False
+        except HTTPException as e:
+            rejected = e.status_code == 401
+        if not token.get("access_token") or not rejected:
+            print("❌ 로그인 라우트 검증 결과 이상")
+            success = False
+
+    if success:
+        print("✅ 해시 실행기 통과")
+    return success
+
+
+def run_tests():
+    """전체 테스트 실행"""
+    db = SessionLocal()
+
+    try:
+        user = db.query(User).filter(User.role == 'general').first()
+        if not user:
+            print("테스트 데이터가 부족합니다.")
+            return
+
+        inventory = db.query(Inventory).filter(Inventory.spec_id != None).first()
+        if not inventory:
+            print("테스트 데이터가 부족합니다.")
+            return
+
+        original = (user.current_point, user.reserved_point)
+        original_stock = (inventory.quantity, inventory.reserved_quantity)
+        print(f"사용자: {user.name} (ID: {user.id})")
+        print(f"재고: ID {inventory.id} (판매소 {inventory.sales_office_id}, 품목 {inventory.item_id}, 규격 {inventory.spec_id})")
+
+        results = {'point_ledger': 0, 'inventory_reservation': 0}
+        for i in range(5):
+            print(f"\n{'='*50}")
+            print(f"반복 {i+1}/5")
+            print('='*50)
+            if test_concurrent_point_ledger(db, user):
+                results['point_ledger'] += 1
+            if test_concurrent_inventory_reservation(db, user, inventory):
+                results['inventory_reservation'] += 1
+
+        hasher_ok = test_password_hasher_storm(db)
+
+        print(f"\n포인트 동시성: {results['point_ledger']}/5 성공")
+        print(f"재고 동시 예약: {results['inventory_reservation']}/5 성공")
+        print(f"해시 실행기: {'성공' if hasher_ok else '실패'}")
+
+        # 테스트 전 포인트/재고 상태 복원
+        user.current_point, user.reserved_point = original
+        inventory.quantity, inventory.reserved_quantity = original_stock
+        db.commit()
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    run_tests()
@@ -0,0 +1,1489 @@
+"""
+쿼리 성능 측정 스크립트
+- 주요 조회 화면의 페이지 크기별 쿼리 수 및 응답 시간 측정
+- 쿼리 수가 페이지 크기와 무관하게 일정한지 검증 (N+1 회귀 방지)
+- 포인트 거래 내역 커서 페이지가 오프셋 페이지와 같은 순서로 중복/누락 없이 이어지고, 깊은 페이지도 인덱스 범위 조회 1회인지 검증
+- 연간 포인트 일괄 지급이 기존 사용자별 지급과 같은 결과를 청크당 3문으로 만들고, 충돌 청크는 개별 지급으로 처리하는지 검증
+- 일괄 포인트 지급이 청크당 UPDATE/INSERT 1회로 처리되고, 오류 시 전체 취소되는지 검증
+- 판매 통계 롤업이 주문 테이블 집계와 일치하는지 검증
+- 카테고리 트리 스냅샷이 카테고리 단위 재귀 조회 결과와 같고, 변경 시에만 다시 조회되는지 검증
+- 카테고리 엑셀 일괄 등록이 행 수와 무관하게 단계별 일괄 INSERT 로 처리되는지 검증
+- 카테고리/카탈로그 CSV 내보내기가 단일 쿼리로 읽으며 전체를 읽기 전에 전송을 시작하는지 검증
+- 사용자 일괄 등록이 중복 확인 2회 + 청크별 INSERT 로 처리되고 행별 오류를 반환하는지 검증
+- 메뉴 트리(전체/역할별) 스냅샷이 메뉴 단위 재귀 조회 결과와 같고, 변경 시에만 다시 조회되는지 검증
+- 인증 주체가 토큰당 1회만 확인되고, 소속 변경 후에는 이전 토큰이 거부되는지 검증
+- 여러 사용자 일괄 주문이 주문 수와 무관한 SQL 문 수로 저장되고 주문별 실패 사유를 반환하는지 검증
+- 여러 주문 일괄 반품이 주문 수와 무관한 쿼리 수로 재고를 복구하고 주문별 결과를 반환하는지 검증
+- 주문번호 생성기가 스레드 간 충돌 없이 시간순 번호를 만드는지 검증, 기존 무작위 번호와 INSERT 처리량 비교
+- 사용자 키워드 검색이 대량 사용자에서 부분 일치 스캔 없이 트라이그램/군번 인덱스로 같은 결과를 반환하는지 검증
+- 사용자 자동완성이 메모리 인덱스에서 쿼리 없이 1ms 미만으로 응답하고, 사용자 생성/수정/삭제가 재구성 없이 반영되는지 검증
+- 대시보드 캐시 적중 시 쿼리가 없고, 주문 변경 후에는 새로 계산되는지 검증
+- 통계 쿼리가 대량 데이터에서 전체 테이블 스캔으로 회귀하지 않는지 실행 계획(EXPLAIN)으로 검증
+"""
+import os
+import sys
+import threading
+import time
+import uuid
+from io import BytesIO
+from contextlib import contextmanager
+from datetime import date, datetime, time as dt_time, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import Column, Integer, MetaData, String, Table, delete, event, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal, engine
+from app.models.menu import Menu
+from app.models.clothing import Category, CategoryLevel, ClothingItem, ClothingSpec
+from app.models.order import Order, OrderItem, OrderStatus, OrderType, PaymentMethod
+from app.models.point import PointGrant, PointTransaction, PointType, TransactionType
+from app.models.sales import AdjustmentType, Inventory, InventoryHistory, SalesOffice
+from app.models.stats import DailySalesStat, DailyItemSalesStat
+from app.models.user import User
+from app.schemas.clothing import CategoryCreate
+from app.schemas.menu import MenuUpdate
+from app.schemas.user import UserCreate, UserUpdate
+from app.schemas.point import PointBulkGrantRequest, PointGrantYearlyCreate
+from app.schemas.order import BatchOrderCreate, OrderCreate, OrderItemCreate, OrderCancel
+from app.schemas.sales import OfflineSaleCreate, OfflineSaleItem, RefundCreate, RefundItem
+from app.services import order_service
+from app.services.order_service import create_order, cancel_order
+from app.services.sales_service import create_offline_sale, process_refunds
+from app.services.clothing_service import CategoryService
+from app.services.menu_service import MenuService
+from app.services.point_service import PointService, decode_history_cursor, encode_history_cursor
+from app.services.user_service import UserService
+from app.services import category_tree, dashboard_cache, export_service, menu_tree, inventory_service, sales_stats_service, text_search, user_lookup
+from app.routers.inventory import get_inventory, get_available_inventory
+from app.routers.points import get_point_history_cursor, get_user_point_history_cursor
+from app.routers.sales import get_sales_orders
+from app.routers.stats import get_dashboard_stats, get_sales_office_dashboard
+from app.models.user import UserRole
+from app.utils import principal_cache
+from app.utils.auth import TokenData, create_access_token, get_current_user, get_sales_office_scope, token_claims
+from app.utils.business_number import NumberGenerator
+from app.utils.csv_stream import iter_csv
+
+
+PAGE_SIZES = [10, 20, 50, 100]
+REPEAT = 5
+
+# 카테고리 엑셀 일괄 등록 규모 (대분류 x 중분류 x 품목)
+IMPORT_SHAPE = (5, 20, 30)
+
+# 주문번호 INSERT 처리량 비교 행 수 (한 번에 넣는 행 수)
+NUMBER_BENCH_ROWS = 200000
+NUMBER_BENCH_BATCH = 1000
+
+# 키워드 검색 측정 사용자 수
+SEARCH_USER_COUNT = 100000
+SEARCH_SURNAMES = "김이박최정강조윤장임"
+SEARCH_SYLLABLES = "민서준도하지우현수예연은성유진영호재동석태원경희보나"
+
+# 사용자 자동완성 응답 시간 상한(ms)과 반복 횟수
+LOOKUP_LIMIT_MS = 1.0
+LOOKUP_REPEAT = 1000
+
+# 실행 계획 검증 대상 테이블 및 대량 데이터 규모
+PLAN_TABLES = ["orders", "daily_sales_stats", "daily_item_sales_stats"]
+LARGE_ORDER_COUNT = 20000
+LARGE_DAYS = 730
+
+
+@contextmanager
+def count_queries():
+    """블록 안에서 실행된 SQL 문 수 측정"""
+    counter = {'count': 0}
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        counter['count'] += 1
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+@contextmanager
+def count_statements(db):
+    """블록 안에서 세션이 실행한 SQL 문 수 (드라이버가 나눠 보내는 일괄 INSERT 도 1문으로 집계)"""
+    statements = []
+    record = statements.append
+    event.listen(db, 'do_orm_execute', record)
+    try:
+        yield statements
+    finally:
+        event.remove(db, 'do_orm_execute', record)
+
+
+@contextmanager
+def capture_selects():
+    """블록 안에서 실행된 SELECT 문과 파라미터 수집"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def measure(label, func, page_sizes=PAGE_SIZES):
+    """페이지 크기별 쿼리 수와 평균 응답 시간 출력, 페이지 크기별 쿼리 수 반환"""
+    print(f"\n=== {label} ===")
+    print(f"{'page_size':>10} {'queries':>8} {'avg ms':>10}")
+
+    query_counts = {}
+    for page_size in page_sizes:
+        with count_queries() as counter:
+            func(page_size)
+        query_counts[page_size] = counter['count']
+
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            func(page_size)
+        avg_ms = (time.perf_counter() - started) * 1000 / REPEAT
+
+        print(f"{page_size:>10} {query_counts[page_size]:>8} {avg_ms:>10.2f}")
+
+    return query_counts
+
+
+def test_grant_history(db):
+    """관리자 포인트 지급 내역 조회: 페이지 크기와 무관하게 쿼리 수 일정"""
+    service = PointService(db)
+    query_counts = measure(
+        "포인트 지급 내역 (get_grant_history)",
+        lambda page_size: service.get_grant_history(page=1, page_size=page_size),
+    )
+    assert len(set(query_counts.values())) == 1, f"페이지 크기에 따라 쿼리 수가 증가함: {query_counts}"
+    print("✅ 포인트 지급 내역 쿼리 수 일정")
+
+
+def _restore_points(db, balances, last_transaction_id):
+    """포인트 측정 후 사용자 잔액과 거래 내역을 측정 전으로 되돌림"""
+    db.execute(delete(PointTransaction).where(PointTransaction.id > last_transaction_id))
+    for user_id, (current_point, reserved_point) in balances.items():
+        db.query(User).filter(User.id == user_id).update(
+            {User.current_point: current_point, User.reserved_point: reserved_point}, synchronize_session=False
+        )
+    db.commit()
+
+
+def test_history_cursor(db):
+    """포인트 거래 내역 커서 페이지: 오프셋 페이지와 같은 순서로 모두 1회씩, 같은 시각은 ID 순, 깊은 페이지도 인덱스 범위 조회 1회"""
+    print("\n=== 포인트 거래 내역 커서 페이지 (get_history_cursor) ===")
+    service = PointService(db)
+    user_id = db.query(User.id).filter(User.role == 'general').order_by(User.id).limit(1).scalar()
+    admin = TokenData(user_id=db.query(User.id).filter(User.role == 'admin').limit(1).scalar(), role='admin')
+    owner = TokenData(user_id=user_id, role='general')
+    last_transaction_id = db.query(func.max(PointTransaction.id)).scalar() or 0
+    page_size = 7
+    filters = dict(transaction_type=None, start_date=None, end_date=None, include_total=False, db=db)
+
+    # 같은 created_at 을 가진 거래를 시각 순서와 다른 ID 순서로 추가 (3개 시각 x 20건)
+    base = datetime(2001, 1, 1, 9, 0, 0, 123456)
+    db.execute(insert(PointTransaction), [
+        {"user_id": user_id, "transaction_type": TransactionType.GRANT, "amount": 1, "balance_after": 0,
+         "reserved_after": 0, "description": "커서 측정", "created_at": base + timedelta(minutes=i % 3), "updated_at": base}
+        for i in range(60)
+    ])
+    db.commit()
+
+    try:
+        total = db.query(func.count(PointTransaction.id)).filter(PointTransaction.user_id == user_id).scalar()
+        offset_ids = []
+        for page in range(1, -(-total // page_size) + 1):
+            offset_ids += [t.id for t in service.get_history(user_id, page=page, page_size=page_size).items]
+        rows = db.query(PointTransaction.created_at, PointTransaction.id).filter(PointTransaction.user_id == user_id).all()
+        expected = [transaction_id for _, transaction_id in sorted(rows, reverse=True)]
+        assert offset_ids == expected, "오프셋 페이지 순서가 (created_at, id) 내림차순과 다름"
+
+        for label, fetch in [
+            ("GET /api/points/history/cursor", lambda cursor: get_point_history_cursor(
+                cursor=cursor, page_size=page_size, current_user=owner, **filters)),
+            ("GET /api/points/user/{id}/history/cursor", lambda cursor: get_user_point_history_cursor(
+                user_id=user_id, cursor=cursor, page_size=page_size, current_user=admin, **filters)),
+        ]:
+            cursor_ids, page_queries, cursor = [], [], None
+            while True:
+                with count_queries() as counter, capture_selects() as statements:
+                    result = fetch(cursor)
+                page_queries.append(counter['count'])
+                cursor_ids += [t.id for t in result.items]
+                if not result.has_more:
+                    assert result.next_cursor is None, "마지막 페이지에 다음 커서가 있음"
+                    break
+                cursor = result.next_cursor
+            assert cursor_ids == offset_ids, f"{label} 커서 페이지 순서가 오프셋 페이지와 다름"
+            assert len(set(cursor_ids)) == total, f"{label} 중복/누락: {len(set(cursor_ids))}건 (기대 {total})"
+            assert set(page_queries) == {1}, f"{label} 페이지별 쿼리 수: {page_queries}"
+
+            # 마지막(가장 깊은) 페이지도 인덱스 범위 조회, 정렬 단계 없음
+            statement, parameters = statements[-1]
+            plan = [row[-1] for row in db.connection().exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)]
+            assert any("ix_point_transactions_user_created_id" in line for line in plan), f"{label} 인덱스 미사용: {plan}"
+            assert not any("TEMP B-TREE" in line for line in plan), f"{label} 정렬 단계 발생: {plan}"
+            print(f"{label}: {len(page_queries)}페이지, 페이지당 쿼리 1회, 계획 {plan}")
+
+            for bad in ["not-a-cursor", encode_history_cursor(base, 1)[:-3], "WzFd", "eyJ0IjogMX0"]:
+                try:
+                    fetch(bad)
+                except HTTPException as e:
+                    assert e.status_code == 400, f"{label} 잘못된 커서 '{bad}' 응답: {e.status_code}"
+                else:
+                    raise AssertionError(f"{label} 잘못된 커서 '{bad}' 가 거부되지 않음")
+    finally:
+        db.execute(delete(PointTransaction).where(PointTransaction.id > last_transaction_id))
+        db.commit()
+
+    # 커서 인코딩 왕복 (마이크로초 포함)
+    assert decode_history_cursor(encode_history_cursor(base, 42)) == (base, 42), "커서 인코딩 왕복 불일치"
+    print("✅ 커서 페이지 순서/중복 없음, 같은 시각 ID 순 정렬, 깊은 페이지 인덱스 조회, 잘못된 커서 400")
+
+
+def test_grant_yearly(db):
+    """연간 포인트 일괄 지급: 기존 사용자별 지급과 같은 지급/잔액/거래 내역, 재실행 시 지급 없음, 충돌 청크는 개별 지급"""
+    print("\n=== 연간 포인트 일괄 지급 (grant_yearly) ===")
+    service = PointService(db)
+    user_service = UserService(db)
+    year = 2090
+    request = PointGrantYearlyCreate(year=year, grant_date=date(year, 1, 1))
+    users = db.query(User).filter(User.is_active == True, User.rank_id != None).order_by(User.id).all()
+    # 기존 방식: 사용자별 calculate_yearly_point 결과를 지급
+    expected = {u.id: user_service.calculate_yearly_point(u, year, request.grant_date) for u in users}
+    balances = {u.id: (u.current_point, u.reserved_point) for u in db.query(User)}
+    last_transaction_id = db.query(func.max(PointTransaction.id)).scalar() or 0
+    chunk_size = 4
+    chunks = -(-len(users) // chunk_size)
+
+    def restore():
+        _restore_points(db, balances, last_transaction_id)
+        db.execute(delete(PointGrant).where(PointGrant.year == year))
+        db.commit()
+
+    def check_granted(skipped=()):
+        db.expire_all()
+        grants = {g.user_id: g for g in db.query(PointGrant).filter(PointGrant.year == year)}
+        assert set(grants) == set(expected), f"지급 대상 불일치: {sorted(set(grants) ^ set(expected))}"
+        transactions = {
+            t.user_id: t for t in db.query(PointTransaction).filter(PointTransaction.id > last_transaction_id)
+        }
+        assert set(transactions) == set(expected) - set(skipped), "사용자별 지급 거래가 1건씩이 아님"
+        for user_id, calc in expected.items():
+            grant = grants[user_id]
+            actual = (grant.base_amount, grant.service_year_bonus, grant.daily_calc_amount, grant.total_amount)
+            assert actual == tuple(calc[k] for k in ("base_amount", "service_year_bonus", "daily_calc_amount", "total_amount")), (
+                f"사용자 {user_id} 지급 내역: {actual} (기대 {calc})"
+            )
+            if user_id in skipped:
+                continue
+            current_point, reserved_point = balances[user_id]
+            t = transactions[user_id]
+            assert (t.amount, t.balance_after, t.reserved_after, t.point_grant_id, t.reason) == (
+                calc["total_amount"], current_point + calc["total_amount"], reserved_point, grant.id, PointType.ANNUAL.value
+            ), f"사용자 {user_id} 거래 내역 불일치"
+        for user_id, current_point in db.query(User.id, User.current_point):
+            gained = expected[user_id]["total_amount"] if user_id in expected and user_id not in skipped else 0
+            assert current_point == balances[user_id][0] + gained, f"사용자 {user_id} 잔액: {current_point}"
+
+    try:
+        with count_queries() as counter:
+            granted, errors = service.grant_yearly(request, chunk_size=chunk_size)
+        print(f"{granted}명, 청크 {chunks}개, 쿼리 {counter['count']}회")
+        assert (granted, errors) == (len(users), []), f"지급 결과: {granted}명, {errors}"
+        # 대상/기존 지급 조회 1회 + 청크마다 지급 INSERT, 잔액 UPDATE, 거래 INSERT 각 1회
+        assert counter['count'] == 1 + 3 * chunks, f"청크 {chunks}개 지급 쿼리 수: {counter['count']}회"
+        check_granted()
+
+        # 같은 연도 재실행: 모두 이미 지급으로 보고하고 지급하지 않음
+        granted, errors = service.grant_yearly(request, chunk_size=chunk_size)
+        assert granted == 0 and len(errors) == len(users), f"재실행 결과: {granted}명, 오류 {len(errors)}건"
+        assert all("이미 지급" in e for e in errors), f"재실행 오류: {errors[:3]}"
+        check_granted()
+    finally:
+        restore()
+
+    # 조회 후 다른 요청이 먼저 지급한 경우: 첫 청크 INSERT 가 충돌 → 해당 청크만 개별 지급
+    raced = users[1]
+    original_chunk = service._grant_yearly_chunk
+    original_each = service._grant_yearly_each
+    calls = {"each": 0}
+
+    def chunk_after_race(chunk, data, granted_by):
+        if any(t["user_id"] == raced.id for t in chunk) and not db.query(PointGrant).filter_by(user_id=raced.id, year=year).count():
+            calc = expected[raced.id]
+            db.add(PointGrant(
+                user_id=raced.id, year=year, point_type=PointType.ANNUAL, base_amount=calc["base_amount"],
+                service_year_bonus=calc["service_year_bonus"], daily_calc_amount=calc["daily_calc_amount"],
+                total_amount=calc["total_amount"], grant_date=request.grant_date,
+            ))
+            db.commit()
+        return original_chunk(chunk, data, granted_by)
+
+    def each(chunk, data, granted_by):
+        calls["each"] += 1
+        return original_each(chunk, data, granted_by)
+
+    service._grant_yearly_chunk = chunk_after_race
+    service._grant_yearly_each = each
+    try:
+        granted, errors = service.grant_yearly(request, chunk_size=chunk_size)
+        assert calls["each"] == 1, f"개별 지급 대체 경로 호출: {calls['each']}회"
+        assert granted == len(users) - 1 and len(errors) == 1 and raced.service_number in errors[0], (
+            f"충돌 시 지급 결과: {granted}명, {errors}"
+        )
+        check_granted(skipped=[raced.id])
+    finally:
+        restore()
+    print("✅ 연간 포인트 일괄 지급 기존 방식과 일치, 재실행 시 지급 없음, 충돌 청크 개별 지급")
+
+
+def test_grant_bulk(db):
+    """일괄 포인트 지급: 청크당 UPDATE/INSERT 1회씩, 기존 방식과 같은 잔액/거래 내역, 오류 시 전체 취소"""
+    print("\n=== 일괄 포인트 지급 (grant_bulk) ===")
+    service = PointService(db)
+    amount = 1234
+    request = PointBulkGrantRequest(target="all", amount=amount, reason="bonus", note="성능측정 일괄 지급")
+    balances = {
+        user_id: (current_point, reserved_point)
+        for user_id, current_point, reserved_point, is_active in db.query(
+            User.id, User.current_point, User.reserved_point, User.is_active
+        )
+        if is_active
+    }
+    all_balances = dict(db.query(User.id, User.current_point).all())
+    last_transaction_id = db.query(func.max(PointTransaction.id)).scalar() or 0
+    chunk_size = 3
+    chunks = -(-len(balances) // chunk_size)
+
+    try:
+        with count_queries() as counter:
+            granted, errors, rows_per_second = service.grant_bulk(request, chunk_size=chunk_size)
+        print(f"{granted}명, 청크 {chunks}개, 쿼리 {counter['count']}회, {rows_per_second:,.0f}건/초")
+        assert (granted, errors) == (len(balances), []), f"지급 결과: {granted}명, {errors}"
+        # 대상 수 1회 + 청크마다 UPDATE ... RETURNING 1회, INSERT 1회 + 빈 청크 확인 UPDATE 1회
+        assert counter['count'] == 2 + 2 * chunks, f"청크 {chunks}개 지급 쿼리 수: {counter['count']}회"
+
+        # 기존 방식(사용자별 잔액 증가 + 거래 1건)과 같은 결과, 비활성 사용자는 제외
+        db.expire_all()
+        for user_id, current_point in db.query(User.id, User.current_point):
+            expected = all_balances[user_id] + (amount if user_id in balances else 0)
+            assert current_point == expected, f"사용자 {user_id} 잔액: {current_point} (기대 {expected})"
+        transactions = db.query(PointTransaction).filter(PointTransaction.id > last_transaction_id).all()
+        assert sorted(t.user_id for t in transactions) == sorted(balances), "사용자별 지급 거래가 1건씩이 아님"
+        for t in transactions:
+            current_point, reserved_point = balances[t.user_id]
+            assert (t.transaction_type, t.amount, t.reason, t.description) == (
+                TransactionType.GRANT, amount, "bonus", "성능측정 일괄 지급"
+            ), f"거래 {t.id} 내용 불일치"
+            assert (t.balance_after, t.reserved_after) == (current_point + amount, reserved_point), (
+                f"사용자 {t.user_id} 거래 후 잔액: {(t.balance_after, t.reserved_after)}"
+            )
+    finally:
+        _restore_points(db, balances, last_transaction_id)
+
+    # 두 번째 청크 처리 후 오류 → 이미 처리한 청크까지 모두 취소 (재시도해도 중복 지급 없음)
+    def fail(done, total):
+        if done > chunk_size:
+            raise RuntimeError("측정용 오류")
+
+    try:
+        granted, errors, _ = service.grant_bulk(request, chunk_size=chunk_size, on_progress=fail)
+        assert granted == 0 and len(errors) == 1, f"오류 시 지급 결과: {granted}명, {errors}"
+        db.expire_all()
+        assert dict(db.query(User.id, User.current_point).all()) == all_balances, "오류 후 일부 사용자에게 지급됨"
+        remaining = db.query(func.count(PointTransaction.id)).filter(PointTransaction.id > last_transaction_id).scalar()
+        assert remaining == 0, f"오류 후 남은 지급 거래: {remaining}건"
+    finally:
+        _restore_points(db, balances, last_transaction_id)
+    print("✅ 일괄 포인트 지급 청크당 쿼리 수 일정, 잔액/거래 내역 일치, 오류 시 전체 취소")
+
+
+def test_inventory_list(db):
+    """재고 목록 조회 (관리자 전체/판매 가능 재고): 페이지 크기와 무관하게 쿼리 수 일정"""
+    admin = TokenData(user_id=db.query(User.id).filter(User.role == 'admin').limit(1).scalar(), role='admin')
+    sales_office_id = db.query(SalesOffice.id).limit(1).scalar()
+
+    for label, func in [
+        ("재고 목록 (GET /api/inventory)", lambda page_size: get_inventory(
+            sales_office_id=None, item_id=None, keyword=None, page=1, page_size=page_size, db=db, current_user=admin,
+        )),
+        ("재고 목록 품목명 검색 (GET /api/inventory?keyword=)", lambda page_size: get_inventory(
+            sales_office_id=None, item_id=None, keyword="복", page=1, page_size=page_size, db=db, current_user=admin,
+        )),
+        ("판매 가능 재고 (GET /api/inventory/available)", lambda page_size: get_available_inventory(
+            sales_office_id=sales_office_id, keyword=None, page=1, page_size=page_size, db=db, current_user=admin,
+        )),
+    ]:
+        query_counts = measure(label, func)
+        assert len(set(query_counts.values())) == 1, f"페이지 크기에 따라 쿼리 수가 증가함: {query_counts}"
+    print("✅ 재고 목록 쿼리 수 일정")
+
+
+def test_inventory_summary(db):
+    """재고 요약: 판매소별 요약 포함 집계 1회, 재고 행 직접 계산과 일치"""
+    print("\n=== 재고 요약 (get_inventory_summary) ===")
+    # 재고 부족/품절 행을 임시로 만들어 검증 후 롤백
+    for quantity, inventory in zip([0, 0, 3, 10, 11], db.query(Inventory).order_by(Inventory.id).limit(5)):
+        inventory.quantity = quantity
+    db.flush()
+
+    try:
+        with count_queries() as counter:
+            summary = inventory_service.get_inventory_summary(db, by_office=True)
+        print(f"쿼리 {counter['count']}회: {summary['totalItems']}건, 부족 {summary['lowStock']}, 품절 {summary['outOfStock']}, 판매소 {len(summary['offices'])}곳")
+        assert counter['count'] == 1, f"재고 요약 쿼리 수: {counter['count']}회"
+
+        inventory_list = db.query(Inventory).all()
+        for office in summary['offices'] + [dict(summary, sales_office_id=None)]:
+            rows = [inv for inv in inventory_list if office['sales_office_id'] in (None, inv.sales_office_id)]
+            expected = (len(rows), sum(1 for inv in rows if 0 < inv.quantity <= 10), sum(1 for inv in rows if inv.quantity == 0))
+            actual = (office['totalItems'], office['lowStock'], office['outOfStock'])
+            assert actual == expected, f"판매소 {office['sales_office_id']} 요약 불일치: {actual} != {expected}"
+    finally:
+        db.rollback()
+    print("✅ 재고 요약 집계 일치")
+
+
+def _reference_tree(db, parent_id=None):
+    """카테고리 단위 재귀 조회로 만든 기존 방식의 활성 트리 (비교 기준)"""
+    query = db.query(Category).filter(Category.is_active == True)
+    if parent_id is None:
+        query = query.filter(Category.level == CategoryLevel.LARGE)
+    else:
+        query = query.filter(Category.parent_id == parent_id)
+    return [
+        {"id": c.id, "name": c.name, "children": _reference_tree(db, c.id)}
+        for c in query.order_by(Category.sort_order, Category.id).all()
+    ]
+
+
+def _reference_descendants(db, category_id):
+    ids = [category_id]
+    for (child_id,) in db.query(Category.id).filter(Category.parent_id == category_id).all():
+        ids.extend(_reference_descendants(db, child_id))
+    return ids
+
+
+def _tree_dump(nodes):
+    return [{"id": n.id, "name": n.name, "children": _tree_dump(n.children)} for n in nodes]
+
+
+def test_category_tree(db):
+    """카테고리 트리: 최초 1회 조회, 이후 조회 없음, 변경 후 재구성 결과가 재귀 조회와 일치"""
+    print("\n=== 카테고리 트리 (CategoryService.get_tree) ===")
+    service = CategoryService(db)
+    category_tree.invalidate()
+
+    with count_queries() as first:
+        tree = service.get_tree()
+    with count_queries() as cached:
+        service.get_tree()
+    print(f"최초 쿼리 {first['count']}회, 캐시 적중 쿼리 {cached['count']}회")
+    assert first['count'] == 1, f"카테고리 트리 구성 쿼리 수: {first['count']}회"
+    assert cached['count'] == 0, f"캐시 적중 시 쿼리 실행: {cached['count']}회"
+    assert _tree_dump(tree) == _reference_tree(db), "카테고리 트리가 재귀 조회 결과와 다름"
+
+    snapshot = category_tree.get_snapshot(db)
+    for (category_id,) in db.query(Category.id).all():
+        expected = _reference_descendants(db, category_id)
+        assert sorted(snapshot.descendant_ids(category_id)) == sorted(expected), f"카테고리 {category_id} 하위 ID 불일치"
+
+    parent = db.query(Category).filter(
+        Category.level == CategoryLevel.LARGE, Category.is_active == True
+    ).order_by(Category.id).first()
+    created = service.create(CategoryCreate(name="성능측정 임시", level=CategoryLevel.MEDIUM, parent_id=parent.id, sort_order=999))
+    try:
+        with count_queries() as rebuilt:
+            tree = service.get_tree()
+        assert rebuilt['count'] == 1, f"변경 후 재구성 쿼리 수: {rebuilt['count']}회"
+        assert _tree_dump(tree) == _reference_tree(db), "변경 후 카테고리 트리가 재귀 조회 결과와 다름"
+        assert created.id in category_tree.get_snapshot(db).descendant_ids(parent.id), "새 카테고리가 상위 하위 ID 에 없음"
+    finally:
+        service.delete(created.id)
+    assert _tree_dump(service.get_tree()) == _reference_tree(db), "삭제 후 카테고리 트리가 재귀 조회 결과와 다름"
+    print("✅ 카테고리 트리 스냅샷 일치")
+
+
+def _category_workbook(prefix):
+    """IMPORT_SHAPE 규모의 카테고리 엑셀 파일 (대분류명은 prefix 로 시작)"""
+    from xlwt import Workbook
+
+    wb = Workbook()
+    ws = wb.add_sheet('Sheet1')
+    for col, title in enumerate(['대분류', '중분류', '품목', '피복타입']):
+        ws.write(0, col, title)
+    large_count, medium_count, small_count = IMPORT_SHAPE
+    row = 1
+    for l in range(large_count):
+        for m in range(medium_count):
+            for s in range(small_count):
+                for col, value in enumerate([f"{prefix}{l}", f"중{m}", f"품목{s}", '완제품']):
+                    ws.write(row, col, value)
+                row += 1
+    output = BytesIO()
+    wb.save(output)
+    return output.getvalue(), row - 1
+
+
+def test_category_import(db):
+    """카테고리 엑셀 일괄 등록: 사전 조회 1회 + 단계별 INSERT 3회, dry_run 은 저장 없음, 재등록 시 생성 없음"""
+    print("\n=== 카테고리 엑셀 일괄 등록 (CategoryService.import_from_excel) ===")
+    prefix = "성능측정대분류"
+    content, row_count = _category_workbook(prefix)
+    large_count, medium_count, small_count = IMPORT_SHAPE
+    expected = large_count * (1 + medium_count * (1 + small_count))
+    service = CategoryService(db)
+    category_count = db.query(Category).count()
+
+    try:
+        with count_queries() as dry:
+            preview = service.import_from_excel(BytesIO(content), dry_run=True)
+        assert dry['count'] == 1, f"dry_run 쿼리 수: {dry['count']}회"
+        assert db.query(Category).count() == category_count, "dry_run 인데 카테고리가 저장됨"
+        assert preview['created'] == len(preview['new_categories']) == expected, f"dry_run 생성 예정 수: {preview['created']}"
+
+        # 일괄 INSERT 는 드라이버가 파라미터 한도에 맞춰 나눠 보낼 수 있으므로 실행한 SQL 문 수로 검증
+        with count_statements(db) as statements, count_queries() as real:
+            result = service.import_from_excel(BytesIO(content))
+        print(f"{row_count}행: SQL 문 {len(statements)}개 (전송 {real['count']}회), 생성 {result['created']}건, {result['elapsed_ms']}ms")
+        assert len(statements) == 4, f"일괄 등록 SQL 문 수: {len(statements)}개"
+        assert result['levels'] == preview['levels'], "dry_run 결과와 실제 등록 결과가 다름"
+        assert db.query(Category).count() == category_count + expected, "등록된 카테고리 수 불일치"
+
+        again = service.import_from_excel(BytesIO(content))
+        assert again['created'] == 0 and again['skipped'] == expected, f"재등록 결과: {again['created']}건 생성, {again['skipped']}건 기존"
+    finally:
+        large_ids = select(Category.id).where(Category.name.startswith(prefix), Category.parent_id == None)
+        medium_ids = select(Category.id).where(Category.parent_id.in_(large_ids))
+        db.execute(delete(Category).where(Category.parent_id.in_(medium_ids)))
+        db.execute(delete(Category).where(Category.parent_id.in_(large_ids)))
+        db.execute(delete(Category).where(Category.id.in_(large_ids)))
+        db.commit()
+        category_tree.invalidate()
+    assert db.query(Category).count() == category_count, "임시 카테고리 정리 실패"
+    print("✅ 카테고리 일괄 등록 쿼리 수 일정")
+
+
+def test_streaming_export(db):
+    """CSV 내보내기: 단일 쿼리, 전체 행을 읽기 전에 첫 조각 전송, 조각 크기 일정, 카테고리 CSV 재업로드 시 생성 없음"""
+    print("\n=== CSV 내보내기 (export_service) ===")
+    chunk_size = 1024
+    for label, header, make_rows in [
+        ("카테고리", export_service.CATEGORY_HEADER, export_service.category_rows),
+        ("카탈로그(규격 x 재고)", export_service.catalog_header(True, True), lambda: export_service.catalog_rows(True, True)),
+    ]:
+        consumed = {'count': 0}
+
+        def counted(rows):
+            for row in rows:
+                consumed['count'] += 1
+                yield row
+
+        with count_queries() as counter:
+            chunks = iter_csv(header, counted(make_rows()), chunk_size=chunk_size)
+            first = next(chunks)
+            consumed_at_first = consumed['count']
+            sizes = [len(first)] + [len(chunk) for chunk in chunks]
+        print(f"{label}: {consumed['count']}행, 쿼리 {counter['count']}회, 조각 {len(sizes)}개 (최대 {max(sizes)}B), 첫 조각까지 {consumed_at_first}행")
+        assert counter['count'] == 1, f"{label} 내보내기 쿼리 수: {counter['count']}회"
+        if len(sizes) > 1:
+            assert consumed_at_first < consumed['count'], f"{label} 전체를 읽은 뒤에 전송 시작"
+        # 조각은 문자 수 기준으로 나누므로 UTF-8 한글(3바이트)을 감안한 상한
+        assert max(sizes) < chunk_size * 4, f"{label} 조각 크기가 일정하지 않음: {max(sizes)}B"
+
+    content = b"".join(iter_csv(export_service.CATEGORY_HEADER, export_service.category_rows()))
+    result = CategoryService(db).import_from_excel(BytesIO(content), dry_run=True, filename="cloth_category.csv")
+    assert result['created'] == 0 and not result['errors'], f"카테고리 CSV 재업로드 시 생성 {result['created']}건, 오류 {result['errors']}"
+    print("✅ CSV 내보내기 스트리밍")
+
+
+def test_user_bulk_import(db):
+    """사용자 일괄 등록: 중복 확인 IN 쿼리 2회 + 청크별 INSERT, 중복 행은 행 번호와 사유로 보고"""
+    print("\n=== 사용자 일괄 등록 (UserService.bulk_create) ===")
+    prefix = "perf_bulk_"
+    existing_username = db.query(User.username).order_by(User.id).limit(1).scalar()
+
+    def user(n, **overrides):
+        values = dict(username=f"{prefix}{n}", password="password1!", name=f"일괄{n}", service_number=f"{prefix}{n}")
+        values.update(overrides)
+        return UserCreate(**values)
+
+    users = [user(n, email=f"{prefix}{n}@example.com") for n in range(4)] + [
+        user(4, username=existing_username),
+        user(5, service_number=f"{prefix}0"),
+    ]
+    service = UserService(db)
+    try:
+        with count_queries() as counter:
+            created, errors = service.bulk_create(users, chunk_size=2)
+        print(f"{len(users)}행: 생성 {created}건, 오류 {len(errors)}건, 쿼리 {counter['count']}회")
+        assert created == 4, f"일괄 등록 생성 수: {created}"
+        assert errors == ["행 5: 이미 존재하는 사용자명입니다", "행 6: 이미 등록된 군번입니다"], f"행별 오류: {errors}"
+        assert counter['count'] == 4, f"일괄 등록 쿼리 수: {counter['count']}회 (중복 확인 2 + 청크 INSERT 2 예상)"
+
+        # 사전 확인을 통과했지만 INSERT 가 충돌하는 행(이메일 중복)은 해당 청크만 개별 등록
+        created, errors = service.bulk_create([user(6), user(7, email=f"{prefix}0@example.com")], chunk_size=2)
+        assert created == 1 and errors == ["행 2: 중복되거나 잘못된 값이 있어 등록할 수 없습니다"], f"충돌 청크 처리: {created}, {errors}"
+    finally:
+        db.rollback()
+        db.query(User).filter(User.username.startswith(prefix)).delete(synchronize_session=False)
+        db.commit()
+    print("✅ 사용자 일괄 등록 쿼리 수 일정")
+
+
+def _reference_menus(db, role=None, parent_id=None):
+    """메뉴 단위 재귀 조회로 만든 기존 방식의 메뉴 트리 (role 지정 시 권한 필터, 비교 기준)"""
+    menus = db.query(Menu).filter(Menu.parent_id == parent_id, Menu.is_active == True).order_by(Menu.sort_order, Menu.id).all()
+    result = []
+    for menu in menus:
+        allowed_roles = menu.get_allowed_roles_list()
+        if role and not menu.is_category and allowed_roles and role not in allowed_roles:
+            continue
+        children = _reference_menus(db, role, menu.id)
+        if role and menu.is_category and not children:
+            continue
+        result.append({"id": menu.id, "allowed_roles": allowed_roles, "children": children})
+    return result
+
+
+def _menu_dump(nodes):
+    return [{"id": n.id, "allowed_roles": n.allowed_roles, "children": _menu_dump(n.children)} for n in nodes]
+
+
+def test_menu_tree(db):
+    """메뉴 트리: 역할별 트리 포함 최초 1회 조회, 이후 조회 없음, 변경 후 재구성 결과가 재귀 조회와 일치"""
+    print("\n=== 메뉴 트리 (MenuService.get_tree_by_role) ===")
+    service = MenuService(db)
+    roles = [role.value for role in UserRole]
+    service.initialize_default_menus()  # 메뉴가 없는 DB 면 기본 메뉴 생성
+    menu_tree.invalidate()
+
+    with count_queries() as first:
+        trees = {role: service.get_tree_by_role(role) for role in roles}
+    with count_queries() as cached:
+        for role in roles:
+            service.get_tree_by_role(role)
+        full_tree = service.get_tree()
+    print(f"역할 {len(roles)}종 최초 쿼리 {first['count']}회, 캐시 적중 쿼리 {cached['count']}회")
+    assert first['count'] == 1, f"메뉴 트리 구성 쿼리 수: {first['count']}회"
+    assert cached['count'] == 0, f"캐시 적중 시 쿼리 실행: {cached['count']}회"
+    assert _menu_dump(full_tree) == _reference_menus(db), "전체 메뉴 트리가 재귀 조회 결과와 다름"
+    for role in roles:
+        assert _menu_dump(trees[role]) == _reference_menus(db, role), f"{role} 메뉴 트리가 재귀 조회 결과와 다름"
+
+    # 권한 변경 후 재구성 확인 (원래 권한으로 복구)
+    menu = db.query(Menu).filter(Menu.is_category == False, Menu.parent_id != None, Menu.is_active == True).order_by(Menu.id).first()
+    original_roles = menu.get_allowed_roles_list()
+    service.update(menu.id, MenuUpdate(allowed_roles=[UserRole.TAILOR_COMPANY.value]))
+    try:
+        with count_queries() as rebuilt:
+            tree = service.get_tree_by_role(UserRole.TAILOR_COMPANY.value)
+        assert rebuilt['count'] == 1, f"변경 후 재구성 쿼리 수: {rebuilt['count']}회"
+        for role in roles:
+            assert _menu_dump(service.get_tree_by_role(role)) == _reference_menus(db, role), f"변경 후 {role} 메뉴 트리가 재귀 조회 결과와 다름"
+        assert _menu_dump(tree) != _menu_dump(trees[UserRole.TAILOR_COMPANY.value]), "권한 변경이 메뉴 트리에 반영되지 않음"
+    finally:
+        service.update(menu.id, MenuUpdate(allowed_roles=original_roles))
+    print("✅ 메뉴 트리 스냅샷 일치")
+
+
+def test_principal_cache(db):
+    """인증 주체: 소속은 토큰 클레임 사용, 토큰당 최초 1회 버전 확인, 소속 변경 후 이전 토큰 401"""
+    print("\n=== 인증 주체 캐시 (get_current_user) ===")
+    principal_cache.clear()
+    user = db.query(User).filter(User.role == UserRole.SALES_OFFICE.value, User.sales_office_id != None).first()
+    other_office_id = db.query(SalesOffice.id).filter(SalesOffice.id != user.sales_office_id).limit(1).scalar()
+
+    def credentials_for(target):
+        db.refresh(target)
+        return HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_access_token(token_claims(target)))
+
+    def rejected(credentials):
+        try:
+            get_current_user(credentials, db)
+        except HTTPException as e:
+            return e.status_code
+        return None
+
+    credentials = credentials_for(user)
+    with count_queries() as first:
+        principal = get_current_user(credentials, db)
+    with count_queries() as cached:
+        for _ in range(REPEAT):
+            assert get_current_user(credentials, db) == principal
+            assert get_sales_office_scope(principal) == user.sales_office_id
+    print(f"최초 쿼리 {first['count']}회, 캐시 적중 {REPEAT}회 쿼리 {cached['count']}회")
+    assert first['count'] == 1, f"인증 주체 조회 쿼리 수: {first['count']}회"
+    assert cached['count'] == 0, f"캐시 적중 시 쿼리 실행: {cached['count']}회"
+    assert principal.sales_office_id == user.sales_office_id and principal.tailor_company_id == user.tailor_company_id
+
+    # 버전 클레임이 없는 이전 형식 토큰은 거부
+    legacy = create_access_token({"sub": str(user.id), "username": user.username, "role": user.role.value})
+    assert rejected(HTTPAuthorizationCredentials(scheme="Bearer", credentials=legacy)) == 401, "버전 없는 토큰이 인증됨"
+
+    # 소속 변경 후 이전 토큰은 401, 새 토큰은 새 소속으로 인증
+    service = UserService(db)
+    original_office_id = user.sales_office_id
+    service.update(user.id, UserUpdate(sales_office_id=other_office_id))
+    try:
+        with count_queries() as refreshed:
+            assert rejected(credentials) == 401, "소속 변경 전 발급 토큰이 인증됨"
+        assert refreshed['count'] == 1, f"사용자 변경 후 재확인 쿼리 수: {refreshed['count']}회"
+        assert get_current_user(credentials_for(user), db).sales_office_id == other_office_id, "새 토큰에 변경된 소속이 없음"
+    finally:
+        service.update(user.id, UserUpdate(sales_office_id=original_office_id))
+
+    # 소속 외 정보 변경은 토큰에 영향 없음
+    credentials = credentials_for(user)
+    service.update(user.id, UserUpdate(phone=user.phone))
+    assert get_current_user(credentials, db).sales_office_id == original_office_id
+    print("✅ 인증 주체 캐시 적중 및 토큰 버전 무효화 정상")
+
+
+def test_order_round_trips(db):
+    """온라인 주문 생성/취소: 주문 품목 수와 무관하게 쿼리 수 일정"""
+    print("\n=== 주문 생성/취소 (create_order, cancel_order) ===")
+    print(f"{'lines':>10} {'create':>8} {'cancel':>8}")
+
+    user_id = db.query(User.id).filter(User.role == 'general').order_by(
+        (User.current_point - User.reserved_point).desc()
+    ).limit(1).scalar()
+    rows = (
+        db.query(Inventory.sales_office_id, Inventory.item_id, Inventory.spec_id)
+        .join(ClothingSpec, ClothingSpec.id == Inventory.spec_id)
+        .order_by(Inventory.sales_office_id, ClothingSpec.price)
+        .all()
+    )
+    sales_office_id = rows[0].sales_office_id
+    lines = [r for r in rows if r.sales_office_id == sales_office_id]
+
+    create_counts = {}
+    for line_count in [1, 5, 15]:
+        if line_count > len(lines):
+            break
+        order_data = OrderCreate(
+            sales_office_id=sales_office_id,
+            order_type=OrderType.ONLINE,
+            items=[
+                OrderItemCreate(item_id=r.item_id, spec_id=r.spec_id, quantity=1, payment_method=PaymentMethod.POINT)
+                for r in lines[:line_count]
+            ],
+        )
+        try:
+            with count_queries() as created:
+                order = create_order(db, user_id, order_data)
+        except ValueError as e:
+            db.rollback()
+            print(f"{line_count:>10} 건너뜀: {e}")
+            continue
+        with count_queries() as cancelled:
+            cancel_order(db, order.id, user_id, OrderCancel(reason="성능 측정"))
+        create_counts[line_count] = created['count']
+        print(f"{line_count:>10} {created['count']:>8} {cancelled['count']:>8}")
+
+    assert len(set(create_counts.values())) <= 1, f"주문 품목 수에 따라 쿼리 수가 증가함: {create_counts}"
+    print("✅ 주문 생성 쿼리 수 일정")
+
+
+class _RepeatNumber:
+    """첫 번호만 지정한 (이미 사용된) 번호를 내는 생성기 (번호 충돌 재시도 확인용)"""
+
+    def __init__(self, number, generator):
+        self.number = number
+        self.generator = generator
+
+    def next(self):
+        number, self.number = self.number, None
+        return number or self.generator.next()
+
+
+def test_order_batch(db):
+    """일괄 주문: 주문 수와 무관하게 SQL 문 수 일정, 잔액/재고/롤업 반영, 주문별 실패 사유"""
+    print("\n=== 일괄 주문 (create_orders) ===")
+    print(f"{'orders':>10} {'statements':>10} {'ms':>8}")
+
+    staff_id = db.query(User.id).filter(User.role == 'admin').limit(1).scalar()
+    row = db.query(Inventory.sales_office_id, Inventory.item_id, Inventory.spec_id, ClothingSpec.price).join(
+        ClothingSpec, ClothingSpec.id == Inventory.spec_id
+    ).filter(Inventory.quantity - Inventory.reserved_quantity >= 50).order_by(ClothingSpec.price).first()
+    # 같은 사용자의 주문이 여러 건이어도 잔액은 요청 순서대로 누적 검증
+    users = db.query(User.id).filter(
+        User.role == 'general', User.current_point - User.reserved_point >= row.price * 4
+    ).order_by(User.id).limit(5).all()
+    user_ids = [u.id for u in users]
+
+    # 판매소에 재고 행이 없는 규격 (미취급 품목)
+    unstocked = db.query(ClothingSpec.item_id, ClothingSpec.id).filter(
+        ~select(Inventory.id).where(
+            Inventory.sales_office_id == row.sales_office_id,
+            Inventory.item_id == ClothingSpec.item_id,
+            Inventory.spec_id == ClothingSpec.id,
+        ).exists()
+    ).first()
+
+    def order(user_id, quantity=1, payment_method=PaymentMethod.POINT, item=(row.item_id, row.spec_id)):
+        return BatchOrderCreate(
+            user_id=user_id,
+            sales_office_id=row.sales_office_id,
+            order_type=OrderType.ONLINE,
+            items=[OrderItemCreate(item_id=item[0], spec_id=item[1], quantity=quantity, payment_method=payment_method)],
+        )
+
+    def reserved():
+        return db.query(func.sum(User.reserved_point)).filter(User.id.in_(user_ids)).scalar(), db.query(
+            Inventory.reserved_quantity
+        ).filter(Inventory.sales_office_id == row.sales_office_id, Inventory.item_id == row.item_id, Inventory.spec_id == row.spec_id).scalar()
+
+    created = []
+    try:
+        statement_counts = {}
+        for order_count in [5, 15]:
+            before_points, before_stock = reserved()
+            started = time.perf_counter()
+            with count_statements(db) as statements:
+                results = order_service.create_orders(db, [order(user_ids[i % len(user_ids)]) for i in range(order_count)], staff_id)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            created += [r["order_id"] for r in results if r["success"]]
+            statement_counts[order_count] = len(statements)
+            print(f"{order_count:>10} {len(statements):>10} {elapsed_ms:>8.1f}")
+
+            assert all(r["success"] and r["status"] == OrderStatus.CONFIRMED.value for r in results), f"일괄 주문 결과: {results}"
+            after_points, after_stock = reserved()
+            assert after_points - before_points == row.price * order_count, "예약 포인트 합계 불일치"
+            assert after_stock - before_stock == order_count, "재고 예약 수량 불일치"
+
+        assert len(set(statement_counts.values())) == 1, f"주문 수에 따라 SQL 문 수가 증가함: {statement_counts}"
+
+        # 포인트 거래 내역의 잔액은 사용자별로 이어서 기록
+        last = db.query(PointTransaction).filter(PointTransaction.order_id == created[-1]).one()
+        balance = db.query(User.current_point, User.reserved_point).filter(User.id == last.user_id).one()
+        assert (last.balance_after, last.reserved_after) == tuple(balance), "포인트 거래 내역 잔액 불일치"
+
+        # 없는 사용자, 재고 부족, 미취급 품목 주문은 실패로 보고하고 나머지는 처리 (청크 2건 단위)
+        results = order_service.create_orders(
+            db, [
+                order(user_ids[0]), order(0), order(user_ids[1], 10 ** 6, PaymentMethod.VOUCHER), order(user_ids[2]),
+                order(user_ids[3], payment_method=PaymentMethod.VOUCHER, item=tuple(unstocked)),
+            ], staff_id, chunk_size=2,
+        )
+        created += [r["order_id"] for r in results if r["success"]]
+        assert [r["success"] for r in results] == [True, False, False, True, False], f"부분 실패 결과: {results}"
+        assert results[1]["message"] == "사용자를 찾을 수 없습니다." and results[2]["shortages"], f"실패 사유: {results}"
+        assert [(s["spec_id"], s["available"]) for s in results[4]["shortages"]] == [(unstocked.id, 0)], f"미취급 품목: {results[4]}"
+
+        # 다른 워커와 번호가 겹쳐 유니크 충돌이 나도 새 번호로 한 번 더 저장 (단건/일괄)
+        duplicate = db.query(Order.order_number).filter(Order.id == created[0]).scalar()
+        generator = order_service._order_numbers
+        try:
+            order_service._order_numbers = _RepeatNumber(duplicate, generator)
+            retried = create_order(db, user_ids[0], OrderCreate(**order(user_ids[0]).model_dump(exclude={"user_id"})))
+            created.append(retried.id)
+            assert retried.order_number != duplicate, "충돌한 주문번호로 저장됨"
+            order_service._order_numbers = _RepeatNumber(duplicate, generator)
+            results = order_service.create_orders(db, [order(user_ids[1]), order(user_ids[2])], staff_id)
+            created += [r["order_id"] for r in results if r["success"]]
+            assert all(r["success"] and r["order_number"] != duplicate for r in results), f"번호 충돌 재시도: {results}"
+        finally:
+            order_service._order_numbers = generator
+
+        # 단건 주문도 미취급 품목은 가용 0 으로 재고 부족 (예약 없이 주문 확정되지 않음)
+        single = order(user_ids[3], payment_method=PaymentMethod.VOUCHER, item=tuple(unstocked))
+        try:
+            created.append(create_order(db, user_ids[3], OrderCreate(**single.model_dump(exclude={"user_id"}))).id)
+            raise AssertionError("미취급 품목 주문이 생성됨")
+        except order_service.InsufficientStockError as e:
+            db.rollback()
+            assert [(s["spec_id"], s["available"]) for s in e.shortages] == [(unstocked.id, 0)], f"미취급 품목: {e.shortages}"
+    finally:
+        for order_id in created:
+            user_id = db.query(Order.user_id).filter(Order.id == order_id).scalar()
+            cancel_order(db, order_id, user_id, OrderCancel(reason="일괄 주문 측정"))
+    print("✅ 일괄 주문 SQL 문 수 일정")
+
+
+def test_refund_batch(db):
+    """일괄 반품: 주문 수와 무관하게 쿼리 수 일정, 재고 복구/이력/주문 상태 및 주문별 실패 사유"""
+    print("\n=== 일괄 반품 (process_refunds) ===")
+    print(f"{'orders':>10} {'queries':>8}")
+
+    user_id = db.query(User.id).filter(User.role == 'general').order_by(User.id).limit(1).scalar()
+    staff_id = db.query(User.id).filter(User.role == 'admin').limit(1).scalar()
+    rows = db.query(Inventory.sales_office_id, Inventory.item_id, Inventory.spec_id).filter(
+        Inventory.spec_id != None, Inventory.quantity >= 20
+    ).order_by(Inventory.sales_office_id, Inventory.id).all()
+    sales_office_id = rows[0].sales_office_id
+    lines = [r for r in rows if r.sales_office_id == sales_office_id][:2]
+
+    def quantities():
+        return dict(db.query(Inventory.id, Inventory.quantity).filter(
+            Inventory.sales_office_id == sales_office_id,
+            Inventory.item_id.in_([r.item_id for r in lines]),
+        ).all())
+
+    refund_counts = {}
+    for order_count in [2, 8]:
+        before = quantities()
+        # 체척권 결제 오프라인 판매 (포인트 환불 없이 재고 복구만 비교)
+        orders = [create_offline_sale(db, staff_id, OfflineSaleCreate(
+            user_id=user_id,
+            sales_office_id=sales_office_id,
+            items=[OfflineSaleItem(item_id=r.item_id, spec_id=r.spec_id, quantity=1, unit_price=10000,
+                                   payment_method=PaymentMethod.VOUCHER) for r in lines],
+        )) for _ in range(order_count)]
+        refunds = [
+            RefundCreate(order_id=order.id, items=[RefundItem(order_item_id=item.id, reason="리콜") for item in order.items])
+            for order in orders
+        ]
+        with count_queries() as counter:
+            results = process_refunds(db, staff_id, refunds)
+        refund_counts[order_count] = counter['count']
+        print(f"{order_count:>10} {counter['count']:>8}")
+
+        assert all(r["success"] and r["status"] == OrderStatus.REFUNDED.value for r in results), f"일괄 반품 결과: {results}"
+        assert quantities() == before, "반품 후 재고가 판매 전 수량으로 복구되지 않음"
+        histories = db.query(InventoryHistory.order_id).filter(
+            InventoryHistory.order_id.in_([o.id for o in orders]), InventoryHistory.adjustment_type == AdjustmentType.RETURN,
+        ).all()
+        assert sorted(h.order_id for h in histories) == sorted(o.id for o in orders for _ in lines), "주문별 반품 이력 불일치"
+
+    assert len(set(refund_counts.values())) == 1, f"주문 수에 따라 쿼리 수가 증가함: {refund_counts}"
+
+    # 이미 반품된 주문, 없는 주문은 실패로 보고하고 처리하지 않음
+    results = process_refunds(db, staff_id, [refunds[0], RefundCreate(order_id=0, items=[])])
+    assert [r["message"] for r in results] == ["반품할 수 없는 주문 상태입니다", "주문을 찾을 수 없습니다"], f"실패 사유: {results}"
+
+    # 판매소 범위 지정 시 다른 판매소 주문은 찾을 수 없음으로 보고하고 반품하지 않음
+    order = create_offline_sale(db, staff_id, OfflineSaleCreate(
+        user_id=user_id,
+        sales_office_id=sales_office_id,
+        items=[OfflineSaleItem(item_id=lines[0].item_id, spec_id=lines[0].spec_id, quantity=1, unit_price=10000,
+                               payment_method=PaymentMethod.VOUCHER)],
+    ))
+    refund = RefundCreate(order_id=order.id, items=[RefundItem(order_item_id=item.id, reason="리콜") for item in order.items])
+    results = process_refunds(db, staff_id, [refund], sales_office_id=sales_office_id + 1)
+    assert results[0]["message"] == "주문을 찾을 수 없습니다", f"다른 판매소 반품 결과: {results}"
+    db.refresh(order)
+    assert order.status != OrderStatus.REFUNDED, "다른 판매소 담당자가 주문을 반품함"
+    results = process_refunds(db, staff_id, [refund], sales_office_id=sales_office_id)
+    assert results[0]["success"], f"자기 판매소 반품 결과: {results}"
+    print("✅ 일괄 반품 쿼리 수 일정")
+
+
+def _legacy_order_number():
+    """기존 방식 주문번호 (날짜 + 무작위 8자리, 비교 기준)"""
+    return f"ORD-{datetime.now():%Y%m%d}-{uuid.uuid4().hex[:8].upper()}"
+
+
+def _insert_rate(conn, table, numbers):
+    """번호를 NUMBER_BENCH_BATCH 행씩 유니크 인덱스 테이블에 INSERT 하는 초당 행 수"""
+    started = time.perf_counter()
+    for start in range(0, len(numbers), NUMBER_BENCH_BATCH):
+        conn.execute(insert(table), [{"order_number": n} for n in numbers[start:start + NUMBER_BENCH_BATCH]])
+    return len(numbers) / (time.perf_counter() - started)
+
+
+def test_order_numbers(db):
+    """주문번호: 스레드 간 충돌 없음, 생성 순서 = 문자열 순서, 기존 무작위 번호와 INSERT 처리량 비교"""
+    print("\n=== 주문번호 생성 (NumberGenerator) ===")
+    generator = NumberGenerator("ORD")
+    per_thread = 5000
+    generated = [[] for _ in range(4)]
+
+    def generate(bucket):
+        for _ in range(per_thread):
+            bucket.append(generator.next())
+
+    threads = [threading.Thread(target=generate, args=(bucket,)) for bucket in generated]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    numbers = [n for bucket in generated for n in bucket]
+    assert len(set(numbers)) == len(numbers), f"중복 번호: {len(numbers) - len(set(numbers))}건"
+    assert all(bucket == sorted(bucket) for bucket in generated), "스레드별 생성 순서와 번호 순서가 다름"
+    assert all(len(n) <= Order.order_number.type.length for n in numbers), "주문번호 길이 초과"
+
+    # 유니크 인덱스가 있는 임시 테이블에 같은 수의 번호를 넣어 비교 (측정 후 삭제)
+    table = Table(
+        "bench_order_numbers", MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("order_number", String(30), nullable=False, unique=True),
+    )
+    rates = {}
+    for label, make in [("무작위(기존)", _legacy_order_number), ("시간순", generator.next)]:
+        numbers = [make() for _ in range(NUMBER_BENCH_ROWS)]
+        # 기존 번호는 32bit 무작위라 행이 많으면 중복 발생 → 중복 수 표시 후 제외하고 측정
+        unique_numbers = list(dict.fromkeys(numbers))
+        if len(unique_numbers) < len(numbers):
+            print(f"{label:>8}: 중복 번호 {len(numbers) - len(unique_numbers)}건")
+        numbers = unique_numbers
+        with engine.begin() as conn:
+            table.drop(conn, checkfirst=True)
+            table.create(conn)
+        try:
+            with engine.begin() as conn:
+                rates[label] = _insert_rate(conn, table, numbers)
+        finally:
+            with engine.begin() as conn:
+                table.drop(conn)
+    for label, rate in rates.items():
+        print(f"{label:>8}: INSERT {rate:,.0f}행/초")
+    print(f"처리량 비율 (시간순/무작위): {rates['시간순'] / rates['무작위(기존)']:.2f}")
+    print("✅ 주문번호 충돌 없음, 시간순 정렬")
+
+
+def _live_sales_stats(db, start_date, end_date):
+    """주문 테이블 직접 집계 (롤업 비교 기준)"""
+    ordered_in_range = [
+        Order.ordered_at >= datetime.combine(start_date, dt_time.min),
+        Order.ordered_at < datetime.combine(end_date + timedelta(days=1), dt_time.min),
+    ]
+    active = ordered_in_range + [Order.status != OrderStatus.CANCELLED]
+
+    totals = db.query(
+        func.coalesce(func.sum(Order.total_amount), 0),
+        func.count(Order.id),
+        func.coalesce(func.sum(Order.used_point), 0),
+    ).filter(*active).first()
+    refund_count = db.query(Order).filter(*ordered_in_range, Order.status == OrderStatus.CANCELLED).count()
+    items = db.query(OrderItem.item_id, func.sum(OrderItem.quantity), func.sum(OrderItem.total_price)).join(
+        Order, Order.id == OrderItem.order_id
+    ).filter(*active).group_by(OrderItem.item_id).all()
+    categories = db.query(Category.name, func.sum(OrderItem.total_price)).join(
+        ClothingItem, ClothingItem.category_id == Category.id
+    ).join(OrderItem, OrderItem.item_id == ClothingItem.id).join(
+        Order, Order.id == OrderItem.order_id
+    ).filter(*active).group_by(Category.name).all()
+
+    return {
+        "totals": (totals[0], totals[1], totals[2], refund_count),
+        "items": {r[0]: (r[1], r[2]) for r in items},
+        "categories": dict(categories),
+    }
+
+
+def _rollup_sales_stats(db, start_date, end_date):
+    """롤업 조회 결과를 비교 기준 형식으로 변환"""
+    stats = sales_stats_service.get_sales_stats(db, start_date, end_date)
+    return {
+        "totals": (stats["totalSales"], stats["totalOrders"], stats["totalPoints"], stats["refundCount"]),
+        "items": {p["id"]: (p["quantity"], p["amount"]) for p in stats["topProducts"]},
+        "categories": {c["name"]: c["amount"] for c in stats["categorySales"]},
+    }
+
+
+def _assert_rollup_matches(db, start_date, end_date):
+    live = _live_sales_stats(db, start_date, end_date)
+    rollup = _rollup_sales_stats(db, start_date, end_date)
+    assert rollup["totals"] == live["totals"], f"합계 불일치: 롤업 {rollup['totals']}, 주문 {live['totals']}"
+    assert rollup["categories"] == live["categories"], f"카테고리 불일치: 롤업 {rollup['categories']}, 주문 {live['categories']}"
+    for item_id, values in rollup["items"].items():
+        assert live["items"].get(item_id) == values, f"품목 {item_id} 불일치: 롤업 {values}, 주문 {live['items'].get(item_id)}"
+
+
+def test_sales_stats(db):
+    """판매 통계: 롤업 = 주문 직접 집계, 조회 기간과 무관하게 쿼리 수 일정"""
+    sales_stats_service.rebuild(db)
+    today = date.today()
+    start_date = today - timedelta(days=365)
+    _assert_rollup_matches(db, start_date, today)
+    print("\n✅ 재집계 롤업 = 주문 직접 집계")
+
+    # 증분 갱신: 주문 생성/취소 후에도 일치
+    user_id = db.query(User.id).filter(User.role == 'general').order_by(
+        (User.current_point - User.reserved_point).desc()
+    ).limit(1).scalar()
+    row = db.query(Inventory.sales_office_id, Inventory.item_id, Inventory.spec_id).filter(
+        Inventory.spec_id != None, Inventory.quantity - Inventory.reserved_quantity > 0
+    ).first()
+    order = create_order(db, user_id, OrderCreate(
+        sales_office_id=row.sales_office_id,
+        order_type=OrderType.ONLINE,
+        items=[OrderItemCreate(item_id=row.item_id, spec_id=row.spec_id, quantity=1, payment_method=PaymentMethod.POINT)],
+    ))
+    _assert_rollup_matches(db, start_date, today)
+    cancel_order(db, order.id, user_id, OrderCancel(reason="통계 측정"))
+    _assert_rollup_matches(db, start_date, today)
+    print("✅ 주문 생성/취소 후 롤업 = 주문 직접 집계")
+
+    query_counts = measure(
+        "판매 통계 (get_sales_stats, 조회 기간 일수)",
+        lambda days: sales_stats_service.get_sales_stats(db, today - timedelta(days=days), today),
+        page_sizes=[7, 30, 365],
+    )
+    assert len(set(query_counts.values())) == 1, f"조회 기간에 따라 쿼리 수가 증가함: {query_counts}"
+    print("✅ 판매 통계 쿼리 수 일정")
+
+
+def test_dashboard_cache(db):
+    """대시보드: 캐시 적중 시 쿼리 없음, 주문 생성/취소 후 무효화되어 최신 값 반환"""
+    print("\n=== 대시보드 캐시 (get_dashboard_stats) ===")
+    dashboard_cache.get_backend().clear()
+
+    user_id = db.query(User.id).filter(User.role == 'general').order_by(
+        (User.current_point - User.reserved_point).desc()
+    ).limit(1).scalar()
+    admin = TokenData(user_id=db.query(User.id).filter(User.role == 'admin').limit(1).scalar(), role='admin')
+    user = TokenData(user_id=user_id, role='general')
+
+    for label, token in [("관리자", admin), ("일반 사용자", user)]:
+        with count_queries() as first:
+            get_dashboard_stats(db, token)
+        with count_queries() as cached:
+            get_dashboard_stats(db, token)
+        print(f"{label}: 최초 {first['count']}회, 캐시 적중 {cached['count']}회")
+        assert cached['count'] == 0, f"{label} 대시보드 캐시 적중 시 쿼리 발생: {cached['count']}회"
+
+    before = get_dashboard_stats(db, user)['activeOrders']
+    row = db.query(Inventory.sales_office_id, Inventory.item_id, Inventory.spec_id).filter(
+        Inventory.spec_id != None, Inventory.quantity - Inventory.reserved_quantity > 0
+    ).first()
+    order = create_order(db, user_id, OrderCreate(
+        sales_office_id=row.sales_office_id,
+        order_type=OrderType.ONLINE,
+        items=[OrderItemCreate(item_id=row.item_id, spec_id=row.spec_id, quantity=1, payment_method=PaymentMethod.POINT)],
+    ))
+    assert get_dashboard_stats(db, user)['activeOrders'] == before + 1, "주문 생성 후 대시보드가 갱신되지 않음"
+    cancel_order(db, order.id, user_id, OrderCancel(reason="대시보드 캐시 측정"))
+    assert get_dashboard_stats(db, user)['activeOrders'] == before, "주문 취소 후 대시보드가 갱신되지 않음"
+    print("✅ 대시보드 캐시 적중 및 무효화 정상")
+
+
+def _seed_large_dataset(conn):
+    """실행 계획 확인용 대량 주문/롤업 데이터 추가 (호출 측 트랜잭션 롤백으로 제거)"""
+    user_id = conn.execute(select(User.id).limit(1)).scalar()
+    item_id = conn.execute(select(ClothingItem.id).limit(1)).scalar()
+    office_ids = conn.execute(select(SalesOffice.id)).scalars().all()
+
+    # 기존 데이터와 롤업 키가 겹치지 않도록 과거 기간에 분산
+    first_day = date.today() - timedelta(days=LARGE_DAYS + 60)
+    started = datetime.combine(first_day, dt_time.min)
+    step = timedelta(days=LARGE_DAYS) / LARGE_ORDER_COUNT
+    statuses = [OrderStatus.RECEIVED, OrderStatus.DELIVERED, OrderStatus.CONFIRMED, OrderStatus.CANCELLED]
+
+    order_ids = conn.execute(insert(Order).returning(Order.id), [
+        {
+            "order_number": f"PLAN-{i:08d}",
+            "user_id": user_id,
+            "sales_office_id": office_ids[i % len(office_ids)],
+            "order_type": OrderType.ONLINE,
+            "status": statuses[i % len(statuses)],
+            "total_amount": 50000,
+            "reserved_point": 0,
+            "used_point": 50000,
+            "used_voucher_amount": 0,
+            "ordered_at": started + step * i,
+        }
+        for i in range(LARGE_ORDER_COUNT)
+    ]).scalars().all()
+    conn.execute(insert(OrderItem), [
+        {"order_id": order_id, "item_id": item_id, "quantity": 1, "unit_price": 50000, "total_price": 50000,
+         "payment_method": PaymentMethod.POINT}
+        for order_id in order_ids
+    ])
+
+    days = [first_day + timedelta(days=d) for d in range(LARGE_DAYS)]
+    conn.execute(insert(DailySalesStat), [
+        {"sales_office_id": office_id, "sale_date": day, "order_count": 1, "total_amount": 50000,
+         "used_point": 50000, "refund_count": 0}
+        for office_id in office_ids for day in days
+    ])
+    conn.execute(insert(DailyItemSalesStat), [
+        {"sales_office_id": office_id, "sale_date": day, "item_id": item_id, "quantity": 1, "amount": 50000}
+        for office_id in office_ids for day in days
+    ])
+    conn.exec_driver_sql("ANALYZE")
+
+
+def _full_scans(conn, statement, parameters, tables=PLAN_TABLES):
+    """실행 계획에서 검증 대상 테이블의 전체 스캔 단계 반환"""
+    if conn.dialect.name == "postgresql":
+        plan = [row[0] for row in conn.exec_driver_sql("EXPLAIN " + statement, parameters)]
+        return [line.strip() for line in plan for table in tables if f"Seq Scan on {table} " in line + " "]
+    plan = [row[-1] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)]
+    return [line for line in plan for table in tables if line == f"SCAN {table}" or line.startswith(f"SCAN {table} ")]
+
+
+def _search_user_name(i):
+    """검색 측정용 사용자 이름 (성 + 이름 2글자)"""
+    syllables = len(SEARCH_SYLLABLES)
+    return SEARCH_SURNAMES[i % len(SEARCH_SURNAMES)] + SEARCH_SYLLABLES[i // 10 % syllables] + SEARCH_SYLLABLES[i // 7 % syllables]
+
+
+def _search_user_rows():
+    """검색 측정용 사용자 (군번 9N-NNNNNN)"""
+    for i in range(SEARCH_USER_COUNT):
+        yield {
+            "username": f"search{i:06d}",
+            "password_hash": "-",
+            "name": _search_user_name(i),
+            "role": UserRole.GENERAL,
+            "service_number": f"9{i % 10}-{i:06d}",
+            "current_point": 0,
+            "reserved_point": 0,
+        }
+
+
+def _legacy_user_search(db, keyword, page_size=20):
+    """기존 방식 사용자 검색 (세 컬럼 LIKE '%키워드%' OR, 비교 기준)"""
+    query = db.query(User).filter(or_(
+        User.name.contains(keyword), User.username.contains(keyword), User.service_number.contains(keyword),
+    ))
+    return query.count(), query.order_by(User.created_at.desc()).limit(page_size).all()
+
+
+def _average_ms(func):
+    func()
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        func()
+    return (time.perf_counter() - started) / REPEAT * 1000
+
+
+def test_keyword_search(db):
+    """사용자 키워드 검색: 대량 사용자에서 기존 LIKE 스캔과 같은 결과, 3글자 이상/군번은 인덱스로 검색"""
+    print(f"\n=== 사용자 키워드 검색 ({SEARCH_USER_COUNT:,}명) ===")
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        try:
+            conn.execute(insert(User), list(_search_user_rows()))
+            # 키워드가 군번 앞부분/다른 군번 중간/사용자명 중간에 있는 사용자
+            conn.execute(insert(User), [
+                {"username": username, "password_hash": "-", "name": "검색확인", "role": UserRole.GENERAL,
+                 "service_number": service_number, "current_point": 0, "reserved_point": 0}
+                for username, service_number in [("alpha", "345-0001"), ("beta", "99-13450"), ("u345x", "77-00001")]
+            ])
+            conn.exec_driver_sql("ANALYZE")
+            rows = conn.execute(select(User.name, User.username, User.service_number)).all()
+            session = Session(bind=conn)
+            service = UserService(session)
+
+            keywords = [
+                ("이름 3글자", _search_user_name(12345), False),
+                ("사용자명 일부", "ch01234", False),
+                ("군번", "93-012343", True),
+                ("군번 앞부분", "95-0123", True),
+                ("군번/중간 일치", "345", True),
+                ("군번 중간", "2343", False),
+                ("이름 2글자", SEARCH_SYLLABLES[1:3], False),
+            ]
+            for label, keyword, prefix_first in keywords:
+                # 기존 검색(세 컬럼 부분 일치)과 같은 결과 수
+                expected = sum(1 for r in rows if any(keyword.lower() in v.lower() for v in r))
+                result = service.get_list(keyword=keyword)
+                assert result.total == expected, f"{label} '{keyword}' 검색 결과 수: {result.total} (기대 {expected})"
+                if prefix_first:
+                    assert result.items[0].service_number.startswith(keyword), f"{label} 첫 결과: {result.items[0].service_number}"
+
+                with capture_selects() as statements:
+                    service.get_list(keyword=keyword)
+                scans = [s for statement, parameters in statements for s in _full_scans(conn, statement, parameters, ["users"])]
+                indexed = len(keyword) >= text_search.MIN_TRIGRAM_LENGTH
+                assert not indexed or not scans, f"{label} '{keyword}' 검색이 사용자 전체 스캔: {scans}"
+
+                elapsed = _average_ms(lambda: service.get_list(keyword=keyword))
+                legacy = _average_ms(lambda: _legacy_user_search(session, keyword))
+                plan = "인덱스" if not scans else "전체 스캔"
+                print(f"{label:>8} '{keyword}': {result.total}건, {elapsed:.2f}ms ({plan}) / 기존 LIKE {legacy:.2f}ms")
+            session.close()
+        finally:
+            transaction.rollback()
+    print("✅ 사용자 키워드 검색 결과 일치, 인덱스 사용")
+
+
+def test_stats_query_plans(db):
+    """통계 쿼리 실행 계획: 대량 데이터에서 주문/롤업 테이블을 전체 스캔하지 않음"""
+    print("\n=== 통계 쿼리 실행 계획 (EXPLAIN) ===")
+    today = date.today()
+    start_date = today - timedelta(days=30)
+    sales_office_id = db.query(SalesOffice.id).limit(1).scalar()
+
+    with capture_selects() as statements:
+        get_sales_office_dashboard(db, sales_office_id)
+        sales_stats_service.get_sales_stats(db, start_date, today)
+        sales_stats_service.get_sales_stats(db, start_date, today, sales_office_id)
+        sales_stats_service.rebuild(db, start_date, today)
+        get_sales_orders(
+            status=None, order_type=None, keyword=f"ORD-{today:%Y%m%d}-", page=1, page_size=20, db=db, sales_office_id=None,
+        )
+        get_sales_orders(
+            status=None, order_type=None, keyword="00123", page=1, page_size=20, db=db, sales_office_id=sales_office_id,
+        )
+    statements = [
+        (statement, parameters) for statement, parameters in statements
+        if any(f" {table} " in f" {statement} " or f" {table}." in statement for table in PLAN_TABLES)
+    ]
+
+    failures = []
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        try:
+            _seed_large_dataset(conn)
+            for statement, parameters in statements:
+                scans = _full_scans(conn, statement, parameters)
+                if scans:
+                    failures.append((" ".join(statement.split())[:120], scans))
+        finally:
+            transaction.rollback()
+
+    print(f"검사한 쿼리: {len(statements)}건 (주문 {LARGE_ORDER_COUNT}건, {LARGE_DAYS}일 롤업 기준)")
+    for statement, scans in failures:
+        print(f"  ❌ {scans} <- {statement}")
+    assert not failures, f"전체 테이블 스캔으로 실행되는 통계 쿼리가 있음: {len(failures)}건"
+    print("✅ 통계 쿼리 전체 스캔 없음")
+
+
+def _expected_lookup(rows, keyword, limit):
+    """사용자 자동완성 기대 결과 (활성 사용자의 군번/이름 접두어 일치, 키 순)"""
+    prefix = keyword.casefold()
+    pairs = sorted(
+        (key, row.id) for row in rows if row.is_active
+        for key in (row.service_number.casefold(), row.name.casefold()) if key.startswith(prefix)
+    )
+    return list(dict.fromkeys(user_id for _, user_id in pairs))[:limit]
+
+
+def _lookup_ids(db, keyword, limit=10):
+    return [item["id"] for item in user_lookup.search(db, keyword, limit)]
+
+
+def test_search_table_recovery(db):
+    """검색 보조 테이블: 원본 테이블 재생성으로 트리거가 사라지면 다시 채우고, 보조 테이블이 없으면 부분 일치로 검색"""
+    print("\n=== 검색 보조 테이블 복구 ===")
+    keyword = "보조테이블확인"
+    search = "users_search"
+    triggers = [f"{search}_{suffix}" for suffix in ("ai", "ad", "au")]
+    service = UserService(db)
+    user = User(username="fts_recovery", password_hash="-", name=keyword, role=UserRole.GENERAL, service_number="00-FTS0001")
+    try:
+        # drop_all/create_all 처럼 트리거만 사라진 상태에서 추가된 사용자는 보조 테이블에 없음
+        with engine.begin() as conn:
+            for trigger in triggers:
+                conn.exec_driver_sql(f"DROP TRIGGER {trigger}")
+        db.add(user)
+        db.commit()
+        text_search.ensure_search_indexes()
+        total = service.get_list(keyword=keyword).total
+        assert total == 1, f"트리거 재생성 후 보조 테이블을 다시 채우지 않음: {total}건"
+
+        # 보조 테이블이 없는 DB (init_db 미실행) → 부분 일치로 검색
+        with engine.begin() as conn:
+            for trigger in triggers:
+                conn.exec_driver_sql(f"DROP TRIGGER {trigger}")
+            conn.exec_driver_sql(f"DROP TABLE {search}")
+        text_search._search_ready.clear()
+        total = service.get_list(keyword=keyword).total
+        assert total == 1, f"보조 테이블 없이 검색 결과: {total}건"
+    finally:
+        text_search.ensure_search_indexes()
+        if user.id:
+            db.delete(user)
+            db.commit()
+    assert service.get_list(keyword=keyword).total == 0, "삭제한 사용자가 보조 테이블에 남음"
+    print("✅ 검색 보조 테이블 재구성, 보조 테이블 없을 때 부분 일치 검색")
+
+
+def test_user_lookup(db):
+    """사용자 자동완성: 인덱스 구성 후 쿼리 없음, 생성/수정/삭제는 해당 사용자만 반영, 대량 사용자에서도 1ms 미만"""
+    print("\n=== 사용자 자동완성 (user_lookup) ===")
+    user_lookup.invalidate()
+    rows = db.query(User.id, User.name, User.service_number, User.is_active).all()
+    sample = next(row for row in rows if row.is_active)
+    keywords = [sample.service_number[:2], sample.service_number, sample.name[:1], sample.name]
+    for keyword in keywords:
+        assert _lookup_ids(db, keyword, 50) == _expected_lookup(rows, keyword, 50), f"자동완성 결과 불일치: '{keyword}'"
+
+    service = UserService(db)
+    with count_queries() as counter:
+        for keyword in keywords:
+            _lookup_ids(db, keyword)
+    assert counter['count'] == 0, f"인덱스 적중 시 쿼리 {counter['count']}회"
+
+    # 생성/수정/비활성/삭제는 재구성 없이 해당 사용자 키만 갱신
+    prefix = "perf_lookup_"
+    user = service.create(UserCreate(username=prefix, password="-", name="자동완성가나", service_number="88-777001"), password_hash="-")
+    try:
+        with count_queries() as counter:
+            assert _lookup_ids(db, "88-777") == [user.id], "생성한 사용자 미반영"
+            assert _lookup_ids(db, "자동완성") == [user.id], "생성한 사용자 이름 미반영"
+        assert counter['count'] == 0, f"생성 후 인덱스 재구성 쿼리 {counter['count']}회"
+        service.update(user.id, UserUpdate(name="자동수정다라"))
+        assert _lookup_ids(db, "자동완성") == [] and _lookup_ids(db, "자동수정") == [user.id], "이름 변경 미반영"
+        service.update(user.id, UserUpdate(is_active=False))
+        assert _lookup_ids(db, "88-777") == [], "비활성 사용자가 자동완성에 남음"
+    finally:
+        service.delete(user.id)
+    assert _lookup_ids(db, "88-777") == [], "삭제한 사용자가 자동완성에 남음"
+
+    # 대량 사용자 (트랜잭션 롤백으로 제거)
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        try:
+            conn.execute(insert(User), list(_search_user_rows()))
+            session = Session(bind=conn)
+            user_lookup.invalidate()
+            started = time.perf_counter()
+            user_lookup.get_index(session)
+            built_ms = (time.perf_counter() - started) * 1000
+            rows = session.query(User.id, User.name, User.service_number, User.is_active).all()
+            print(f"{len(rows):,}명 인덱스 구성: {built_ms:.0f}ms")
+
+            for keyword in [SEARCH_SURNAMES[2], _search_user_name(4321)[:2], "93-01", "95-012345"]:
+                assert _lookup_ids(session, keyword) == _expected_lookup(rows, keyword, 10), f"자동완성 결과 불일치: '{keyword}'"
+                started = time.perf_counter()
+                for _ in range(LOOKUP_REPEAT):
+                    user_lookup.search(session, keyword, 10)
+                elapsed = (time.perf_counter() - started) / LOOKUP_REPEAT * 1000
+                print(f"'{keyword}': {elapsed:.3f}ms")
+                assert elapsed < LOOKUP_LIMIT_MS, f"자동완성 응답 {elapsed:.3f}ms (상한 {LOOKUP_LIMIT_MS}ms)"
+            session.close()
+        finally:
+            transaction.rollback()
+            user_lookup.invalidate()
+    print("✅ 사용자 자동완성 인덱스 조회 및 증분 반영 정상")
+
+
+def run_tests():
+    """전체 측정 실행"""
+    db = SessionLocal()
+
+    try:
+        test_grant_history(db)
+        test_history_cursor(db)
+        test_grant_yearly(db)
+        test_grant_bulk(db)
+        test_inventory_list(db)
+        test_inventory_summary(db)
+        test_category_tree(db)
+        test_category_import(db)
+        test_streaming_export(db)
+        test_user_bulk_import(db)
+        test_menu_tree(db)
+        test_principal_cache(db)
+        test_order_round_trips(db)
+        test_order_batch(db)
+        test_refund_batch(db)
+        test_order_numbers(db)
+        test_sales_stats(db)
+        test_dashboard_cache(db)
+        test_stats_query_plans(db)
+        test_keyword_search(db)
+        test_search_table_recovery(db)
+        test_user_lookup(db)
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    run_tests()